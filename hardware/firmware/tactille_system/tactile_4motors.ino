@@ -55,6 +55,18 @@ const int INTENSIDADE_MAX_MED = 240;   // Med-graves = forte
 const int INTENSIDADE_MAX_VOZ = 200;   // Voz = médio
 const int INTENSIDADE_MAX_AGUDOS = 180; // Agudos = mais suave
 
+// === COMANDOS DO COMPUTADOR (MUSTEM_SINKS=serial:<porta>) ===
+// Linha "M,kick,baixo,voz,agudos\n" com PWM 0-255 por motor. Enquanto chegam
+// comandos, eles substituem o microfone; sem comando por HOST_TIMEOUT_MS, o
+// microfone volta a controlar os motores
+const unsigned long HOST_TIMEOUT_MS = 250;
+const int COMANDO_MAX = 32;
+char comando[COMANDO_MAX];
+int comandoLen = 0;
+int intensidadeHost[4] = {0, 0, 0, 0};
+unsigned long ultimoComando = 0;
+bool comandoRecebido = false;
+
 void setup() {
   Serial.begin(115200);
   
@@ -96,7 +108,55 @@ void setup() {
   delay(1000);
 }
 
+// Interpreta "M,k,b,v,t"; retorna false (e ignora a linha) se o formato não confere
+bool interpretarComando(const char* linha) {
+  if(linha[0] != 'M' || linha[1] != ',') return false;
+  int valores[4];
+  const char* p = linha + 2;
+  for(int i = 0; i < 4; i++) {
+    if(*p < '0' || *p > '9') return false;
+    int v = 0;
+    while(*p >= '0' && *p <= '9') {
+      if(v < 1000) v = v * 10 + (*p - '0');  // Sem estouro do int de 16 bits
+      p++;
+    }
+    valores[i] = constrain(v, 0, 255);
+    if(i < 3) {
+      if(*p != ',') return false;
+      p++;
+    }
+  }
+  if(*p != '\0') return false;
+  for(int i = 0; i < 4; i++) intensidadeHost[i] = valores[i];
+  return true;
+}
+
+// Lê o que chegou pela serial sem bloquear; uma linha completa vira comando
+void lerComandos() {
+  while(Serial.available() > 0) {
+    char c = Serial.read();
+    if(c == '\r') continue;
+    if(c == '\n') {
+      comando[comandoLen] = '\0';
+      if(interpretarComando(comando)) {
+        ultimoComando = millis();
+        comandoRecebido = true;
+      }
+      comandoLen = 0;
+    } else if(comandoLen < COMANDO_MAX - 1) {
+      comando[comandoLen++] = c;
+    } else {
+      comandoLen = 0;  // Linha longa demais: descarta
+    }
+  }
+}
+
 void loop() {
+  // === COMANDOS DO COMPUTADOR ===
+  lerComandos();
+  bool modoHost = comandoRecebido && (millis() - ultimoComando) < HOST_TIMEOUT_MS;
+  
+
   // === LEITURA E PRÉ-PROCESSAMENTO ===
   int valorAtual = analogRead(micPin);
   float amplitude = abs(valorAtual - valorBase);
@@ -193,6 +253,14 @@ void loop() {
     intensidadeAgudos = 0;
   }
   
+  // Computador no controle: intensidades vêm da análise do app
+  if(modoHost) {
+    intensidadeKick = intensidadeHost[0];
+    intensidadeBaixo = intensidadeHost[1];
+    intensidadeVoz = intensidadeHost[2];
+    intensidadeAgudos = intensidadeHost[3];
+  }
+  
   // === ACIONAMENTO DOS MOTORES ===
   analogWrite(motorKickPin, intensidadeKick);
   analogWrite(motorBaixoPin, intensidadeBaixo);
@@ -212,6 +280,7 @@ void loop() {
     bool sistemaAtivo = (intensidadeKick + intensidadeBaixo + intensidadeVoz + intensidadeAgudos) > 0;
     
     Serial.print(sistemaAtivo ? "🎵 MÚSICA ATIVA " : "⏸  SILÊNCIO    ");
+    Serial.print(modoHost ? "[PC]  " : "[MIC] ");
     
     // Valores dos motores
     Serial.print("SUB:");
@@ -283,6 +352,11 @@ RESULTADO ESPERADO:
 - Balada: Voz proeminente com acompanhamento suave
 - Rock: Med-graves (bateria) + voz (guitarra) intensos
 
+CONTROLE PELO COMPUTADOR:
+- O app envia "M,kick,baixo,voz,agudos" (PWM 0-255) a cada quadro de análise
+  (MUSTEM_SINKS=serial:/dev/ttyUSB0, 115200 baud)
+- Sem comandos por 250 ms, o microfone volta a controlar os motores
+
 AJUSTES POSSÍVEIS:
 - THRESHOLD_*: Sensibilidade de cada faixa
 - INTENSIDADE_MAX_*: Força máxima de cada motor
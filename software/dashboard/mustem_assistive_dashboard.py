@@ -9,16 +9,63 @@ import numpy as np
 import math
 import time
 import sys
+import os
 import wave
 from collections import deque
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from mustem_core.analysis_paths import TactilePath, LatencyMeter, VISUAL_LATENCY_BUDGET_MS
+from mustem_core.particles import ParticleEngine
+from mustem_core.compositor import Compositor, Layer, STATIC, SLOW, TRAIL
+from mustem_core.surfaces import SurfacePool, points_bounds, coords_bounds
+from mustem_core.text_cache import TextCache
+from mustem_core.geometry import draw_segments
+from mustem_core import colors as palette
+from mustem_core import draw
+from mustem_core.quality import QualityGovernor
+from mustem_core.clock import animation_clock
+from mustem_core.rng import random_streams
+from mustem_core.render_scale import render_settings, ScaledSurface, surface_factor, layout_rect
+from mustem_core.splat import splat, splat_settings, splat_enabled
+from mustem_core.sprites import SpriteCache, render_glow
+from mustem_core.trails import trail_settings, trail_enabled, retention, fresh_count
+from mustem_core.scroll import ScrollStrip, RingTexture
+from mustem_core.shapes import place, to_points, unit_polygon
+from mustem_core.timestep import (FixedTimestep, SIMULATION_HZ, SIMULATION_STEP, decay, ema, frame_rate,
+                                   interpolated)
+from mustem_core.runtime import Runtime, sink_settings, tactile_message
+from mustem_core.analysis_worker import AnalysisWorker, analysis_mode, feature_bus_name, subscribe
+from mustem_core.feature_schema import unpack_dashboard
+
 # Configurações otimizadas
 SCREEN_WIDTH = 1400
 SCREEN_HEIGHT = 800
-FPS = 60
+FPS = frame_rate(60)  # MUSTEM_FPS: a simulação roda em passos fixos, o visual não muda com a taxa
 CHUNK_SIZE = 1024
 SAMPLE_RATE = 44100
 
+# Painel de características (canto inferior direito)
+GENRE_PANEL_X = 1100
+GENRE_PANEL_Y = 570
+GENRE_KEYS = ['percussive', 'melodic', 'harmonic', 'rhythmic']
+GENRE_LABELS = ['Percussive', 'Melodic', 'Harmonic', 'Rhythmic']
+
+SCREEN_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+# Espectrograma: faixa dinâmica abaixo da referência e níveis do mapa de cores
+SPECTROGRAM_DB_RANGE = 60.0
+SPECTROGRAM_LEVELS = 64
+SPECTROGRAM_REFERENCE_TAU = 3.33  # Constante de tempo (s) da queda da referência (pico recente) em trechos calmos
+
+# Superfícies translúcidas reaproveitadas entre quadros pelos painéis
+overlay_pool = SurfacePool()
+
+# Textos renderizados (constantes uma vez, valores dinâmicos em LRU)
+text_cache = TextCache()
+
+# Brilhos pré-renderizados (pontos do espectro circular)
+sprite_cache = SpriteCache()
+
 class TherapeuticColors:
     """Sistema de cores cientificamente otimizado baseado na tabela de frequências musicais"""
     
@@ -55,26 +102,19 @@ class TherapeuticColors:
     
     @staticmethod
     def blend_colors(color1, color2, ratio):
-        r1, g1, b1 = color1
-        r2, g2, b2 = color2
-        return (
-            int(r1 * (1 - ratio) + r2 * ratio),
-            int(g1 * (1 - ratio) + g2 * ratio),
-            int(b1 * (1 - ratio) + b2 * ratio)
-        )
+        return palette.blend(color1, color2, ratio)
     
     @staticmethod
     def with_alpha(color, alpha):
-        r, g, b = color[:3]
-        return (
-            max(0, min(255, int(r * alpha))),
-            max(0, min(255, int(g * alpha))),
-            max(0, min(255, int(b * alpha)))
-        )
+        return palette.scale(color, alpha)
 
 # Constante Dourada (para Phyllotaxis)
 GOLDEN_ANGLE = 2.39996323  # 137.5° em radianos
 
+# Constantes de tempo (s) dos rastros no buffer persistente
+PHYLLOTAXIS_TRAIL_TAU = 1.5  # Pontos vivem 2.5s (cauda mais curta que a vida, para não acumular)
+DNA_SPIRAL_TRAIL_TAU = 1.5   # Mesma área do fade linear de 3s da espiral de DNA
+
 class PhyllotaxisVisualizer:
     """Visualizador de espiral baseada na proporção áurea (Phyllotaxis) - A MANDALA!"""
     
@@ -85,8 +125,14 @@ class PhyllotaxisVisualizer:
         self.rotation_speed = 0.0
         self.point_count = 0
         self.max_points = 300
-        self.points = []
-        self.last_clear_time = time.time()
+        # 6 pontos/passo com 2.5s de vida: ~900 pontos vivos (passos fixos de 1/60 s)
+        self.points = ParticleEngine(1000, fields=['angle'], evict_oldest=True)
+        self.last_clear_time = animation_clock.now()
+        self.splat = False  # Pontos somados direto nos pixels (rasterizador de splatting)
+        self.trails = False  # Só os pontos novos, num buffer persistente que esmaece
+        self.trail_mark = 0
+        self.trail_dt = 1.0 / FPS  # Duração do quadro (o rastro esmaece por quadro desenhado)
+        self.trail_rect = pygame.Rect(center_x - 190, center_y - 190, 380, 380)
     
     def update(self, spectrum, identity, beat_detected, dt):
         """Atualiza a espiral baseada no espectro de frequências"""
@@ -101,10 +147,10 @@ class PhyllotaxisVisualizer:
         # Frequência dominante (banda com mais energia)
         dominant_band = np.argmax(spectrum)
         
-        # Velocidade de rotação baseada na energia e frequência
+        # Velocidade de rotação (rad/s) baseada na energia e frequência
         energy_factor = np.clip(total_energy * 2, 0.1, 2.0)
-        self.rotation_speed = 0.02 + energy_factor * 0.03
-        self.phase += self.rotation_speed
+        self.rotation_speed = (0.02 + energy_factor * 0.03) * SIMULATION_HZ
+        self.phase += self.rotation_speed * dt
         
         # Raio modulado pela energia RMS
         base_radius = 80.0
@@ -123,72 +169,121 @@ class PhyllotaxisVisualizer:
         base_color = TherapeuticColors.frequency_to_color(dominant_band, 0.9)
         
         # Desenhar pontos da espiral (Phyllotaxis)
-        points_per_frame = 6
+        points_per_step = 6
         
-        for i in range(points_per_frame):
-            angle = self.point_count * GOLDEN_ANGLE + self.phase
-            dist = np.sqrt(self.point_count) * 4.0  # Espiral para fora
-            
-            if dist > radius:
+        counts = np.zeros(points_per_step)
+        for i in range(points_per_step):
+            if np.sqrt(self.point_count) * 4.0 > radius:
                 self.point_count = 0  # Reset
-                dist = 0
-            
-            x = self.center_x + dist * np.cos(angle)
-            y = self.center_y + dist * np.sin(angle)
-            
-            # Fade baseado na distância do centro
-            fade_factor = 1.0 - (dist / radius)
-            fade_factor = np.clip(fade_factor, 0.2, 1.0)
-            
-            # Misturar cores baseado no espectro
-            if len(spectrum) > 3:
-                # Usar múltiplas bandas para criar variação de cor
-                secondary_band = (dominant_band + 2) % len(spectrum)
-                secondary_color = TherapeuticColors.frequency_to_color(secondary_band, 0.7)
-                # Interpolar entre cores
-                color_mix = 0.3 + 0.4 * np.sin(self.point_count * 0.1)
-                point_color = TherapeuticColors.blend_colors(base_color, secondary_color, color_mix)
-            else:
-                point_color = base_color
-            
-            point_color = TherapeuticColors.with_alpha(point_color, fade_factor)
-            point_size = 1 + rms * 4
-            
-            self.points.append({
-                'x': x, 'y': y,
-                'color': point_color,
-                'size': point_size,
-                'life': 2.5,
-                'angle': angle
-            })
-            
+            counts[i] = self.point_count
             self.point_count += 1
         
+        angles = counts * GOLDEN_ANGLE + self.phase
+        dists = np.sqrt(counts) * 4.0  # Espiral para fora
+        xs = self.center_x + dists * np.cos(angles)
+        ys = self.center_y + dists * np.sin(angles)
+        
+        # Fade baseado na distância do centro
+        fade_factors = np.clip(1.0 - (dists / radius), 0.2, 1.0)
+        
+        # Misturar cores baseado no espectro
+        base = np.array(base_color, dtype=float)
+        if len(spectrum) > 3:
+            # Usar múltiplas bandas para criar variação de cor
+            secondary_band = (dominant_band + 2) % len(spectrum)
+            secondary = np.array(TherapeuticColors.frequency_to_color(secondary_band, 0.7), dtype=float)
+            # Interpolar entre cores
+            color_mix = (0.3 + 0.4 * np.sin(counts * 0.1))[:, None]
+            colors = (base * (1 - color_mix) + secondary * color_mix).astype(int)
+        else:
+            colors = np.tile(base, (points_per_step, 1))
+        
+        colors = np.clip((colors * fade_factors[:, None]).astype(int), 0, 255)
+        point_size = 1 + rms * 4
+        
+        self.points.spawn(points_per_step, x=xs, y=ys, color=colors, size=point_size,
+                          life=2.5, angle=angles)
+        
         # Atualizar pontos existentes
-        for point in self.points[:]:
-            point['life'] -= dt
-            if point['life'] <= 0:
-                self.points.remove(point)
+        self.points['life'] -= dt
+        self.points.kill(self.points['life'] <= 0)
         
         # Limpar periodicamente
-        if time.time() - self.last_clear_time > 6.0:
-            self.points = []
+        if animation_clock.now() - self.last_clear_time > 6.0:
+            self.points.clear()
             self.point_count = 0
-            self.last_clear_time = time.time()
+            self.last_clear_time = animation_clock.now()
     
     def draw(self, screen):
         """Desenha os pontos da espiral"""
-        for i, point in enumerate(self.points):
-            size = max(1, int(point['size']))
-            pygame.draw.circle(screen, point['color'], (int(point['x']), int(point['y'])), size)
+        if self.splat:
+            self.draw_splat(screen)
+            return
+        
+        xs = self.points['x'].astype(int).tolist()
+        ys = self.points['y'].astype(int).tolist()
+        sizes = np.maximum(1, self.points['size'].astype(int)).tolist()
+        colors = self.points['color'].astype(int)
+        fade_colors = np.clip((colors * 0.2).astype(int), 0, 255)
+        colors = colors.tolist()
+        
+        for i in range(len(xs)):
+            draw.circle(screen, colors[i], (xs[i], ys[i]), sizes[i])
             
             # Conectar alguns pontos para criar efeito de teia/mandala
             if i > 0 and i % 7 == 0:
-                prev = self.points[i-1]
-                fade_color = TherapeuticColors.with_alpha(point['color'], 0.2)
-                pygame.draw.line(screen, fade_color, 
-                               (int(prev['x']), int(prev['y'])),
-                               (int(point['x']), int(point['y'])), 1)
+                draw.line(screen, fade_colors[i].tolist(),
+                               (xs[i-1], ys[i-1]),
+                               (xs[i], ys[i]), 1)
+    
+    def draw_splat(self, screen):
+        """Pontos por splatting aditivo e teia em lote"""
+        points = self.points
+        if len(points) == 0:
+            return
+        colors = points['color'].astype(int)
+        splat(screen, points['x'], points['y'], colors, np.maximum(1, points['size'].astype(int)))
+        
+        # Teia: cada 7º ponto ligado ao anterior
+        web = np.arange(7, len(points), 7)
+        if len(web) > 0:
+            xy = np.stack((points['x'], points['y']), axis=1)
+            draw_segments(screen, xy[web - 1], xy[web], np.clip((colors[web] * 0.2).astype(int), 0, 255))
+    
+    def draw_trail(self, surface):
+        """Buffer persistente: só os pontos criados desde o último quadro e seus fios da teia"""
+        points = self.points
+        new = fresh_count(points, self.trail_mark)
+        self.trail_mark = points.spawned
+        if new == 0:
+            return
+        first = len(points) - new
+        xs, ys = points['x'][first:], points['y'][first:]
+        colors = points['color'][first:].astype(int)
+        sizes = np.maximum(1, points['size'][first:].astype(int))
+        if self.splat:
+            splat(surface, xs, ys, colors, sizes)
+        else:
+            xy, colors_list, sizes = np.stack((xs, ys), axis=1).astype(int).tolist(), colors.tolist(), sizes.tolist()
+            for i in range(new):
+                draw.circle(surface, colors_list[i], xy[i], sizes[i])
+        
+        # Teia: cada 7º ponto (na ordem de criação) ligado ao anterior
+        serial = points.spawned - new + np.arange(new)
+        web = first + np.flatnonzero((serial % 7 == 0) & (first + np.arange(new) > 0))
+        if len(web) > 0:
+            xy = np.stack((points['x'], points['y']), axis=1)
+            draw_segments(surface, xy[web - 1], xy[web], np.clip((points['color'][web] * 0.2).astype(int), 0, 255))
+    
+    def trail_retention(self):
+        return retention(self.trail_dt, PHYLLOTAXIS_TRAIL_TAU)
+    
+    def damage(self):
+        """Caixa dos pontos vivos (a espiral gira enquanto houver pontos)"""
+        if len(self.points) == 0:
+            return None, ()
+        pad = int(self.points['size'].max()) + 1
+        return coords_bounds(self.points['x'], self.points['y'], pad, SCREEN_RECT), None
 
 class MusicalIdentityExtractor:
     """Extrai características musicais únicas para criar identidade visual"""
@@ -210,8 +305,8 @@ class MusicalIdentityExtractor:
             'rhythmic': 0.0
         }
     
-    def analyze(self, spectrum, beat_detected, onset_strength):
-        """Analisa e acumula características musicais"""
+    def analyze(self, spectrum, beat_detected, onset_strength, timestamp=None, dt=SIMULATION_STEP):
+        """Analisa e acumula características musicais (médias com constante de tempo, dt desde a análise anterior)"""
         if len(spectrum) == 0:
             return
         
@@ -223,19 +318,21 @@ class MusicalIdentityExtractor:
         energy = np.sum(spectrum ** 2)
         self.energy_history.append(energy)
         
+        keep = decay(dt, 0.825)
         for i in range(12):
             start = int(i * len(spectrum) / 12)
             end = int((i + 1) * len(spectrum) / 12)
             band_energy = np.mean(spectrum[start:end])
-            self.spectral_signature[i] = self.spectral_signature[i] * 0.98 + band_energy * 0.02
+            self.spectral_signature[i] = self.spectral_signature[i] * keep + band_energy * (1 - keep)
         
+        keep = decay(dt, 0.325)
         for i in range(7):
             start = int(i * len(spectrum) / 7)
             end = int((i + 1) * len(spectrum) / 7)
-            self.harmonic_profile[i] = self.harmonic_profile[i] * 0.95 + np.mean(spectrum[start:end]) * 0.05
+            self.harmonic_profile[i] = self.harmonic_profile[i] * keep + np.mean(spectrum[start:end]) * (1 - keep)
         
         if beat_detected:
-            self.tempo_history.append(time.time())
+            self.tempo_history.append(time.time() if timestamp is None else timestamp)
         
         # PERCUSSIVE: Detecta bateria através de múltiplos indicadores
         if len(self.energy_history) > 10:
@@ -265,14 +362,14 @@ class MusicalIdentityExtractor:
             )
             
             # Suavização MUITO mais rápida para responder à bateria
-            self.genre_indicators['percussive'] = self.genre_indicators['percussive'] * 0.85 + percussive_signal * 0.15
-            self.genre_indicators['melodic'] = self.genre_indicators['melodic'] * 0.99 + (1 - variance) * 0.01
+            self.genre_indicators['percussive'] = ema(self.genre_indicators['percussive'], percussive_signal, dt, 0.103)
+            self.genre_indicators['melodic'] = ema(self.genre_indicators['melodic'], 1 - variance, dt, 1.66)
         
         if np.max(spectrum) > 0:
             harmonic_richness = np.std(spectrum) / (np.mean(spectrum) + 1e-10)
-            self.genre_indicators['harmonic'] = self.genre_indicators['harmonic'] * 0.98 + harmonic_richness * 0.02
+            self.genre_indicators['harmonic'] = ema(self.genre_indicators['harmonic'], harmonic_richness, dt, 0.825)
         
-        self.genre_indicators['rhythmic'] = self.genre_indicators['rhythmic'] * 0.97 + onset_strength * 0.03
+        self.genre_indicators['rhythmic'] = ema(self.genre_indicators['rhythmic'], onset_strength, dt, 0.547)
         
         if len(self.tempo_history) > 3:
             recent_beats = list(self.tempo_history)[-4:]
@@ -282,10 +379,10 @@ class MusicalIdentityExtractor:
                 if avg_interval > 0:
                     bpm = 60.0 / avg_interval
                     if 40 < bpm < 200:
-                        self.avg_tempo = self.avg_tempo * 0.9 + bpm * 0.1
+                        self.avg_tempo = ema(self.avg_tempo, bpm, dt, 0.158)
         
         if len(self.energy_history) > 0:
-            self.avg_energy = self.avg_energy * 0.98 + np.mean(list(self.energy_history)[-20:]) * 0.02
+            self.avg_energy = ema(self.avg_energy, np.mean(list(self.energy_history)[-20:]), dt, 0.825)
     
     def get_visual_identity(self):
         return {
@@ -300,24 +397,33 @@ class MusicalIdentityExtractor:
 class EnhancedAudioAnalyzer:
     """Analisador avançado com múltiplas características musicais"""
     
-    def __init__(self, audio_file):
+    def __init__(self, audio_file, playback=True):
+        self.playback = playback  # False = análise offline, sem mixer
+        self.media_time = None
         self.load_audio(audio_file)
         self.chunk_size = CHUNK_SIZE
         self.audio_start_time = None
         
         self.num_bands = 8  # 8 bandas (Sub-bass+Bass mesclados)
+        self.freqs = np.fft.rfftfreq(self.chunk_size, 1.0/self.sample_rate)  # Frequência de cada bin da FFT
         self.spectrum = np.zeros(self.num_bands)
         self.smooth_spectrum = np.zeros(self.num_bands)
+        self.last_analysis_time = None
         
         self.beat_history = deque(maxlen=50)
-        self.onset_envelope = deque(maxlen=20)
-        self.last_beat_time = 0
+        
+        # Dois caminhos sobre o mesmo buffer: tátil (hop curto) e visual (janela longa)
+        self.tactile_path = TactilePath(self.sample_rate)
+        self.visual_latency = LatencyMeter('visual', VISUAL_LATENCY_BUDGET_MS,
+                                           (self.chunk_size / 2) / self.sample_rate * 1000.0)
+        self.tactile_state = None
         
         self.identity_extractor = MusicalIdentityExtractor()
         self.current_features = {}
         
-        pygame.mixer.pre_init(frequency=SAMPLE_RATE, size=-16, channels=1, buffer=512)
-        pygame.mixer.init()
+        if self.playback:
+            pygame.mixer.pre_init(frequency=SAMPLE_RATE, size=-16, channels=1, buffer=512)
+            pygame.mixer.init()
     
     def load_audio(self, filename):
         with wave.open(filename, 'rb') as wav:
@@ -337,7 +443,9 @@ class EnhancedAudioAnalyzer:
             if np.max(np.abs(self.audio_data)) > 0:
                 self.audio_data /= np.max(np.abs(self.audio_data))
         
-        pygame.mixer.music.load(filename)
+        self.duration = len(self.audio_data) / self.sample_rate
+        if self.playback:
+            pygame.mixer.music.load(filename)
     
     def start_playback(self):
         try:
@@ -347,10 +455,16 @@ class EnhancedAudioAnalyzer:
             print(f"Erro ao iniciar áudio: {e}")
     
     def get_current_time(self):
+        if self.media_time is not None:
+            return self.media_time
         if self.audio_start_time is None:
             return 0
         return time.time() - self.audio_start_time
     
+    def set_media_time(self, seconds):
+        """Posiciona a análise num instante do áudio (modo offline)"""
+        self.media_time = seconds
+    
     def get_current_chunk(self):
         current_time = self.get_current_time()
         sample_pos = int(current_time * self.sample_rate)
@@ -361,36 +475,41 @@ class EnhancedAudioAnalyzer:
         chunk = self.audio_data[sample_pos:sample_pos + self.chunk_size]
         return chunk * np.hanning(len(chunk))
     
-    def detect_beat(self, chunk):
-        energy = np.sum(chunk ** 2)
-        self.onset_envelope.append(energy)
-        
-        if len(self.onset_envelope) < 10:
-            return False, 0.0
-        
-        recent = list(self.onset_envelope)
-        avg_energy = np.mean(recent[:-1])
-        current_energy = recent[-1]
-        
-        threshold = avg_energy * 1.5
-        onset_strength = max(0, (current_energy - avg_energy) / (avg_energy + 1e-10))
-        
-        current_time = time.time()
-        if current_energy > threshold and (current_time - self.last_beat_time) > 0.2:
-            self.last_beat_time = current_time
-            return True, onset_strength
-        
-        return False, onset_strength
+    def analysis_dt(self):
+        """Tempo de mídia desde a análise anterior (peso das médias exponenciais)"""
+        now = self.get_current_time()
+        last, self.last_analysis_time = self.last_analysis_time, now
+        if last is None:
+            return SIMULATION_STEP
+        return min(max(0.0, now - last), 0.25)
+    
+    def get_playhead(self):
+        return int(self.get_current_time() * self.sample_rate)
+    
+    def run_tactile_path(self):
+        """Caminho rápido: motores e batidas a cada hop curto"""
+        self.tactile_state = self.tactile_path.process(self.audio_data, self.get_playhead())
+        events = self.tactile_state['beat_events']
+        self.beat_history.extend(event['time'] for event in events)
+        return len(events) > 0, self.tactile_state['onset_strength']
+    
+    def get_latency_stats(self):
+        return {'tactile': self.tactile_path.latency.stats(), 'visual': self.visual_latency.stats()}
     
     def analyze(self):
+        beat_detected, onset_strength = self.run_tactile_path()
+        dt = self.analysis_dt()
+        
+        self.visual_latency.start()
         chunk = self.get_current_chunk()
         
         if len(chunk) == 0 or np.max(np.abs(chunk)) < 1e-6:
+            self.visual_latency.stop()
             return self.get_silent_state()
         
         fft = np.fft.rfft(chunk)
         magnitude = np.abs(fft)
-        freqs = np.fft.rfftfreq(len(chunk), 1.0/self.sample_rate)
+        freqs = self.freqs
         
         # Bandas de frequência baseadas na tabela científica
         # MESCLADO: Sub-bass + Bass (low) em uma banda única mais larga!
@@ -414,6 +533,8 @@ class EnhancedAudioAnalyzer:
                 band_energy = np.sqrt(np.mean(magnitude[idx_low:idx_high] ** 2))
                 new_spectrum[i] = band_energy
         
+        band_energy = new_spectrum.copy()
+        
         # Aplicar boost progressivo - MAIOR BOOST PARA GRAVES!
         # Primeira banda (20-80Hz mesclada) recebe boost MÁXIMO
         freq_boost = np.array([3.0, 2.2, 1.9, 1.7, 1.5, 1.7, 2.0, 2.8])
@@ -430,14 +551,13 @@ class EnhancedAudioAnalyzer:
         
         # Suavização adaptativa - MENOS suavização nos graves para resposta mais rápida!
         # Primeira banda (Sub-bass+Bass mesclados) precisa responder MUITO rápido aos kicks
-        alpha = np.array([0.50, 0.40, 0.35, 0.32, 0.35, 0.42, 0.50, 0.60])
-        self.spectrum = self.spectrum * (1 - alpha) + new_spectrum * alpha
+        # Constantes de tempo (s); a 60 FPS equivalem aos pesos 0.50, 0.40, 0.35, 0.32, 0.35, 0.42, 0.50, 0.60
+        time_constants = np.array([0.0240, 0.0326, 0.0387, 0.0432, 0.0387, 0.0306, 0.0240, 0.0182])
+        self.spectrum = ema(self.spectrum, new_spectrum, dt, time_constants)
         
-        smooth_alpha = 0.5
-        self.smooth_spectrum = self.smooth_spectrum * (1 - smooth_alpha) + self.spectrum * smooth_alpha
+        self.smooth_spectrum = ema(self.smooth_spectrum, self.spectrum, dt, 0.024)
         
-        beat_detected, onset_strength = self.detect_beat(chunk)
-        self.identity_extractor.analyze(self.spectrum, beat_detected, onset_strength)
+        self.identity_extractor.analyze(self.spectrum, beat_detected, onset_strength, self.get_current_time(), dt)
         
         total_energy = np.sum(self.spectrum)
         spectral_flux = np.sum(np.abs(np.diff(self.spectrum)))
@@ -445,28 +565,53 @@ class EnhancedAudioAnalyzer:
         self.current_features = {
             'spectrum': self.smooth_spectrum.copy(),
             'raw_spectrum': self.spectrum.copy(),
+            'band_energy': band_energy,
+            'magnitude': magnitude,  # Resolução completa (espectrograma)
             'beat_detected': beat_detected,
             'onset_strength': onset_strength,
             'total_energy': total_energy,
             'spectral_flux': spectral_flux,
             'time': self.get_current_time(),
-            'identity': self.identity_extractor.get_visual_identity()
+            'identity': self.identity_extractor.get_visual_identity(),
+            'tactile': self.tactile_state
         }
         
+        self.visual_latency.stop()
+        self.current_features['latency'] = self.get_latency_stats()
         return self.current_features
     
     def get_silent_state(self):
         return {
             'spectrum': np.zeros(self.num_bands),
             'raw_spectrum': np.zeros(self.num_bands),
+            'magnitude': np.zeros(len(self.freqs)),
             'beat_detected': False,
             'onset_strength': 0.0,
             'total_energy': 0.0,
             'spectral_flux': 0.0,
             'time': self.get_current_time(),
-            'identity': self.identity_extractor.get_visual_identity()
+            'identity': self.identity_extractor.get_visual_identity(),
+            'tactile': self.tactile_state,
+            'latency': self.get_latency_stats()
         }
 
+def draw_translucent_polygon(screen, color, points, clip=None):
+    """Polígono com alpha numa superfície do pool do tamanho da sua caixa delimitadora"""
+    bounds = points_bounds(points, clip=clip or layout_rect(screen))
+    if bounds.width == 0 or bounds.height == 0:
+        return
+    
+    # Sobreposição já na resolução do destino: sem redução a cada quadro na tela interna
+    f = surface_factor(screen)
+    size = (max(1, int(round(bounds.width * f))), max(1, int(round(bounds.height * f))))
+    overlay = overlay_pool.acquire(size)
+    pygame.draw.polygon(overlay, color, [((x - bounds.x) * f, (y - bounds.y) * f) for x, y in points])
+    if type(screen) is ScaledSurface:
+        screen.blit_native(overlay, bounds.topleft, (0, 0) + size)
+    else:
+        screen.blit(overlay, bounds.topleft, (0, 0) + size)
+    overlay_pool.release(overlay)
+
 class FrequencyBars:
     def __init__(self, x, y, width, height):
         self.x = x
@@ -491,7 +636,7 @@ class FrequencyBars:
     
     def update(self, spectrum, dt):
         target_values = spectrum[:self.num_bars]
-        self.bar_values = self.bar_values * 0.7 + target_values * 0.3
+        self.bar_values = ema(self.bar_values, target_values, dt, 0.047)
         
         for i in range(self.num_bars):
             if self.bar_values[i] > self.peak_values[i]:
@@ -514,38 +659,111 @@ class FrequencyBars:
             color = TherapeuticColors.frequency_to_color(i, 0.9)
             
             # Barra principal
-            pygame.draw.rect(screen, color, (x + 2, self.y + self.height - bar_height, bar_width - 4, bar_height))
+            draw.rect(screen, color, (x + 2, self.y + self.height - bar_height, bar_width - 4, bar_height))
             
             # Borda branca
-            pygame.draw.rect(screen, (255, 255, 255), (x + 2, self.y + self.height - bar_height, bar_width - 4, bar_height), 2)
+            draw.rect(screen, (255, 255, 255), (x + 2, self.y + self.height - bar_height, bar_width - 4, bar_height), 2)
             
             # Indicador de pico
             peak_y = self.y + self.height - self.peak_values[i] * self.height
-            pygame.draw.line(screen, (255, 255, 255), (x + 2, peak_y), (x + bar_width - 2, peak_y), 3)
+            draw.line(screen, (255, 255, 255), (x + 2, peak_y), (x + bar_width - 2, peak_y), 3)
             
             # Label (nome da banda)
-            label_surface = font.render(self.labels[i], True, (200, 200, 200))
+            label_surface = text_cache.static(font, self.labels[i], (200, 200, 200))
             label_rect = label_surface.get_rect(center=(x + bar_width/2, self.y + self.height + 15))
             screen.blit(label_surface, label_rect)
+    
+    def damage(self):
+        """Uma coluna por barra (do pico até a base) e assinatura da geometria (quarto de pixel)"""
+        bar_width = self.width / self.num_bars
+        bar_top = self.y + self.height - self.bar_values * self.height
+        peak_y = self.y + self.height - self.peak_values * self.height
+        bottom = self.y + self.height + 3
+        
+        rects = []
+        for i in range(self.num_bars):
+            x = int(self.x + i * bar_width * 1.05)
+            top = int(min(bar_top[i], peak_y[i])) - 2
+            rects.append(pygame.Rect(x, top, int(bar_width) + 2, bottom - top))
+        
+        signature = (tuple(np.floor(bar_top * 4).astype(int)), tuple(np.floor(peak_y * 4).astype(int)))
+        return rects, signature
+
+class SpectrogramWaterfall:
+    """Espectrograma rolante: uma coluna por análise, frequência em escala log (graves embaixo)"""
+    
+    def __init__(self, x, y, width, height, freqs, background=(20, 20, 30)):
+        self.x, self.y, self.width, self.height = x, y, width, height
+        self.texture = RingTexture((width, height), background)
+        self.reference = 1e-3
+        
+        # Linha -> primeiro bin da FFT (linhas de baixo para cima; bins repetidos nos graves)
+        low, high = 20.0, min(20000.0, float(freqs[-1]))
+        edges = np.geomspace(low, high, height + 1)
+        self.row_bins = np.searchsorted(freqs, edges[:-1]).clip(0, len(freqs) - 1)
+        self.last_bin = max(int(np.searchsorted(freqs, high)), int(self.row_bins[-1]) + 1)
+        
+        # Mapa de cores pré-calculado: cor da banda de cada linha, do fundo (nível 0) à cor cheia
+        centers = np.sqrt(edges[:-1] * edges[1:])
+        table = TherapeuticColors.FREQUENCY_BANDS_TABLE
+        bands = np.searchsorted([band[1] for band in table], centers).clip(0, len(table) - 1)
+        band_colors = np.array([table[band][4] for band in bands], dtype=float)
+        ramp = np.linspace(0.0, 1.0, SPECTROGRAM_LEVELS)[None, :, None]
+        base = np.array(background, dtype=float)
+        self.colormap = np.rint(base + (band_colors[:, None, :] - base) * ramp).astype(np.uint8)
+        self.rows = np.arange(height)
+    
+    def update(self, magnitude, dt):
+        """Escreve a coluna da análise mais recente na textura (dt = tempo de mídia desde a anterior)"""
+        if len(magnitude) == 0:
+            return
+        peaks = np.maximum.reduceat(magnitude[:self.last_bin], self.row_bins)
+        self.reference = max(float(peaks.max()), self.reference * decay(dt, SPECTROGRAM_REFERENCE_TAU))
+        db = 20 * np.log10(np.maximum(peaks / self.reference, 1e-12))
+        levels = ((db / SPECTROGRAM_DB_RANGE + 1.0).clip(0.0, 1.0) * (SPECTROGRAM_LEVELS - 1)).astype(int)
+        # A coluna da textura vai de cima (agudos) para baixo (graves)
+        self.texture.push(self.colormap[self.rows, levels][::-1])
+    
+    def draw(self, screen, font):
+        self.texture.present(screen, (self.x, self.y))
+        draw.rect(screen, (80, 80, 80), (self.x - 1, self.y - 1, self.width + 2, self.height + 2), 1)
+        
+        label_surface = text_cache.static(font, 'Spectrogram', (200, 200, 200))
+        label_rect = label_surface.get_rect(center=(self.x + self.width / 2, self.y + self.height + 15))
+        screen.blit(label_surface, label_rect)
+    
+    def damage(self):
+        """A textura muda a cada análise"""
+        return pygame.Rect(self.x - 1, self.y - 1, self.width + 2, self.height + 2), None
 
 class CircularSpectrum:
     def __init__(self, center_x, center_y, radius):
         self.center_x = center_x
         self.center_y = center_y
         self.base_radius = radius
-        self.particles = []
+        self.particles = ParticleEngine(60)
         self.history_points = deque(maxlen=120)
         self.rotation = 0
-        self.dna_spiral = []
+        self.dna_spiral = ParticleEngine(200, evict_oldest=True)
         self.harmonic_rings = []
-        self.emotion_particles = []
+        self.emotion_particles = ParticleEngine(32, fields=['angle', 'distance', 'orbit_speed'])
+        self.drawn_points = None
+        self.drawn_pad = 0
+        self.halos = True
+        self.splat = False
+        self.trails = False  # Espiral de DNA desenhada só no trecho novo, num buffer persistente
+        self.trail_mark = 0
+        self.trail_dt = 1.0 / FPS  # Duração do quadro (o rastro esmaece por quadro desenhado)
+        reach = radius + 60
+        self.trail_rect = pygame.Rect(center_x - reach, center_y - reach, 2 * reach, 2 * reach)
+        self.rng = random_streams.stream('circular_spectrum')
     
     def update(self, spectrum, identity, beat_detected, dt):
         self.rotation += dt * 0.5
         
         if len(spectrum) > 0:
             avg_energy = np.mean(spectrum)
-            self.history_points.append({'spectrum': spectrum.copy(), 'time': time.time(), 'energy': avg_energy, 'beat': beat_detected})
+            self.history_points.append({'spectrum': spectrum.copy(), 'time': animation_clock.now(), 'energy': avg_energy, 'beat': beat_detected})
         
         if len(spectrum) > 3:
             angle = self.rotation * 2
@@ -554,14 +772,10 @@ class CircularSpectrum:
             x = self.center_x + (radius + modulation) * math.cos(angle)
             y = self.center_y + (radius + modulation) * math.sin(angle)
             
-            self.dna_spiral.append({'x': x, 'y': y, 'color': TherapeuticColors.frequency_to_color(0, spectrum[0]), 'life': 3.0, 'size': 2 + spectrum[0] * 3})
-            if len(self.dna_spiral) > 200:
-                self.dna_spiral.pop(0)
+            self.dna_spiral.spawn(x=x, y=y, color=TherapeuticColors.frequency_to_color(0, spectrum[0]), life=3.0, size=2 + spectrum[0] * 3)
         
-        for point in self.dna_spiral[:]:
-            point['life'] -= dt
-            if point['life'] <= 0:
-                self.dna_spiral.remove(point)
+        self.dna_spiral['life'] -= dt
+        self.dna_spiral.kill(self.dna_spiral['life'] <= 0)
         
         if identity['genre_indicators']['harmonic'] > 0.3 and len(self.harmonic_rings) < 5:
             self.harmonic_rings.append({'radius': 10, 'max_radius': 150, 'color': TherapeuticColors.EMOTION_COLORS['calm'], 'life': 2.0})
@@ -584,113 +798,164 @@ class CircularSpectrum:
         else:
             emotion = 'joyful'
         
-        if len(self.emotion_particles) < 30 and np.random.random() > 0.7:
-            angle = np.random.random() * 2 * np.pi
-            distance = 40 + np.random.random() * 60
-            self.emotion_particles.append({
-                'angle': angle, 'distance': distance, 'orbit_speed': 0.5 + np.random.random() * 1.5,
-                'color': TherapeuticColors.EMOTION_COLORS[emotion], 'life': 2.0 + np.random.random() * 2.0,
-                'size': 2 + np.random.random() * 4
-            })
-        
-        for particle in self.emotion_particles[:]:
-            particle['angle'] += particle['orbit_speed'] * dt
-            particle['distance'] += dt * 5
-            particle['life'] -= dt * 0.3
-            if particle['life'] <= 0:
-                self.emotion_particles.remove(particle)
+        if len(self.emotion_particles) < 30 and self.rng.random() > 0.7:
+            self.emotion_particles.spawn(
+                angle=self.rng.random() * 2 * np.pi, distance=40 + self.rng.random() * 60,
+                orbit_speed=0.5 + self.rng.random() * 1.5,
+                color=TherapeuticColors.EMOTION_COLORS[emotion], life=2.0 + self.rng.random() * 2.0,
+                size=2 + self.rng.random() * 4
+            )
+        
+        emotion = self.emotion_particles
+        emotion['angle'] += emotion['orbit_speed'] * dt
+        emotion['distance'] += dt * 5
+        emotion['life'] -= dt * 0.3
+        emotion.kill(emotion['life'] <= 0)
         
         if beat_detected and len(self.particles) < 50:
-            for i in range(3):
-                angle = np.random.random() * 2 * np.pi
-                speed = 50 + np.random.random() * 100
-                self.particles.append({
-                    'x': self.center_x, 'y': self.center_y,
-                    'vx': math.cos(angle) * speed, 'vy': math.sin(angle) * speed,
-                    'life': 1.0, 'color': TherapeuticColors.frequency_to_color(int(np.random.random() * 7), 1.0)
-                })
-        
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx'] * dt
-            particle['y'] += particle['vy'] * dt
-            particle['life'] -= dt * 0.8
-            particle['vy'] += 100 * dt
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+            angles = self.rng.random(3) * 2 * np.pi
+            speeds = 50 + self.rng.random(3) * 100
+            colors = [TherapeuticColors.frequency_to_color(int(band), 1.0) for band in self.rng.random(3) * 7]
+            self.particles.spawn(3, x=self.center_x, y=self.center_y,
+                                 vx=np.cos(angles) * speeds, vy=np.sin(angles) * speeds,
+                                 life=1.0, color=colors)
+        
+        self.particles.integrate(dt, gravity=100)
+        self.particles['life'] -= dt * 0.8
+        self.particles.kill(self.particles['life'] <= 0)
     
     def draw(self, screen, spectrum):
+        self.drawn_points = None
         if len(spectrum) == 0:
             return
         
-        if len(self.dna_spiral) > 1:
-            for i in range(len(self.dna_spiral) - 1):
-                p1, p2 = self.dna_spiral[i], self.dna_spiral[i + 1]
-                if p1['life'] > 0 and p2['life'] > 0:
-                    alpha = min(p1['life'], p2['life']) / 3.0
-                    color = TherapeuticColors.with_alpha(p1['color'], alpha)
-                    x1, y1 = max(0, min(SCREEN_WIDTH, int(p1['x']))), max(0, min(SCREEN_HEIGHT, int(p1['y'])))
-                    x2, y2 = max(0, min(SCREEN_WIDTH, int(p2['x']))), max(0, min(SCREEN_HEIGHT, int(p2['y'])))
-                    pygame.draw.line(screen, color, (x1, y1), (x2, y2), 2)
+        spiral = self.dna_spiral
+        if len(spiral) > 1 and not self.trails:
+            xs = np.clip(spiral['x'].astype(int), 0, SCREEN_WIDTH).tolist()
+            ys = np.clip(spiral['y'].astype(int), 0, SCREEN_HEIGHT).tolist()
+            alphas = np.minimum(spiral['life'][:-1], spiral['life'][1:]) / 3.0
+            colors = np.clip((spiral['color'][:-1] * alphas[:, None]).astype(int), 0, 255).tolist()
+            for i in range(len(xs) - 1):
+                draw.line(screen, colors[i], (xs[i], ys[i]), (xs[i + 1], ys[i + 1]), 2)
         
         for ring in self.harmonic_rings:
             if ring['life'] > 0:
                 alpha = ring['life'] / 2.0
                 color = TherapeuticColors.with_alpha(ring['color'], alpha * 0.6)
-                pygame.draw.circle(screen, color, (self.center_x, self.center_y), int(ring['radius']), 3)
-        
-        for particle in self.emotion_particles:
-            if particle['life'] > 0:
-                x = self.center_x + particle['distance'] * math.cos(particle['angle'])
-                y = self.center_y + particle['distance'] * math.sin(particle['angle'])
-                alpha = min(1.0, particle['life'] / 2.0)
-                color = TherapeuticColors.with_alpha(particle['color'], alpha)
-                size = max(1, int(particle['size'] * alpha))
-                x_pos, y_pos = max(0, min(SCREEN_WIDTH, int(x))), max(0, min(SCREEN_HEIGHT, int(y)))
-                pygame.draw.circle(screen, color, (x_pos, y_pos), size)
-                
-                if alpha > 0.3:
-                    line_color = TherapeuticColors.with_alpha(particle['color'], alpha * 0.3)
-                    pygame.draw.line(screen, line_color, (self.center_x, self.center_y), (x_pos, y_pos), 1)
-        
-        points = []
-        for i in range(len(spectrum)):
-            angle = (i / len(spectrum)) * 2 * math.pi + self.rotation
-            energy = spectrum[i]
-            radius = self.base_radius + energy * 150
-            x = self.center_x + radius * math.cos(angle)
-            y = self.center_y + radius * math.sin(angle)
-            points.append((int(x), int(y)))
+                draw.circle(screen, color, (self.center_x, self.center_y), int(ring['radius']), 3)
+        
+        emotion = self.emotion_particles
+        if len(emotion) > 0:
+            ex = self.center_x + emotion['distance'] * np.cos(emotion['angle'])
+            ey = self.center_y + emotion['distance'] * np.sin(emotion['angle'])
+            alphas = np.minimum(1.0, emotion['life'] / 2.0)
+            colors = np.clip((emotion['color'] * alphas[:, None]).astype(int), 0, 255).tolist()
+            line_colors = np.clip((emotion['color'] * (alphas * 0.3)[:, None]).astype(int), 0, 255).tolist()
+            sizes = np.maximum(1, (emotion['size'] * alphas).astype(int)).tolist()
+            xs = np.clip(ex.astype(int), 0, SCREEN_WIDTH).tolist()
+            ys = np.clip(ey.astype(int), 0, SCREEN_HEIGHT).tolist()
+            if self.splat:
+                linked = alphas > 0.3
+                center = np.array([[self.center_x, self.center_y]])
+                ends = np.stack((ex, ey), axis=1)[linked]
+                draw_segments(screen, np.repeat(center, len(ends), axis=0), ends,
+                              np.asarray(line_colors)[linked], quantum=1)
+                splat(screen, ex, ey, colors, sizes)
+            else:
+                alphas = alphas.tolist()
+                for i in range(len(xs)):
+                    draw.circle(screen, colors[i], (xs[i], ys[i]), sizes[i])
+                    
+                    if alphas[i] > 0.3:
+                        draw.line(screen, line_colors[i], (self.center_x, self.center_y), (xs[i], ys[i]), 1)
+        
+        # Polígono unitário de uma ponta por banda: rotação, raio por vértice e centro numa transformação
+        radii = self.base_radius + np.asarray(spectrum) * 150
+        points = to_points(place(unit_polygon(len(spectrum)), radii, self.rotation, (self.center_x, self.center_y)))
+        
+        self.drawn_points = points
+        self.drawn_pad = 3 + int(np.max(spectrum) * 8) + 4
         
         if len(points) > 2:
-            s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.polygon(s, (100, 150, 255, 40), points)
-            screen.blit(s, (0, 0))
+            draw_translucent_polygon(screen, (100, 150, 255, 40), points)
             
             for i in range(len(points)):
                 start, end = points[i], points[(i + 1) % len(points)]
                 color = TherapeuticColors.frequency_to_color(i, 0.8)
-                pygame.draw.line(screen, color, start, end, 3)
-        
-        for i, point in enumerate(points):
-            color = TherapeuticColors.frequency_to_color(i, 1.0)
-            size = 3 + int(spectrum[i] * 8)
-            halo_color = TherapeuticColors.with_alpha(color, 0.3)
-            pygame.draw.circle(screen, halo_color, point, size + 3)
-            pygame.draw.circle(screen, color, point, size)
-            pygame.draw.circle(screen, (255, 255, 255), point, max(1, size // 2))
-        
-        for particle in self.particles:
-            if particle['life'] > 0:
-                color = TherapeuticColors.with_alpha(particle['color'], particle['life'])
-                size = max(1, int(particle['life'] * 5))
-                x, y = max(0, min(SCREEN_WIDTH, int(particle['x']))), max(0, min(SCREEN_HEIGHT, int(particle['y'])))
-                pygame.draw.circle(screen, color, (x, y), size)
+                draw.line(screen, color, start, end, 3)
+        
+        # Halo, núcleo e centro de cada ponto num sprite por (tamanho, banda); um único blits
+        sizes = (3 + (np.asarray(spectrum) * 8).astype(int)).tolist()
+        keys = [(size, i, self.halos) for i, size in enumerate(sizes)]
+        sprite_cache.draw(screen, keys, self.render_point, [p[0] for p in points], [p[1] for p in points])
+        
+        particles = self.particles
+        if len(particles) > 0:
+            colors = np.clip((particles['color'] * particles['life'][:, None]).astype(int), 0, 255)
+            sizes = np.maximum(1, (particles['life'] * 5).astype(int))
+            if self.splat:
+                splat(screen, particles['x'], particles['y'], colors, sizes)
+                return
+            colors, sizes = colors.tolist(), sizes.tolist()
+            xs = np.clip(particles['x'].astype(int), 0, SCREEN_WIDTH).tolist()
+            ys = np.clip(particles['y'].astype(int), 0, SCREEN_HEIGHT).tolist()
+            for i in range(len(xs)):
+                draw.circle(screen, colors[i], (xs[i], ys[i]), sizes[i])
+    
+    def draw_trail(self, surface):
+        """Buffer persistente da espiral de DNA: só os segmentos que chegam aos pontos novos"""
+        spiral = self.dna_spiral
+        new = fresh_count(spiral, self.trail_mark)
+        self.trail_mark = spiral.spawned
+        first = max(1, len(spiral) - new)
+        if first >= len(spiral):
+            return
+        xy = np.stack((spiral['x'], spiral['y']), axis=1)
+        alphas = np.minimum(spiral['life'][first - 1:-1], spiral['life'][first:]) / 3.0
+        colors = np.clip((spiral['color'][first - 1:-1] * alphas[:, None]).astype(int), 0, 255)
+        draw_segments(surface, xy[first - 1:-1], xy[first:], colors, width=2, quantum=1)
+    
+    def trail_retention(self):
+        return retention(self.trail_dt, DNA_SPIRAL_TRAIL_TAU)
+    
+    @staticmethod
+    def render_point(key, factor):
+        """Sprite de um ponto do espectro: halo, núcleo da cor da banda e centro branco"""
+        size, band, halos = key
+        color = TherapeuticColors.frequency_to_color(band, 1.0)
+        discs = [(TherapeuticColors.with_alpha(color, 0.3), size + 3, 0)] if halos else []
+        discs += [(color, size, 0), ((255, 255, 255), max(1, size // 2), 0)]
+        return render_glow(discs, factor)
+    
+    def damage(self):
+        """Caixa de tudo o que foi desenhado (o espectro gira a cada quadro)"""
+        if not self.drawn_points:
+            return None, ()
+        
+        rects = [points_bounds(self.drawn_points, self.drawn_pad)]
+        if self.harmonic_rings:
+            radius = int(max(ring['radius'] for ring in self.harmonic_rings)) + 2
+            rects.append(pygame.Rect(self.center_x - radius, self.center_y - radius, 2 * radius, 2 * radius))
+        if len(self.dna_spiral) > 1 and not self.trails:
+            rects.append(coords_bounds(self.dna_spiral['x'], self.dna_spiral['y'], 2))
+        emotion = self.emotion_particles
+        if len(emotion) > 0:
+            reach = int((emotion['distance'] + emotion['size']).max()) + 2
+            rects.append(pygame.Rect(self.center_x - reach, self.center_y - reach, 2 * reach, 2 * reach))
+        if len(self.particles) > 0:
+            rects.append(coords_bounds(self.particles['x'], self.particles['y'], 6))
+        
+        return [rect.clip(SCREEN_RECT) for rect in rects], None
 
 class WaveformHistory:
     def __init__(self, x, y, width, height):
         self.x, self.y, self.width, self.height = x, y, width, height
         self.history = deque(maxlen=200)
         self.color_history = deque(maxlen=200)
+        self.pending = 0  # Amostras ainda não desenhadas na faixa
+        # Faixa de rolagem: cada amostra nova é uma coluna; o esmaecimento por idade vem na apresentação
+        self.strip = ScrollStrip((x, y, width, height), self.history.maxlen)
+        self.drawn_rect = None
     
     def update(self, spectrum, identity):
         if len(spectrum) > 0:
@@ -707,39 +972,55 @@ class WaveformHistory:
             else:
                 color = TherapeuticColors.EMOTION_COLORS['joyful']
             self.color_history.append(color)
+            self.pending += 1
     
     def draw(self, screen):
+        self.drawn_rect = None
         if len(self.history) < 2:
             return
         
         center_y = self.y + self.height // 2
-        pygame.draw.line(screen, (80, 80, 80), (self.x, center_y), (self.x + self.width, center_y), 1)
-        
-        points_top, points_bottom = [], []
-        for i, (energy, color) in enumerate(zip(self.history, self.color_history)):
-            x = self.x + (i / len(self.history)) * self.width
-            wave_height = energy * self.height * 0.4
-            points_top.append((int(x), int(center_y - wave_height)))
-            points_bottom.append((int(x), int(center_y + wave_height)))
-        
-        if len(points_top) > 1:
-            for i in range(len(points_top) - 1):
-                color = self.color_history[i]
-                alpha = 0.3 + (i / len(points_top)) * 0.7
-                draw_color = TherapeuticColors.with_alpha(color, alpha)
-                pygame.draw.line(screen, draw_color, points_top[i], points_top[i + 1], 2)
-                pygame.draw.line(screen, draw_color, points_bottom[i], points_bottom[i + 1], 2)
-        
-        if len(points_top) > 2:
-            s = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            all_points = points_top + points_bottom[::-1]
-            if len(all_points) > 2:
-                pygame.draw.polygon(s, (100, 150, 255, 30), all_points)
-                screen.blit(s, (self.x, self.y))
+        draw.line(screen, (80, 80, 80), (self.x, center_y), (self.x + self.width, center_y), 1)
+        
+        strip = self.strip
+        if strip.prepare(screen):
+            # Faixa nova (início ou outra escala interna): redesenha o histórico inteiro
+            self.pending = len(self.history)
+            alpha = 0.3 + np.arange(strip.columns) / strip.columns * 0.7
+            strip.set_shade(alpha)
+        first = len(self.history) - min(self.pending, len(self.history) - 1)
+        for i in range(first, len(self.history)):
+            self.draw_column(self.history[i - 1], self.history[i], self.color_history[i - 1])
+        self.pending = 0
+        
+        strip.present(screen)
+        self.drawn_rect = pygame.Rect(self.x, self.y, self.width + 1, self.height)
+    
+    def draw_column(self, previous, energy, color):
+        """Rola a faixa e desenha o trecho entre a amostra anterior e a nova"""
+        strip = self.strip
+        x0, x1 = strip.advance()
+        center = strip.to_pixels(self.height / 2)
+        scale = strip.to_pixels(self.height * 0.4)
+        limit = strip.surface.get_height() - 1
+        y0, y1 = previous * scale, energy * scale
+        top = [(x0, max(0, center - y0)), (x1, max(0, center - y1))]
+        bottom = [(x0, min(limit, center + y0)), (x1, min(limit, center + y1))]
+        width = max(1, int(round(strip.to_pixels(2))))
+        
+        pygame.draw.polygon(strip.surface, (100, 150, 255, 30), [(x0 + 1, top[0][1]), top[1], bottom[1],
+                                                                  (x0 + 1, bottom[0][1])])
+        pygame.draw.line(strip.surface, color, top[0], top[1], width)
+        pygame.draw.line(strip.surface, color, bottom[0], bottom[1], width)
+    
+    def damage(self):
+        """O histórico rola a cada quadro"""
+        return self.drawn_rect, None if self.drawn_rect else ()
 
 class EmotionIndicator:
     def __init__(self, x, y, size):
         self.x, self.y, self.size = x, y, size
+        self.label_rect = pygame.Rect(x, y, 0, 0)
         self.current_emotion = 'calm'
         self.emotion_strength = 0.0
         self.pulse = 0.0
@@ -756,25 +1037,34 @@ class EmotionIndicator:
         else:
             self.current_emotion, self.emotion_strength = 'joyful', min(1.0, brightness + energy * 0.5)
         
-        self.pulse = 1.0 if beat_detected else self.pulse * 0.9
+        self.pulse = 1.0 if beat_detected else self.pulse * decay(dt, 0.158)
     
     def draw(self, screen, font):
         color = TherapeuticColors.EMOTION_COLORS[self.current_emotion]
         pulse_size = self.size + self.pulse * 15
         
         halo_color = TherapeuticColors.with_alpha(color, 0.3)
-        pygame.draw.circle(screen, halo_color, (self.x, self.y), int(pulse_size + 10))
-        pygame.draw.circle(screen, color, (self.x, self.y), int(pulse_size))
-        pygame.draw.circle(screen, (255, 255, 255), (self.x, self.y), int(pulse_size), 3)
+        draw.circle(screen, halo_color, (self.x, self.y), int(pulse_size + 10))
+        draw.circle(screen, color, (self.x, self.y), int(pulse_size))
+        draw.circle(screen, (255, 255, 255), (self.x, self.y), int(pulse_size), 3)
         
         inner_size = int(pulse_size * self.emotion_strength)
-        pygame.draw.circle(screen, (255, 255, 255), (self.x, self.y), inner_size)
+        draw.circle(screen, (255, 255, 255), (self.x, self.y), inner_size)
         
         emotion_labels = {'calm': 'Calm', 'energetic': 'Energetic', 'melancholic': 'Melancholic', 'joyful': 'Joyful'}
         text = emotion_labels[self.current_emotion]
-        label_surface = font.render(text, True, (255, 255, 255))
+        label_surface = text_cache.static(font, text, (255, 255, 255))
         label_rect = label_surface.get_rect(center=(self.x, self.y + self.size + 25))
         screen.blit(label_surface, label_rect)
+        self.label_rect = label_rect
+    
+    def damage(self):
+        """Círculo (com halo) e rótulo; muda só com emoção, pulso ou intensidade"""
+        pulse_size = self.size + self.pulse * 15
+        halo = int(pulse_size + 10) + 1
+        rect = pygame.Rect(self.x - halo, self.y - halo, 2 * halo, 2 * halo).union(self.label_rect)
+        signature = (self.current_emotion, halo, int(pulse_size), int(pulse_size * self.emotion_strength))
+        return rect, signature
 
 class RhythmVisualizer:
     def __init__(self, x, y, width, height):
@@ -783,10 +1073,10 @@ class RhythmVisualizer:
         self.tempo_display = 120
     
     def update(self, identity, beat_detected, dt):
-        self.tempo_display = self.tempo_display * 0.95 + identity['tempo'] * 0.05
+        self.tempo_display = ema(self.tempo_display, identity['tempo'], dt, 0.325)
         
         if beat_detected:
-            self.beat_markers.append({'time': time.time(), 'life': 1.0, 'intensity': identity['energy_level']})
+            self.beat_markers.append({'time': animation_clock.now(), 'life': 1.0, 'intensity': identity['energy_level']})
         
         for marker in list(self.beat_markers):
             marker['life'] -= dt * 2
@@ -794,11 +1084,11 @@ class RhythmVisualizer:
                 self.beat_markers.remove(marker)
     
     def draw(self, screen, font):
-        title = font.render('RYTHM', True, (200, 200, 200))
+        title = text_cache.static(font, 'RYTHM', (200, 200, 200))
         screen.blit(title, (self.x, self.y - 30))
         
         bpm_text = f'{int(self.tempo_display)} BPM'
-        bpm_surface = font.render(bpm_text, True, (255, 255, 255))
+        bpm_surface = text_cache.render(font, bpm_text, (255, 255, 255))
         screen.blit(bpm_surface, (self.x, self.y))
         
         if len(self.beat_markers) > 0:
@@ -809,51 +1099,86 @@ class RhythmVisualizer:
                 intensity = marker['intensity']
                 color = TherapeuticColors.frequency_to_color(1, intensity)
                 alpha_color = TherapeuticColors.with_alpha(color, marker['life'])
-                pygame.draw.rect(screen, alpha_color, (x, self.y + 40, beat_width - 2, height))
+                draw.rect(screen, alpha_color, (x, self.y + 40, beat_width - 2, height))
+    
+    def damage(self):
+        """Título, BPM e marcadores; parado quando não há batidas recentes"""
+        rect = pygame.Rect(self.x, self.y - 30, max(self.width, 120), self.height + 72)
+        signature = (int(self.tempo_display),
+                     tuple((m['life'], m['intensity']) for m in self.beat_markers))
+        return rect, signature
 
 class MusicalDNAVisualizer:
     def __init__(self, x, y, width, height):
         self.x, self.y, self.width, self.height = x, y, width, height
-        self.strands = []
+        self.strands = deque(maxlen=100)
+        self.serial = 0   # Fitas criadas desde o início (a fase da hélice acompanha a música inteira)
         self.time_offset = 0
+        self.pending = 0
+        # Faixa de rolagem: cada fita é uma coluna, a hélice anda para a esquerda
+        self.strip = ScrollStrip((x, y, width, height), self.strands.maxlen)
     
     def update(self, identity, dt):
         self.time_offset += dt
         spectral_sig = identity['spectral_signature']
         
-        if len(self.strands) < 100:
-            self.strands.append({'position': len(self.strands), 'frequencies': spectral_sig.copy(), 'time': self.time_offset})
-        
-        if len(self.strands) > 100:
-            self.strands.pop(0)
+        self.strands.append({'position': self.serial, 'frequencies': spectral_sig.copy(), 'time': self.time_offset})
+        self.serial += 1
+        self.pending += 1
     
     def draw(self, screen):
         if len(self.strands) < 2:
             return
         
-        for i in range(len(self.strands) - 1):
-            progress = i / len(self.strands)
-            x = self.x + progress * self.width
-            strand = self.strands[i]
-            
-            for helix in range(2):
-                phase = helix * math.pi
-                y1 = self.y + self.height/2 + math.sin(progress * 4 * math.pi + phase) * 30
-                y2 = self.y + self.height/2 + math.sin((progress + 0.01) * 4 * math.pi + phase) * 30
-                freq_idx = np.argmax(strand['frequencies'])
-                color = TherapeuticColors.frequency_to_color(freq_idx, 0.8)
-                x_next = self.x + (progress + 0.01) * self.width
-                pygame.draw.line(screen, color, (int(x), int(y1)), (int(x_next), int(y2)), 2)
-            
-            if i % 5 == 0:
-                y1 = self.y + self.height/2 + math.sin(progress * 4 * math.pi) * 30
-                y2 = self.y + self.height/2 + math.sin(progress * 4 * math.pi + math.pi) * 30
-                pygame.draw.line(screen, (150, 150, 150), (int(x), int(y1)), (int(x), int(y2)), 1)
+        if self.strip.prepare(screen):
+            self.pending = len(self.strands)
+        first = len(self.strands) - min(self.pending, len(self.strands) - 1)
+        for i in range(first, len(self.strands)):
+            self.draw_column(self.strands[i - 1], self.strands[i])
+        self.pending = 0
+        
+        self.strip.present(screen)
+    
+    def draw_column(self, previous, strand):
+        """Rola a faixa e desenha as duas hélices da fita anterior até a nova (degrau a cada 5 fitas)"""
+        strip = self.strip
+        x0, x1 = strip.advance()
+        center = strip.to_pixels(self.height / 2)
+        amplitude = strip.to_pixels(30)
+        width = max(1, int(round(strip.to_pixels(2))))
+        color = TherapeuticColors.frequency_to_color(np.argmax(previous['frequencies']), 0.8)
+        
+        # Duas voltas completas ao longo das 100 fitas visíveis
+        phase0 = previous['position'] / self.strands.maxlen * 4 * math.pi
+        phase1 = strand['position'] / self.strands.maxlen * 4 * math.pi
+        for helix in range(2):
+            offset = helix * math.pi
+            pygame.draw.line(strip.surface, color, (x0, int(center + math.sin(phase0 + offset) * amplitude)),
+                             (x1, int(center + math.sin(phase1 + offset) * amplitude)), width)
+        
+        if previous['position'] % 5 == 0:
+            y1 = center + math.sin(phase0) * amplitude
+            y2 = center + math.sin(phase0 + math.pi) * amplitude
+            pygame.draw.line(strip.surface, (150, 150, 150), (x0, int(y1)), (x0, int(y2)), 1)
+    
+    def damage(self):
+        """A hélice rola a cada fita nova"""
+        if len(self.strands) < 2:
+            return None, ()
+        rect = pygame.Rect(self.x - 1, int(self.y + self.height / 2) - 32, self.width + 3, 65)
+        return rect, (self.serial,)
 
 class TherapeuticMusicVisualizer:
-    def __init__(self, audio_file):
+    def __init__(self, audio_file, playback=True, render_scale=None, display_size=None, splat_components=None,
+                 trail_components=None, sinks=None, analysis=None, feature_bus=None):
+        # Visão inscrita numa sessão: análise, áudio e relógio vêm do processo que publica
+        self.feature_bus = feature_bus_name(feature_bus)
+        if self.feature_bus:
+            playback = False
         pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Janela pode ser maior que o layout (TVs); a escala define a resolução interna
+        display_size, render_scale = render_settings((SCREEN_WIDTH, SCREEN_HEIGHT), render_scale, display_size)
+        self.screen = pygame.display.set_mode(display_size)
         pygame.display.set_caption('MUSTEM Auditory Decoder')
         self.clock = pygame.time.Clock()
         
@@ -862,9 +1187,10 @@ class TherapeuticMusicVisualizer:
         self.medium_font = pygame.font.Font(None, 28)
         self.small_font = pygame.font.Font(None, 20)
         
-        self.analyzer = EnhancedAudioAnalyzer(audio_file)
+        self.analyzer = EnhancedAudioAnalyzer(audio_file, playback)
         
         self.frequency_bars = FrequencyBars(50, 100, 600, 250)  # Largura aumentada de 500 para 600 para 9 bandas
+        self.spectrogram = SpectrogramWaterfall(690, 100, 120, 250, self.analyzer.freqs)
         self.circular_spectrum = CircularSpectrum(1050, 300, 80)
         self.phyllotaxis = PhyllotaxisVisualizer(1050, 300)  # MANDALA! Mesma posição do circular
         self.waveform = WaveformHistory(50, 420, 900, 120)
@@ -875,99 +1201,330 @@ class TherapeuticMusicVisualizer:
         self.running = True
         self.paused = False
         self.last_time = time.time()
+        self.features = None
+        self.spectrogram_time = None
+        
+        # Simulação em passos fixos; batida de um quadro sem passo vai para o próximo passo
+        self.timestep = FixedTimestep()
+        self.pending_beat = False
+        
+        # Saídas (motores via serial, rede) alimentadas pelo runtime
+        self.sinks = sink_settings(sinks)
+        self.runtime = None
+        
+        # Análise no próprio processo ou num processo separado (iniciado em run())
+        self.audio_file = audio_file
+        self.analysis_mode = analysis_mode(analysis)
+        self.worker = None
+        self.bus = None
+        
+        # Rastros em buffer persistente nos componentes escolhidos
+        trailing = trail_settings(trail_components)
+        for name, component in self.trail_components().items():
+            component.trails = trail_enabled(trailing, name)
+        
+        # Camadas: fundo e moldura em cache, painéis e valores a cada quadro
+        self.compositor = Compositor((SCREEN_WIDTH, SCREEN_HEIGHT), render_scale=render_scale,
+                                     display_size=display_size)
+        self.compositor.add(Layer('background', self.draw_background, SLOW, key=lambda: self.paused))
+        # Cada painel informa seu dano para a apresentação por retângulos sujos
+        self.compositor.add(Layer('frequency_bars', lambda s: self.frequency_bars.draw(s, self.small_font),
+                                  damage=self.frequency_bars.damage))
+        self.compositor.add(Layer('spectrogram', lambda s: self.spectrogram.draw(s, self.small_font),
+                                  damage=self.spectrogram.damage))
+        spectrum = self.circular_spectrum
+        if spectrum.trails:
+            self.compositor.add(Layer('circular_trail', spectrum.draw_trail, TRAIL, rect=spectrum.trail_rect,
+                                      fade=spectrum.trail_retention, blend=pygame.BLEND_MAX))
+        self.compositor.add(Layer('circular_spectrum', lambda s: spectrum.draw(s, self.features['spectrum']),
+                                  damage=spectrum.damage))
+        phyllotaxis = self.phyllotaxis
+        if phyllotaxis.trails:  # MANDALA! Desenha por cima do circular
+            self.compositor.add(Layer('phyllotaxis', phyllotaxis.draw_trail, TRAIL, rect=phyllotaxis.trail_rect,
+                                      fade=phyllotaxis.trail_retention, blend=pygame.BLEND_MAX))
+        else:
+            self.compositor.add(Layer('phyllotaxis', phyllotaxis.draw, damage=phyllotaxis.damage))
+        self.compositor.add(Layer('waveform', self.waveform.draw, damage=self.waveform.damage))
+        self.compositor.add(Layer('emotion', lambda s: self.emotion_indicator.draw(s, self.medium_font),
+                                  damage=self.emotion_indicator.damage))
+        self.compositor.add(Layer('rhythm', lambda s: self.rhythm_viz.draw(s, self.small_font),
+                                  damage=self.rhythm_viz.damage))
+        self.compositor.add(Layer('dna', self.dna_viz.draw, damage=self.dna_viz.damage))
+        self.compositor.add(Layer('genre_chrome', self.draw_genre_chrome, STATIC,
+                                  rect=(GENRE_PANEL_X, GENRE_PANEL_Y, 300, 125), transparent=True))
+        self.compositor.add(Layer('interface', lambda s: self.draw_interface(s, self.features),
+                                  damage=self.interface_damage))
+        
+        # Qualidade adaptativa (hardware de quiosque varia de Raspberry Pi a notebook)
+        self.quality = QualityGovernor()
+        self.setup_quality_knobs()
+        
+        # Rasterizador de splatting nos componentes escolhidos
+        splatting = splat_settings(splat_components)
+        for name, component in self.point_cloud_components().items():
+            component.splat = splat_enabled(splatting, name)
     
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.VIDEOEXPOSE:
+                self.compositor.force_full = True  # Janela descoberta: reapresenta tudo
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_SPACE and self.feature_bus:
+                    self.bus.clock.request(not self.bus.clock.requested)  # Quem toca o áudio pausa
                 elif event.key == pygame.K_SPACE:
                     self.paused = not self.paused
                     if self.paused:
                         pygame.mixer.music.pause()
+                        if self.worker:
+                            self.worker.clock.pause()
                     else:
                         pygame.mixer.music.unpause()
+                        if self.worker:
+                            self.worker.clock.resume()
     
-    def draw_interface(self, features):
-        title = self.title_font.render('MUSTEM Auditory Decoder', True, (255, 255, 255))
-        self.screen.blit(title, (50, 20))
+    def draw_background(self, surface):
+        """Fundo, título e instruções (mudam apenas ao pausar)"""
+        surface.fill((20, 20, 30))
+        
+        title = text_cache.static(self.title_font, 'MUSTEM Auditory Decoder', (255, 255, 255))
+        surface.blit(title, (50, 20))
         
-        subtitle = self.small_font.render(' Assistive Technology for People with Hearing Impairment', True, (180, 180, 180))
-        self.screen.blit(subtitle, (50, 65))
+        subtitle = text_cache.static(self.small_font, ' Assistive Technology for People with Hearing Impairment', (180, 180, 180))
+        surface.blit(subtitle, (50, 65))
         
+        if self.paused:
+            pause_text = text_cache.static(self.large_font, 'PAUSADO - Pressione ESPAÇO', (255, 200, 100))
+            text_rect = pause_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT - 40))
+            surface.blit(pause_text, text_rect)
+        else:
+            instructions = text_cache.static(self.small_font, 'SPACE: Pause | ESC: Exit', (150, 150, 150))
+            text_rect = instructions.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT - 30))
+            surface.blit(instructions, text_rect)
+    
+    def draw_genre_chrome(self, surface):
+        """Moldura do painel de características (trilhos e nomes)"""
+        genre_title = text_cache.static(self.small_font, 'Characteristics:', (180, 180, 180))
+        surface.blit(genre_title, (GENRE_PANEL_X, GENRE_PANEL_Y))
+        
+        for i, name in enumerate(GENRE_LABELS):
+            y = GENRE_PANEL_Y + 25 + i * 25
+            draw.rect(surface, (80, 80, 80), (GENRE_PANEL_X, y, 200, 15))
+            label = text_cache.static(self.small_font, name, (200, 200, 200))
+            surface.blit(label, (GENRE_PANEL_X + 210, y - 2))
+    
+    def draw_interface(self, surface, features):
         identity = features['identity']
         info_y = 400
         tempo_text = f"Time: {int(identity['tempo'])} BPM"
-        tempo_surface = self.medium_font.render(tempo_text, True, (200, 200, 200))
-        self.screen.blit(tempo_surface, (600, info_y))
+        tempo_surface = text_cache.render(self.medium_font, tempo_text, (200, 200, 200))
+        surface.blit(tempo_surface, (600, info_y))
         
         energy_text = f"Energy: {int(identity['energy_level'] * 100)}%"
-        energy_surface = self.medium_font.render(energy_text, True, (200, 200, 200))
-        self.screen.blit(energy_surface, (800, info_y))
+        energy_surface = text_cache.render(self.medium_font, energy_text, (200, 200, 200))
+        surface.blit(energy_surface, (800, info_y))
         
-        genre_y = 570
-        genre_title = self.small_font.render('Characteristics:', True, (180, 180, 180))
-        self.screen.blit(genre_title, (1100, genre_y))
+        indicators = identity['genre_indicators']
+        for i, key in enumerate(GENRE_KEYS):
+            y = GENRE_PANEL_Y + 25 + i * 25
+            bar_width = int(indicators[key] * 100)
+            draw.rect(surface, (100, 200, 255), (GENRE_PANEL_X, y, bar_width, 15))
+    
+    def interface_damage(self):
+        """Textos de tempo/energia e barras de características"""
+        identity = self.features['identity']
+        tempo_text = f"Time: {int(identity['tempo'])} BPM"
+        energy_text = f"Energy: {int(identity['energy_level'] * 100)}%"
+        tempo_rect = text_cache.render(self.medium_font, tempo_text, (200, 200, 200)).get_rect(topleft=(600, 400))
+        energy_rect = text_cache.render(self.medium_font, energy_text, (200, 200, 200)).get_rect(topleft=(800, 400))
+        bars_rect = pygame.Rect(GENRE_PANEL_X, GENRE_PANEL_Y + 25, 200, 4 * 25)
         
         indicators = identity['genre_indicators']
-        genres = [('Percussive', indicators['percussive']), ('Melodic', indicators['melodic']),
-                  ('Harmonic', indicators['harmonic']), ('Rhythmic', indicators['rhythmic'])]
+        signature = (tempo_text, energy_text, tuple(int(indicators[k] * 100) for k in GENRE_KEYS))
+        return [tempo_rect, energy_rect, bars_rect], signature
+    
+    def point_cloud_components(self):
+        """Componentes com nuvens de pontos que aceitam splatting (nome -> componente)"""
+        return {'phyllotaxis': self.phyllotaxis, 'circular_spectrum': self.circular_spectrum}
+    
+    def trail_components(self):
+        """Componentes que podem desenhar rastros num buffer persistente (nome -> componente)"""
+        return {'phyllotaxis': self.phyllotaxis, 'circular_spectrum': self.circular_spectrum}
+    
+    def setup_quality_knobs(self):
+        """Limites de partículas e halos que podem cair para manter o FPS"""
+        engines = [self.phyllotaxis.points, self.circular_spectrum.particles, self.circular_spectrum.dna_spiral]
         
-        for i, (name, value) in enumerate(genres):
-            y = genre_y + 25 + i * 25
-            bar_width = int(value * 100)
-            pygame.draw.rect(self.screen, (80, 80, 80), (1100, y, 200, 15))
-            pygame.draw.rect(self.screen, (100, 200, 255), (1100, y, bar_width, 15))
-            label = self.small_font.render(name, True, (200, 200, 200))
-            self.screen.blit(label, (1310, y - 2))
+        def set_particle_scale(scale):
+            for engine in engines:
+                engine.set_limit(engine.capacity * scale)
         
-        if self.paused:
-            pause_text = self.large_font.render('PAUSADO - Pressione ESPAÇO', True, (255, 200, 100))
-            text_rect = pause_text.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT - 40))
-            self.screen.blit(pause_text, text_rect)
-        else:
-            instructions = self.small_font.render('SPACE: Pause | ESC: Exit', True, (150, 150, 150))
-            text_rect = instructions.get_rect(center=(SCREEN_WIDTH/2, SCREEN_HEIGHT - 30))
-            self.screen.blit(instructions, text_rect)
+        def set_halos(enabled):
+            self.circular_spectrum.halos = enabled
+        
+        self.quality.add_knob('particle_scale', 1.0, 0.25, set_particle_scale, integer=False)
+        self.quality.add_knob('halos', True, False, set_halos)
     
-    def run(self):
-        self.analyzer.start_playback()
+    def moving_engines(self):
+        """Motores cujas partículas se movem entre passos (desenhadas na posição interpolada)"""
+        return [self.circular_spectrum.particles]
+    
+    def update(self, dt, features=None):
+        """Análise uma vez por quadro (ou características já analisadas); painéis avançam em passos fixos"""
+        if features is None:
+            features = self.analyzer.analyze()
+        self.features = features
+        
+        # Espectrograma: uma coluna por análise nova (nem por passo, nem por quadro repetido)
+        if features['time'] != self.spectrogram_time:
+            elapsed = SIMULATION_STEP if self.spectrogram_time is None else features['time'] - self.spectrogram_time
+            self.spectrogram_time = features['time']
+            self.spectrogram.update(features['magnitude'], min(max(0.0, elapsed), 0.25))
+        
+        # Rastros esmaecem por quadro desenhado
+        for component in self.trail_components().values():
+            component.trail_dt = dt
+        
+        beat_detected = features['beat_detected'] or self.pending_beat
+        steps = self.timestep.advance(dt)
+        self.pending_beat = beat_detected and steps == 0
+        for step in range(steps):
+            for engine in self.moving_engines():
+                engine.begin_step()
+            self.step(features, beat_detected and step == 0, self.timestep.step)
+    
+    def step(self, features, beat_detected, dt):
+        """Um passo fixo de simulação dos painéis"""
+        self.frequency_bars.update(features['spectrum'], dt)
+        self.circular_spectrum.update(features['spectrum'], features['identity'], beat_detected, dt)
+        self.phyllotaxis.update(features['spectrum'], features['identity'], beat_detected, dt)  # MANDALA!
+        self.waveform.update(features['spectrum'], features['identity'])
+        self.emotion_indicator.update(features['identity'], beat_detected, dt)
+        self.rhythm_viz.update(features['identity'], beat_detected, dt)
+        self.dna_viz.update(features['identity'], dt)
+    
+    def draw(self):
+        """Compõe o quadro (partículas interpoladas entre os dois últimos passos); retorna as regiões alteradas"""
+        with interpolated(self.moving_engines(), self.timestep.alpha):
+            return self.compositor.compose(self.screen)
+    
+    def add_analysis_tasks(self, runtime, analyzed):
+        """Captura (posição de reprodução) e análise no próprio processo"""
+        captured = runtime.queue('capture', 1)
+        analysis = runtime.stage('analysis', VISUAL_LATENCY_BUDGET_MS)
         
-        while self.running:
-            current_time = time.time()
-            dt = current_time - self.last_time
-            self.last_time = current_time
-            
-            self.handle_events()
-            
+        def capture():
             if not self.paused:
+                captured.put_nowait(self.analyzer.get_current_time())
+        
+        async def analyze():
+            while runtime.running:
+                media_time = await captured.get()
+                analysis.start()
                 features = self.analyzer.analyze()
-                
-                self.frequency_bars.update(features['spectrum'], dt)
-                self.circular_spectrum.update(features['spectrum'], features['identity'], features['beat_detected'], dt)
-                self.phyllotaxis.update(features['spectrum'], features['identity'], features['beat_detected'], dt)  # MANDALA!
-                self.waveform.update(features['spectrum'], features['identity'])
-                self.emotion_indicator.update(features['identity'], features['beat_detected'], dt)
-                self.rhythm_viz.update(features['identity'], features['beat_detected'], dt)
-                self.dna_viz.update(features['identity'], dt)
-                
-                self.screen.fill((20, 20, 30))
-                
-                self.frequency_bars.draw(self.screen, self.small_font)
-                self.circular_spectrum.draw(self.screen, features['spectrum'])
-                self.phyllotaxis.draw(self.screen)  # MANDALA! Desenha por cima do circular
-                self.waveform.draw(self.screen)
-                self.emotion_indicator.draw(self.screen, self.medium_font)
-                self.rhythm_viz.draw(self.screen, self.small_font)
-                self.dna_viz.draw(self.screen)
-                
-                self.draw_interface(features)
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
+                analysis.stop()
+                analyzed.put_nowait(features)
+                runtime.publish(tactile_message(features, media_time))
+        
+        runtime.periodic('capture', SIMULATION_STEP, capture)
+        runtime.add_task('analysis', analyze)
+    
+    def add_bus_reader(self, runtime, analyzed, bus):
+        """Análise em outro processo: quadro mais recente do barramento, lido sem cópia nem pickle"""
+        received = [0]
+        
+        def receive():
+            sequence, features = bus.read(unpack_dashboard, received[0])
+            if features is not None:
+                received[0] = sequence
+                analyzed.put_nowait(features)
+                runtime.publish(tactile_message(features, features['time']))
+        
+        runtime.periodic('bus', SIMULATION_STEP / 2, receive)
+    
+    def build_runtime(self):
+        """Tarefas: captura e análise (ou leitura do barramento), renderização, eventos e saídas"""
+        runtime = Runtime()
+        analyzed = runtime.queue('features', 1)
+        if self.bus:
+            self.add_bus_reader(runtime, analyzed, self.bus)
+        else:
+            self.add_analysis_tasks(runtime, analyzed)
         
+        def render():
+            current_time = self.frame_time()
+            dt = max(0.0, current_time - self.last_time)
+            self.last_time = current_time
+            if self.feature_bus:
+                self.paused = not self.bus.clock.running
+            
+            if self.paused or self.features is None and not len(analyzed):
+                self.compositor.present([])
+                return
+            
+            started = time.perf_counter()
+            features = analyzed.get_latest()
+            if features is None:
+                # Análise atrasada: repete o último quadro sem repetir a batida
+                features = dict(self.features, beat_detected=False)
+            self.update(dt, features)
+            dirty = self.draw()
+            self.compositor.present(dirty)
+            self.quality.record((time.perf_counter() - started) * 1000.0)
+        
+        def events():
+            self.handle_events()
+            if self.feature_bus and self.bus.closed:
+                self.running = False  # Sessão encerrada por quem publica
+            if not self.running:
+                runtime.stop()
+        
+        runtime.periodic('render', 1.0 / FPS, render)
+        runtime.periodic('events', 0.01, events)
+        for sink in self.sinks:
+            runtime.add_sink(sink)
+        return runtime
+    
+    def frame_time(self):
+        """Relógio dos quadros: o da mídia numa visão inscrita (a pausa congela tudo), senão o de parede"""
+        if self.feature_bus:
+            media_time = self.bus.clock.now()
+            animation_clock.set(media_time)
+            return media_time
+        return time.time()
+    
+    def run(self):
+        if self.feature_bus:
+            self.bus = subscribe(self.feature_bus, 'dashboard', ['magnitude'])
+        elif self.analysis_mode == 'process':
+            self.worker = AnalysisWorker(self.audio_file, {'dashboard': EnhancedAudioAnalyzer},
+                                         magnitude_bins=len(self.analyzer.freqs)).start()
+            self.bus = self.worker.bus
+        # Do barramento em diante, qualquer saída (inclusive Ctrl-C) fecha e remove a memória compartilhada
+        try:
+            self.runtime = self.build_runtime()
+            if not self.feature_bus:
+                self.analyzer.start_playback()
+            if self.worker and self.analyzer.audio_start_time is not None:
+                self.worker.clock.start(self.analyzer.get_current_time())
+            self.last_time = self.frame_time()
+            self.runtime.run()
+        finally:
+            if self.worker:
+                self.worker.stop()
+            elif self.bus:
+                self.bus.close()
+        
+        for line in self.runtime.summary():
+            print(f"Runtime: {line}")
+        quality = self.quality.stats()
+        print(f"Qualidade: nível {quality['tier']}/{quality['tiers'] - 1} "
+              f"({quality['downgrades']} reduções, {quality['upgrades']} aumentos)")
+        sprites = sprite_cache.stats()
+        print(f"Sprites: {sprites['sprites']} em cache, acertos {sprites['hit_ratio']:.1%}")
         pygame.quit()
 
 def main():
@@ -0,0 +1,4 @@
+"""
+MUSTEM CORE
+Componentes compartilhados entre o dashboard assistivo e a visualização artística
+"""
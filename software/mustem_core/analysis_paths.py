@@ -0,0 +1,201 @@
+"""
+CAMINHOS DE ANÁLISE COM LATÊNCIAS DIFERENTES
+Um caminho rápido (hop curto) para motores táteis e batidas, e um caminho
+de janela longa para espectros e DNA musical, ambos lendo o mesmo buffer de captura
+"""
+
+import time
+import numpy as np
+from collections import deque
+
+from mustem_core.timestep import decay
+
+# Caminho tátil: hop curto, janela suficiente para resolver o kick (~43 Hz por bin)
+TACTILE_HOP = 256
+TACTILE_WINDOW = 1024
+TACTILE_LATENCY_BUDGET_MS = 20.0
+
+# Caminho visual: orçamento compatível com a latência total do sistema (<60ms)
+VISUAL_LATENCY_BUDGET_MS = 60.0
+
+# Motores do sistema tátil (mesma separação do firmware tactile_4motors.ino)
+# (nome, freq_min, freq_max, expoente de Stevens, PWM máximo)
+TACTILE_MOTORS = [
+    ('kick', 20, 80, 0.9, 255),        # Bumbo, batidas principais
+    ('bass', 80, 300, 0.7, 240),       # Linha de baixo constante
+    ('voice', 300, 2000, 0.8, 200),    # Vocal, guitarra, melodia
+    ('treble', 2000, 8000, 0.75, 180), # Pratos, hi-hat, detalhes
+]
+TACTILE_PWM_MIN = 80        # PWM mínimo para sentir
+TACTILE_THRESHOLD = 0.15    # Nível normalizado mínimo para acionar o motor
+TACTILE_PEAK_TIME_CONSTANT = 16.7  # τ (s) do pico de normalização (0.999 por quadro a 60 fps)
+
+# Máximo de hops processados por chamada (evita rajadas após pausa/seek)
+MAX_PENDING_HOPS = 16
+
+
+class LatencyMeter:
+    """Mede a latência de um caminho de análise e compara com seu orçamento"""
+
+    def __init__(self, name, budget_ms, window_ms=0.0, history=120):
+        self.name = name
+        self.budget_ms = budget_ms
+        self.window_ms = window_ms  # Atraso algorítmico (janela / hop)
+        self.samples = deque(maxlen=history)
+        self.last_ms = 0.0
+        self.over_budget = 0
+        self.count = 0
+        self._started = None
+
+    def start(self):
+        self._started = time.perf_counter()
+
+    def stop(self):
+        if self._started is None:
+            return self.last_ms
+        compute_ms = (time.perf_counter() - self._started) * 1000.0
+        self._started = None
+        return self.record(compute_ms)
+
+    def record(self, compute_ms):
+        """Registra uma medição; latência = processamento + atraso algorítmico"""
+        latency_ms = compute_ms + self.window_ms
+        self.last_ms = latency_ms
+        self.samples.append(latency_ms)
+        self.count += 1
+        if latency_ms > self.budget_ms:
+            self.over_budget += 1
+        return latency_ms
+
+    def stats(self):
+        if not self.samples:
+            avg = p95 = peak = 0.0
+        else:
+            values = np.array(self.samples)
+            avg = float(np.mean(values))
+            p95 = float(np.percentile(values, 95))
+            peak = float(np.max(values))
+        return {
+            'name': self.name,
+            'budget_ms': self.budget_ms,
+            'last_ms': self.last_ms,
+            'avg_ms': avg,
+            'p95_ms': p95,
+            'max_ms': peak,
+            'over_budget': self.over_budget,
+            'count': self.count,
+        }
+
+
+class TactilePath:
+    """Caminho rápido: intensidades dos 4 motores e eventos de batida a cada hop curto"""
+
+    def __init__(self, sample_rate, hop_size=TACTILE_HOP, window_size=TACTILE_WINDOW,
+                 budget_ms=TACTILE_LATENCY_BUDGET_MS, beat_threshold=1.5, beat_refractory=0.2):
+        self.sample_rate = sample_rate
+        self.hop_size = hop_size
+        self.window_size = window_size
+        self.window = np.hanning(window_size)
+
+        # Atraso de grupo da janela simétrica (metade da janela)
+        window_ms = (window_size / 2) / sample_rate * 1000.0
+        self.latency = LatencyMeter('tactile', budget_ms, window_ms)
+
+        # Matriz bin -> motor para somar energia de todas as janelas de uma vez
+        freqs = np.fft.rfftfreq(window_size, 1.0 / sample_rate)
+        self.band_matrix = np.zeros((len(freqs), len(TACTILE_MOTORS)))
+        for m, (_, low, high, _, _) in enumerate(TACTILE_MOTORS):
+            mask = (freqs >= low) & (freqs < high)
+            if not np.any(mask):
+                mask[np.argmin(np.abs(freqs - (low + high) / 2))] = True
+            self.band_matrix[mask, m] = 1.0 / np.sum(mask)
+        self.exponents = np.array([m[3] for m in TACTILE_MOTORS])
+        self.pwm_max = np.array([m[4] for m in TACTILE_MOTORS], dtype=float)
+
+        # Normalização adaptativa por motor (pico com decaimento lento, por hop de áudio)
+        self.band_peak = np.full(len(TACTILE_MOTORS), 1e-6)
+        self.peak_decay = float(decay(hop_size / sample_rate, TACTILE_PEAK_TIME_CONSTANT))
+
+        # Detecção de batidas por energia (mesma regra do dashboard)
+        self.beat_threshold = beat_threshold
+        self.beat_refractory = beat_refractory
+        self.energy_history = deque(maxlen=40)  # ~230ms com hop de 256
+        self.last_beat_time = -1.0
+
+        self.next_pos = None
+        self.intensities = np.zeros(len(TACTILE_MOTORS), dtype=int)
+        self.levels = np.zeros(len(TACTILE_MOTORS))
+        self.onset_strength = 0.0
+
+    def reset(self):
+        self.next_pos = None
+        self.energy_history.clear()
+        self.last_beat_time = -1.0
+
+    def process(self, audio_data, playhead):
+        """Processa todos os hops pendentes até a posição de reprodução (em amostras)"""
+        self.latency.start()
+        events = []
+
+        # Janela termina no playhead (causal, como num buffer de captura)
+        last_end = min(int(playhead), len(audio_data))
+        if self.next_pos is None or last_end < self.next_pos - self.hop_size \
+                or last_end - self.next_pos > MAX_PENDING_HOPS * self.hop_size:
+            self.next_pos = last_end  # Início, seek ou retomada após pausa
+
+        ends = np.arange(self.next_pos, last_end + 1, self.hop_size)
+        ends = ends[ends >= self.window_size]
+        if len(ends) > 0:
+            self.next_pos = int(ends[-1]) + self.hop_size
+            frames = np.stack([audio_data[e - self.window_size:e] for e in ends]) * self.window
+
+            magnitude = np.abs(np.fft.rfft(frames, axis=1))
+            band_energy = magnitude @ self.band_matrix
+            frame_energy = np.sum(frames ** 2, axis=1)
+
+            for k, end in enumerate(ends):
+                event = self.detect_beat(frame_energy[k], end / self.sample_rate)
+                if event:
+                    events.append(event)
+
+            self.update_motors(band_energy)
+
+        latency_ms = self.latency.stop()
+        return {
+            'intensities': self.intensities.copy(),
+            'levels': self.levels.copy(),
+            'motors': [m[0] for m in TACTILE_MOTORS],
+            'beat_events': events,
+            'onset_strength': self.onset_strength,
+            'latency_ms': latency_ms,
+        }
+
+    def detect_beat(self, energy, timestamp):
+        """Detecta batida num único hop; retorna evento ou None"""
+        self.energy_history.append(energy)
+        if len(self.energy_history) < 10:
+            return None
+
+        recent = np.fromiter(self.energy_history, dtype=float)
+        avg_energy = np.mean(recent[:-1])
+        self.onset_strength = max(0.0, (energy - avg_energy) / (avg_energy + 1e-10))
+
+        if energy > avg_energy * self.beat_threshold and \
+                (timestamp - self.last_beat_time) > self.beat_refractory:
+            self.last_beat_time = timestamp
+            return {'time': timestamp, 'strength': self.onset_strength}
+        return None
+
+    def update_motors(self, band_energy):
+        """Converte energia por banda (uma linha por hop) em PWM com a curva de potência do firmware
+
+        O pico decai uma vez por hop, independente da taxa de quadros e da cadência da análise
+        """
+        for energy in band_energy:
+            self.band_peak = np.maximum(self.band_peak * self.peak_decay, energy)
+        self.levels = band_energy[-1] / self.band_peak
+
+        active = self.levels > TACTILE_THRESHOLD
+        norm = np.clip((self.levels - TACTILE_THRESHOLD) / (1.0 - TACTILE_THRESHOLD), 0.0, 1.0)
+        pwm = TACTILE_PWM_MIN + np.power(norm, self.exponents) * (self.pwm_max - TACTILE_PWM_MIN)
+        self.intensities = np.where(active, pwm, 0).astype(int)
@@ -0,0 +1,183 @@
+"""
+PROCESSO DE ANÁLISE
+Os analisadores (FFT, instrumentos, DNA musical) rodam num processo próprio,
+com seu GIL e seu núcleo, e publicam cada quadro no barramento de
+características (feature_bus). O app só lê o quadro mais recente: uma
+passada lenta de análise atrasa as características, nunca o quadro.
+
+O processo segue o relógio da mídia publicado no barramento por quem toca o
+áudio; parado ou pausado, ele não publica quadros novos. Numa sessão (tools/
+session.py) é o próprio processo de análise que toca o áudio e publica o
+relógio, e qualquer número de visões se inscreve no barramento: cada uma com
+sua janela, todas no relógio de quem toca
+
+Seleção (variável de ambiente, sobreposta pelos argumentos):
+    MUSTEM_ANALYSIS=process     análise em processo separado
+    MUSTEM_ANALYSIS=inline      análise no processo do app (padrão)
+    MUSTEM_FEATURE_BUS=<nome>   visão inscrita no barramento de uma sessão (sem análise nem áudio)
+"""
+
+import io
+import os
+import time
+import contextlib
+import multiprocessing
+
+from mustem_core.feature_bus import FeatureBus
+from mustem_core.feature_schema import live_columns, pack_live
+from mustem_core.timestep import SIMULATION_HZ
+
+ANALYSIS_HZ = SIMULATION_HZ  # Mesma cadência da análise no processo do app
+STOP_TIMEOUT = 2.0
+
+# Papel do analisador -> método que produz o dicionário de características
+ANALYZE_METHODS = {'dashboard': 'analyze', 'artistic': 'analyze_gently'}
+
+
+def analysis_mode(mode=None):
+    """'process' ou 'inline' (padrão: MUSTEM_ANALYSIS)"""
+    if mode is None:
+        mode = os.environ.get('MUSTEM_ANALYSIS', 'inline')
+    if mode not in ('process', 'inline'):
+        raise ValueError(f"Modo de análise desconhecido: {mode}")
+    return mode
+
+
+def feature_bus_name(name=None):
+    """Barramento de uma sessão em que a visão se inscreve (padrão: MUSTEM_FEATURE_BUS)"""
+    if name is None:
+        name = os.environ.get('MUSTEM_FEATURE_BUS')
+    return name or None
+
+
+def subscribe(name, role, columns=()):
+    """Visão inscrita no barramento de outro processo; confere se ele publica o que ela lê"""
+    bus = FeatureBus.attach(name)
+    missing = [column for column in columns if column not in bus.dtype.names]
+    if role not in bus.metadata.get('roles', ()) or missing:
+        bus.close()
+        raise ValueError(f"Barramento {name} não publica as características de '{role}' {missing or ''}")
+    return bus
+
+
+def play_audio(audio_file, sample_rate):
+    """Toca o arquivo neste processo; None se não há saída de áudio (a sessão segue em silêncio)"""
+    try:
+        import pygame
+        pygame.mixer.init(frequency=sample_rate, size=-16, channels=1, buffer=512)
+        pygame.mixer.music.load(audio_file)
+        pygame.mixer.music.play()
+        return pygame.mixer.music
+    except Exception as e:
+        print(f"Áudio indisponível ({e}); sessão segue em silêncio")
+        return None
+
+
+def follow_requests(clock, music):
+    """Atende pausa/retomada pedida por qualquer visão (áudio e relógio juntos)"""
+    if clock.requested == clock.running:
+        return
+    if clock.requested:
+        if music is not None:
+            music.unpause()
+        clock.resume()
+    else:
+        if music is not None:
+            music.pause()
+        clock.pause()
+
+
+def analyze(role, analyzer):
+    try:
+        return getattr(analyzer, ANALYZE_METHODS[role])()
+    except Exception as e:
+        if role != 'artistic':
+            raise
+        print(f"⚠️ Erro na análise: {e}")  # Mesmo fallback da visualização artística
+        return analyzer.get_serene_state()
+
+
+def worker_main(bus_name, audio_file, factories, rate=ANALYSIS_HZ, playback=False):
+    """Corpo do processo: analisa no instante do relógio da mídia e publica no barramento
+
+    playback: este processo toca o áudio e publica o relógio (sessão com várias visões)
+    """
+    bus = FeatureBus.attach(bus_name)
+
+    # Os analisadores imprimem mensagens de boas-vindas; o app já imprimiu as suas
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyzers = {role: factory(audio_file, playback=False) for role, factory in factories.items()}
+
+    music = None
+    if playback:
+        music = play_audio(audio_file, next(iter(analyzers.values())).sample_rate)
+        bus.clock.start(0.0)
+
+    period = 1.0 / rate
+    deadline = time.perf_counter()
+    last_time = None
+    try:
+        while not bus.closed:
+            if playback:
+                follow_requests(bus.clock, music)
+            media_time = bus.clock.now()
+            if media_time != last_time:
+                features = {}
+                for role, analyzer in analyzers.items():
+                    analyzer.set_media_time(media_time)
+                    features[role] = analyze(role, analyzer)
+                # Só depois da análise: exceções não deixam a posição com sequência ímpar
+                pack_live(bus.begin(), features.get('dashboard'), features.get('artistic'), media_time)
+                bus.commit()
+                last_time = media_time
+
+            deadline += period
+            delay = deadline - time.perf_counter()
+            if delay < 0:
+                deadline = time.perf_counter()  # Atrasado: segue do agora, sem rajada
+            time.sleep(max(0.0, delay))
+    finally:
+        bus.close()
+
+
+class AnalysisWorker:
+    """Processo de análise e o barramento que ele preenche (criado e removido por quem o inicia)
+
+    factories: papel ('dashboard' / 'artistic') -> classe do analisador, chamada como
+    factory(audio_file, playback=False) no processo novo
+    playback: o processo novo toca o áudio e publica o relógio (visões se inscrevem pelo nome do barramento)
+    """
+
+    def __init__(self, audio_file, factories, magnitude_bins=0, rate=ANALYSIS_HZ, playback=False):
+        self.bus = FeatureBus.create(live_columns(magnitude_bins), metadata={'roles': list(factories)})
+        context = multiprocessing.get_context('spawn')  # Processo limpo: sem pygame/SDL herdados
+        self.process = context.Process(target=worker_main, name='mustem-analysis', daemon=True,
+                                       args=(self.bus.name, audio_file, factories, rate, playback))
+
+    @property
+    def clock(self):
+        return self.bus.clock
+
+    def start(self):
+        try:
+            self.process.start()
+        except BaseException:
+            self.bus.close()
+            raise
+        return self
+
+    def stop(self, timeout=STOP_TIMEOUT):
+        """Encerra o processo; o barramento é fechado e removido mesmo se a espera for interrompida (Ctrl-C)"""
+        if self.bus.closed_here:
+            return
+        try:
+            self.bus.control['closed'] = 1
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        finally:
+            self.bus.close()
+
+    def stats(self):
+        return dict(self.bus.stats(), alive=self.process.is_alive())
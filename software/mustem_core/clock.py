@@ -0,0 +1,39 @@
+"""
+RELÓGIO DE ANIMAÇÃO
+Fases de animação (fluxo laminar, pulsos, limpezas periódicas) leem este
+relógio em vez de time.time(). Ao vivo ele segue o relógio de parede; na
+renderização offline é fixado no tempo de mídia derivado das amostras,
+para que cada quadro dependa só da sua posição no áudio
+"""
+
+import time
+
+
+class AnimationClock:
+    """Relógio de parede, ou tempo fixado pelo renderizador offline"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.fixed = None
+
+    def now(self):
+        """Segundos (mesma escala de time.time() ao vivo)"""
+        return time.time() if self.fixed is None else self.fixed
+
+    def elapsed(self):
+        """Segundos desde o início (substitui pygame.time.get_ticks() / 1000)"""
+        return self.now() - self.started
+
+    def set(self, seconds):
+        """Fixa o relógio (modo offline); o início passa a ser o instante zero"""
+        if self.fixed is None:
+            self.started = 0.0
+        self.fixed = seconds
+
+    def release(self):
+        """Volta ao relógio de parede"""
+        self.fixed = None
+        self.started = time.time()
+
+
+animation_clock = AnimationClock()
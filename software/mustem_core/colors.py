@@ -0,0 +1,165 @@
+"""
+CORES PRÉ-CALCULADAS
+Tabelas de consulta montadas na importação substituem colorsys e as tuplas
+com clamping nos caminhos quentes: pastel (matiz × energia), HSV da faixa
+pastel (matiz × saturação × brilho, usada pelas cores que fluem) e alpha
+(alpha × canal). Cada função escalar tem uma versão array-in/array-out
+para partículas e geometria; o erro fica dentro do passo de quantização
+"""
+
+import numpy as np
+
+HUE_STEPS = 360     # Matiz em passos de 1°
+ENERGY_STEPS = 64   # Energia 0-1 da paleta pastel
+ALPHA_STEPS = 128   # Alpha 0-1 (erro máximo de 1 nível por canal)
+
+# Faixa de saturação/brilho coberta pela tabela HSV (as paletas delicadas vivem aqui)
+SATURATION_RANGE = (0.0, 0.5)
+VALUE_RANGE = (0.5, 1.0)
+SV_STEPS = 64
+
+
+def hsv_to_rgb_array(h, s, v):
+    """colorsys.hsv_to_rgb vetorizado; retorna (N, 3) em 0-1"""
+    h, s, v = np.broadcast_arrays(*(np.asarray(c, dtype=float) for c in (h, s, v)))
+    i = np.floor(h * 6.0)
+    f = h * 6.0 - i
+    i = i.astype(int) % 6
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    r = np.choose(i, [v, q, p, p, t, v])
+    g = np.choose(i, [t, v, v, q, p, p])
+    b = np.choose(i, [p, p, t, v, v, q])
+    return np.stack((r, g, b), axis=-1)  # s == 0 cai em p = q = t = v, como no colorsys
+
+
+def to_rgb255(rgb):
+    """Canais 0-1 -> inteiros 0-255 (mesmo truncamento de int(c * 255))"""
+    return np.clip((np.asarray(rgb) * 255).astype(int), 0, 255)
+
+
+def _pastel_sv(energy):
+    return 0.15 + energy * 0.25, 0.75 + energy * 0.2
+
+
+def _build_tables():
+    hues = np.arange(HUE_STEPS + 1) / HUE_STEPS
+    energies = np.arange(ENERGY_STEPS + 1) / ENERGY_STEPS
+    h, e = np.meshgrid(hues, energies, indexing='ij')
+    saturation, value = _pastel_sv(e)
+    pastel = to_rgb255(hsv_to_rgb_array(h, saturation, value)).astype(np.uint8)
+
+    # Cada canal é v * (1 - s * w(h)); w depende só da matiz
+    saturations = np.linspace(*SATURATION_RANGE, SV_STEPS)
+    values = np.linspace(*VALUE_RANGE, SV_STEPS)
+    weights = 1.0 - hsv_to_rgb_array(hues, 1.0, 1.0)
+    rgb = values[None, None, :, None] * (1.0 - saturations[None, :, None, None] * weights[:, None, None, :])
+    hsv = to_rgb255(rgb).astype(np.uint8)
+
+    alphas = np.arange(ALPHA_STEPS + 1) / ALPHA_STEPS
+    alpha = (alphas[:, None] * np.arange(256)[None, :]).astype(np.uint8)
+    return pastel, hsv, alpha
+
+
+PASTEL_LUT, HSV_LUT, ALPHA_LUT = _build_tables()
+
+# Versões em listas Python para consultas escalares sem passar pelo NumPy
+_PASTEL_ROWS = [[tuple(color) for color in row] for row in PASTEL_LUT.tolist()]
+_ALPHA_ROWS = ALPHA_LUT.tolist()
+
+
+def _hue_index(hues):
+    return np.rint(np.clip(hues, 0.0, 1.0) * HUE_STEPS).astype(int)
+
+
+def _level_index(levels, steps):
+    return np.rint(np.clip(levels, 0.0, 1.0) * steps).astype(int)
+
+
+def _sv_index(values, value_range):
+    low, high = value_range
+    scaled = (np.asarray(values, dtype=float) - low) / (high - low) * (SV_STEPS - 1)
+    return np.rint(np.clip(scaled, 0, SV_STEPS - 1)).astype(int)
+
+
+# --- Escalares -------------------------------------------------------------
+
+def pastel(hue, energy):
+    """Cor pastel suave (matiz e energia já validadas em 0-1)"""
+    return _PASTEL_ROWS[int(hue * HUE_STEPS + 0.5)][int(energy * ENERGY_STEPS + 0.5)]
+
+
+def hsv(hue, saturation, value):
+    """Cor da faixa pastel pela tabela HSV; matiz em 0-1 (cíclica)"""
+    low_s, high_s = SATURATION_RANGE
+    low_v, high_v = VALUE_RANGE
+    si = int((saturation - low_s) / (high_s - low_s) * (SV_STEPS - 1) + 0.5)
+    vi = int((value - low_v) / (high_v - low_v) * (SV_STEPS - 1) + 0.5)
+    hi = int((hue % 1.0) * HUE_STEPS + 0.5)
+    return tuple(HSV_LUT[hi, min(max(si, 0), SV_STEPS - 1), min(max(vi, 0), SV_STEPS - 1)].tolist())
+
+
+def scale(color, alpha):
+    """Cor multiplicada por alpha (0-1) com clamping, como safe_color/with_alpha"""
+    row = _ALPHA_ROWS[int(min(1.0, max(0.0, alpha)) * ALPHA_STEPS + 0.5)]
+    r, g, b = color[:3]
+    return (row[min(255, max(0, int(r)))], row[min(255, max(0, int(g)))], row[min(255, max(0, int(b)))])
+
+
+def blend(color1, color2, ratio):
+    """Interpolação linear entre duas cores"""
+    r1, g1, b1 = color1[:3]
+    r2, g2, b2 = color2[:3]
+    return (
+        int(r1 * (1 - ratio) + r2 * ratio),
+        int(g1 * (1 - ratio) + g2 * ratio),
+        int(b1 * (1 - ratio) + b2 * ratio)
+    )
+
+
+# --- Arrays ----------------------------------------------------------------
+
+def pastel_array(hues, energies, alphas=None):
+    """Cores pastel (N, 3) para matizes/energias em arrays; alpha opcional"""
+    colors = PASTEL_LUT[_hue_index(hues), _level_index(energies, ENERGY_STEPS)]
+    return colors.astype(int) if alphas is None else scale_array(colors, alphas)
+
+
+def hsv_array(hues, saturations, values, alphas=None):
+    """Cores (N, 3) da faixa pastel pela tabela HSV"""
+    hues = np.mod(hues, 1.0)
+    colors = HSV_LUT[_hue_index(hues), _sv_index(saturations, SATURATION_RANGE),
+                     _sv_index(values, VALUE_RANGE)]
+    return colors.astype(int) if alphas is None else scale_array(colors, alphas)
+
+
+def flowing_array(hues, time_phases, frequency_influences, energies, alphas=None):
+    """flowing_harmonic_color para arrays (mesmas fórmulas de fluxo)"""
+    hues = np.clip(np.asarray(hues, dtype=float), 0.0, 1.0)
+    energies = np.asarray(energies, dtype=float)
+    energies = np.clip(np.where(energies == 0, 0.5, energies), 0.0, 1.0)
+    time_phases = np.asarray(time_phases, dtype=float)
+
+    flowing_hue = hues + np.sin(time_phases * 0.3) * 0.15 + np.asarray(frequency_influences) * 0.08
+    saturation = 0.12 + energies * 0.28 + np.sin(time_phases * 0.5) * 0.06
+    value = 0.72 + energies * 0.18 + np.sin(time_phases * 0.7) * 0.05
+    return hsv_array(flowing_hue, saturation, value, alphas)
+
+
+def scale_array(colors, alphas):
+    """Cores (N, 3) multiplicadas por alphas (escalar ou N) com clamping"""
+    colors = np.clip(np.asarray(colors)[..., :3], 0, 255).astype(int)
+    alphas = _level_index(alphas, ALPHA_STEPS)
+    if np.ndim(alphas) > 0:
+        alphas = alphas[..., None]
+    return ALPHA_LUT[alphas, colors].astype(int)
+
+
+def blend_array(colors1, colors2, ratios):
+    """Interpolação linear de cores (N, 3); ratios escalar ou N"""
+    ratios = np.asarray(ratios, dtype=float)
+    if ratios.ndim > 0:
+        ratios = ratios[..., None]
+    mixed = np.asarray(colors1)[..., :3] * (1 - ratios) + np.asarray(colors2)[..., :3] * ratios
+    return mixed.astype(int)
@@ -0,0 +1,284 @@
+"""
+COMPOSITOR EM CAMADAS
+Cada componente visual desenha em sua própria camada e declara com que
+frequência muda: estática (uma vez), lenta (quando a chave muda ou expira)
+ou por quadro. Camadas em cache são apenas copiadas para a tela e moduladas
+com flags de blend, em vez de serem rasterizadas de novo a cada quadro.
+Camadas que informam seu dano (retângulo + assinatura do conteúdo) permitem
+apresentar só as regiões alteradas com display.update(rects).
+Com escala de renderização as camadas desenham numa tela interna menor
+(ou maior, em janelas grandes), ampliada uma vez na apresentação.
+Camadas de rastro guardam o próprio buffer entre quadros: ele é esmaecido
+e recebe só a geometria nova (mustem_core.trails)
+"""
+
+import time
+import numpy as np
+import pygame
+
+from mustem_core.render_scale import ScaledSurface, present_canvas, layout_size, layout_rect
+from mustem_core.trails import TrailFader
+
+STATIC = 'static'   # Desenhada uma única vez (ou após invalidate)
+SLOW = 'slow'       # Redesenhada quando a chave muda ou após max_age segundos
+PER_FRAME = 'frame' # Desenhada direto no destino a cada quadro
+TRAIL = 'trail'     # Buffer persistente: esmaecido a cada quadro, render desenha só o que é novo
+
+FULL_PRESENT_RATIO = 0.5  # Acima desta fração da tela alterada, flip completo
+COVERAGE_CELL = 8         # Resolução (pixels) da grade que estima a área alterada sem contar sobreposições
+
+
+class Layer:
+    """Camada do compositor; render(surface) desenha em coordenadas de tela"""
+
+    def __init__(self, name, render, mode=PER_FRAME, rect=None, transparent=False,
+                 key=None, max_age=None, blend=0, tint=None, damage=None, fade=None):
+        self.name = name
+        self.render = render
+        self.mode = mode
+        self.rect = pygame.Rect(rect) if rect else None  # Região ocupada (padrão: tela inteira)
+        self.transparent = transparent
+        self.key = key            # Função -> valor hashable; mudança força novo desenho
+        self.max_age = max_age
+        self.blend = blend        # special_flags usados ao copiar a camada
+        self.tint = tint          # Função -> cor preenchida sob a camada antes do blend
+        self.damage = damage      # Função -> (Rect ou lista de Rects ou None, assinatura ou None) do que foi desenhado
+        self.fade = fade          # Função -> fração do rastro mantida neste quadro (camadas TRAIL)
+        self.fader = TrailFader() if mode == TRAIL else None
+        self.visible = True
+
+        self.surface = None
+        self._key = None
+        self._rendered_at = None
+        self._damage_rect = None
+        self._damage_signature = None
+
+        # Estatísticas
+        self.renders = 0
+        self.reuses = 0
+
+    def invalidate(self):
+        self._rendered_at = None
+
+    def is_cached(self):
+        return self.mode != PER_FRAME
+
+    def needs_render(self, key, now):
+        if self._rendered_at is None:
+            return True
+        if self.mode == SLOW:
+            if key != self._key:
+                return True
+            if self.max_age is not None and now - self._rendered_at >= self.max_age:
+                return True
+        return False
+
+    def dirty_rects(self):
+        """Regiões alteradas desde o quadro anterior (None = desconhecido, tela inteira)"""
+        if self.damage is None:
+            return None
+        rects, signature = self.damage()
+        if rects is None:
+            rects = []
+        elif isinstance(rects, pygame.Rect):
+            rects = [rects]
+
+        previous = self._damage_rect
+        if rects == previous and signature is not None and signature == self._damage_signature:
+            return []
+        self._damage_rect, self._damage_signature = rects, signature
+        if rects == previous:
+            return list(rects)
+        return (previous or []) + rects
+
+    def refresh(self, size, now, factor=1.0):
+        """Garante que a superfície em cache está atualizada; True se foi redesenhada"""
+        key = self.key() if self.key else None
+        if not self.needs_render(key, now):
+            self.reuses += 1
+            return False
+
+        self.ensure_surface(size, factor)
+        area = self.rect or layout_rect(self.surface)
+        self.surface.fill((0, 0, 0, 0) if self.transparent else (0, 0, 0), area)
+        self.render(self.surface)
+
+        self._key = key
+        self._rendered_at = now
+        self.renders += 1
+        return True
+
+    def ensure_surface(self, size, factor=1.0):
+        """Cria a superfície da camada (nova = preta ou transparente) se faltar ou mudar de tamanho"""
+        if self.surface is not None and layout_size(self.surface) == size:
+            return False
+        flags = pygame.SRCALPHA if self.transparent else 0
+        if factor != 1.0:
+            self.surface = ScaledSurface(size, factor, flags)
+        else:
+            self.surface = pygame.Surface(size, flags)
+        if factor == 1.0 and pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha() if self.transparent else self.surface.convert()
+        return True
+
+    def advance(self, size, factor=1.0):
+        """Camada de rastro: esmaece o buffer e desenha a geometria nova; retorna a região da camada"""
+        if not self.ensure_surface(size, factor):
+            self.fader.fade(self.surface, self.rect or layout_rect(self.surface), self.fade())
+        self.render(self.surface)
+        self.renders += 1
+        return self.rect or layout_rect(self.surface)
+
+    def stats(self):
+        return {'name': self.name, 'mode': self.mode, 'renders': self.renders, 'reuses': self.reuses}
+
+
+class Compositor:
+    """Pilha ordenada de camadas (a primeira fica no fundo)"""
+
+    def __init__(self, size, full_ratio=FULL_PRESENT_RATIO, render_scale=1.0, display_size=None):
+        self.size = tuple(size)                     # Layout (coordenadas dos componentes)
+        self.display_size = tuple(display_size or size)
+        self.layers = []
+        self.full_ratio = full_ratio
+        self.force_full = True
+        self.set_render_scale(render_scale)
+
+        # Custo da ampliação da tela interna
+        self.upscales = 0
+        self.upscale_seconds = 0.0
+
+        # Estatísticas de apresentação
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.idle_frames = 0
+        self.presented_pixels = 0
+
+    def add(self, layer):
+        self.layers.append(layer)
+        return layer
+
+    def __getitem__(self, name):
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        raise KeyError(name)
+
+    def invalidate(self):
+        for layer in self.layers:
+            layer.invalidate()
+        self.force_full = True
+
+    def set_render_scale(self, render_scale):
+        """Resolução interna = janela × escala; igual ao layout e à janela dispensa a tela interna"""
+        self.render_scale = render_scale
+        factor = self.display_size[0] * render_scale / self.size[0]
+        self.factor = 1.0 if abs(factor - 1.0) < 1e-6 else factor
+        if self.factor != 1.0:
+            self.canvas = ScaledSurface(self.size, self.factor)
+        elif self.display_size != self.size:
+            self.canvas = pygame.Surface(self.size)   # Layout em 1:1, só a ampliação final
+        else:
+            self.canvas = None
+        for layer in self.layers:
+            layer.surface = None
+        self.invalidate()
+
+    def compose(self, target, now=None):
+        """Desenha todas as camadas visíveis no destino; retorna os retângulos alterados"""
+        now = time.perf_counter() if now is None else now
+        if self.canvas is None:
+            return self.compose_layers(target, now)
+
+        self.compose_layers(self.canvas, now)
+        started = time.perf_counter()
+        present_canvas(self.canvas, target)
+        self.upscale_seconds += time.perf_counter() - started
+        self.upscales += 1
+        # A ampliação reescreve a janela inteira
+        self.force_full = True
+        return [pygame.Rect((0, 0), self.size)]
+
+    def compose_layers(self, target, now):
+        screen_rect = pygame.Rect((0, 0), self.size)
+        dirty = []
+
+        for layer in self.layers:
+            if not layer.visible:
+                continue
+
+            if layer.mode == TRAIL:
+                area = layer.advance(self.size, self.factor)
+                target.blit(layer.surface, area.topleft, area, special_flags=layer.blend)
+                dirty.append(area)
+                continue
+
+            if not layer.is_cached():
+                layer.render(target)
+                rects = layer.dirty_rects()
+                if rects is None:
+                    self.force_full = True
+                else:
+                    dirty.extend(rects)
+                continue
+
+            if layer.refresh(self.size, now, self.factor):
+                dirty.append(layer.rect or screen_rect)
+            area = layer.rect or layout_rect(layer.surface)
+
+            # Modulação: cor de base preenchida e camada combinada por cima (ex.: BLEND_MULT)
+            if layer.tint is not None:
+                target.fill(layer.tint(), area)
+
+            target.blit(layer.surface, area.topleft, area, special_flags=layer.blend)
+
+            # Camada modulada muda a cada quadro junto com a cor
+            if layer.tint is not None:
+                dirty.append(area)
+
+        return dirty
+
+    def present(self, dirty):
+        """Apresenta só as regiões alteradas; flip completo quando a maior parte mudou (sempre, com tela interna)"""
+        screen_area = self.size[0] * self.size[1]
+        screen_rect = pygame.Rect((0, 0), self.size)
+        rects = [r.clip(screen_rect) for r in dirty]
+        rects = [r for r in rects if r.width and r.height]
+        changed = self.coverage(rects)
+
+        if self.force_full or changed > screen_area * self.full_ratio:
+            pygame.display.flip()
+            self.force_full = False
+            self.full_frames += 1
+            self.presented_pixels += screen_area
+        elif rects:
+            pygame.display.update(rects)
+            self.partial_frames += 1
+            self.presented_pixels += changed
+        else:
+            self.idle_frames += 1
+
+    def coverage(self, rects):
+        """Área (pixels) coberta pela união dos retângulos, em células da grade"""
+        if not rects:
+            return 0
+        cell = COVERAGE_CELL
+        grid = np.zeros((-(-self.size[1] // cell), -(-self.size[0] // cell)), dtype=bool)
+        for r in rects:
+            grid[r.top // cell:-(-r.bottom // cell), r.left // cell:-(-r.right // cell)] = True
+        return int(np.count_nonzero(grid)) * cell * cell
+
+    def present_stats(self):
+        frames = self.full_frames + self.partial_frames + self.idle_frames
+        return {
+            'render_scale': self.render_scale,
+            'upscale_ms': self.upscale_seconds * 1000.0 / self.upscales if self.upscales else 0.0,
+            'full_frames': self.full_frames,
+            'partial_frames': self.partial_frames,
+            'idle_frames': self.idle_frames,
+            'presented_fraction': self.presented_pixels / (frames * self.size[0] * self.size[1])
+                                  if frames else 0.0,
+        }
+
+    def stats(self):
+        return [layer.stats() for layer in self.layers if layer.is_cached()]
@@ -0,0 +1,95 @@
+"""
+DESENHO EM COORDENADAS DE LAYOUT
+Mesmas assinaturas de pygame.draw. Numa ScaledSurface (tela interna com
+escala de renderização) pontos, raios e espessuras são convertidos para
+pixels internos e o retângulo alterado volta em coordenadas de layout; em
+qualquer outra superfície a chamada vai direto para pygame.draw
+"""
+
+import numpy as np
+import pygame
+
+from mustem_core.render_scale import ScaledSurface
+
+
+def _point(p, f):
+    return (p[0] * f, p[1] * f)
+
+
+def _points(points, f):
+    if isinstance(points, np.ndarray):
+        return (points * f).tolist()
+    return [(p[0] * f, p[1] * f) for p in points]
+
+
+def _width(width, f):
+    return max(1, int(round(width * f))) if width > 0 else width
+
+
+def line(surface, color, start, end, width=1):
+    if type(surface) is not ScaledSurface:
+        return pygame.draw.line(surface, color, start, end, width)
+    f = surface.factor
+    return surface.to_layout(pygame.draw.line(surface, color, _point(start, f), _point(end, f), _width(width, f)))
+
+
+def lines(surface, color, closed, points, width=1):
+    if type(surface) is not ScaledSurface:
+        return pygame.draw.lines(surface, color, closed, points, width)
+    f = surface.factor
+    return surface.to_layout(pygame.draw.lines(surface, color, closed, _points(points, f), _width(width, f)))
+
+
+def aaline(surface, color, start, end, blend=1):
+    if type(surface) is not ScaledSurface:
+        return pygame.draw.aaline(surface, color, start, end, blend)
+    f = surface.factor
+    return surface.to_layout(pygame.draw.aaline(surface, color, _point(start, f), _point(end, f), blend))
+
+
+def aalines(surface, color, closed, points, blend=1):
+    if type(surface) is not ScaledSurface:
+        return pygame.draw.aalines(surface, color, closed, points, blend)
+    f = surface.factor
+    return surface.to_layout(pygame.draw.aalines(surface, color, closed, _points(points, f), blend))
+
+
+def circle(surface, color, center, radius, width=0, *corners, **kwargs):
+    if type(surface) is not ScaledSurface:
+        return pygame.draw.circle(surface, color, center, radius, width, *corners, **kwargs)
+    f = surface.factor
+    radius = max(1.0, radius * f) if radius > 0 else radius
+    return surface.to_layout(pygame.draw.circle(surface, color, _point(center, f), radius, _width(width, f),
+                                                *corners, **kwargs))
+
+
+def rect(surface, color, area, width=0, *radii, **kwargs):
+    if type(surface) is not ScaledSurface:
+        return pygame.draw.rect(surface, color, area, width, *radii, **kwargs)
+    f = surface.factor
+    radii = [_width(r, f) for r in radii]
+    kwargs = {name: _width(r, f) for name, r in kwargs.items()}
+    return surface.to_layout(pygame.draw.rect(surface, color, surface.to_pixels(area), _width(width, f),
+                                              *radii, **kwargs))
+
+
+def polygon(surface, color, points, width=0):
+    if type(surface) is not ScaledSurface:
+        return pygame.draw.polygon(surface, color, points, width)
+    f = surface.factor
+    return surface.to_layout(pygame.draw.polygon(surface, color, _points(points, f), _width(width, f)))
+
+
+def ellipse(surface, color, area, width=0):
+    if type(surface) is not ScaledSurface:
+        return pygame.draw.ellipse(surface, color, area, width)
+    f = surface.factor
+    return surface.to_layout(pygame.draw.ellipse(surface, color, surface.to_pixels(area), _width(width, f)))
+
+
+def arc(surface, color, area, start_angle, stop_angle, width=1):
+    if type(surface) is not ScaledSurface:
+        return pygame.draw.arc(surface, color, area, start_angle, stop_angle, width)
+    f = surface.factor
+    return surface.to_layout(pygame.draw.arc(surface, color, surface.to_pixels(area), start_angle, stop_angle,
+                                             _width(width, f)))
@@ -0,0 +1,230 @@
+"""
+BARRAMENTO DE CARACTERÍSTICAS EM MEMÓRIA COMPARTILHADA
+A análise roda em outro processo (outro núcleo, outro GIL) e escreve cada
+quadro de características, com layout fixo (feature_schema.live_columns),
+num anel de memória compartilhada. O renderizador lê o quadro mais recente
+direto da memória compartilhada: sem pickle, sem fila, sem cópia na leitura.
+
+Cada posição do anel tem um seqlock: o escritor torna a sequência ímpar,
+escreve e a torna par. O leitor confere a sequência antes e depois de usar o
+quadro e tenta de novo se ela mudou. Com várias posições, o escritor só volta
+a tocar num quadro depois de escrever outros RING_SLOTS - 1.
+
+O cabeçalho também guarda o relógio da mídia: quem toca o áudio o publica e
+a análise (e qualquer outra visão) segue esse relógio. Visões que não tocam
+áudio pedem pausa/retomada pelo cabeçalho; quem toca atende
+
+Layout:
+    [0, 64)                 controle (sequência, fechamento, relógio)
+    [64, HEADER_BYTES)      esquema JSON: colunas, número de posições, metadados
+    [HEADER_BYTES, ...)     anel: (seq u8, linha) x posições
+"""
+
+import json
+import time
+import numpy as np
+from multiprocessing import shared_memory, resource_tracker
+
+from mustem_core.feature_store import columns_dtype
+
+HEADER_BYTES = 4096
+CONTROL_BYTES = 64
+RING_SLOTS = 8
+READ_RETRIES = 8
+
+CONTROL_DTYPE = np.dtype([
+    ('sequence', '<u8'),        # Quadros publicados
+    ('closed', '<u8'),          # Dono encerrou o barramento
+    ('clock_origin', '<f8'),    # time.time() do instante zero da mídia
+    ('clock_media', '<f8'),     # Instante da mídia congelado (parado ou pausado)
+    ('clock_running', '<u8'),
+    ('writer_heartbeat', '<f8'),  # time.time() da última publicação
+    ('schema_length', '<u8'),
+    ('play_requested', '<u8'),  # Pedido das visões a quem toca o áudio (1 = tocar)
+])
+
+
+def slot_dtype(row_dtype):
+    return np.dtype([('seq', '<u8'), ('row', row_dtype)])
+
+
+class MediaClock:
+    """Relógio da mídia no cabeçalho: um processo toca e publica, os outros leem"""
+
+    def __init__(self, control):
+        self.control = control
+
+    def start(self, media_time=0.0):
+        self.control['clock_origin'] = time.time() - media_time
+        self.control['clock_running'] = 1
+
+    def pause(self):
+        self.control['clock_media'] = self.now()
+        self.control['clock_running'] = 0
+
+    def resume(self):
+        self.start(float(self.control['clock_media']))
+
+    def request(self, playing):
+        """Pede a quem toca o áudio para pausar (False) ou retomar (True)"""
+        self.control['play_requested'] = int(bool(playing))
+
+    @property
+    def requested(self):
+        return bool(self.control['play_requested'])
+
+    @property
+    def running(self):
+        return bool(self.control['clock_running'])
+
+    def now(self):
+        if self.control['clock_running']:
+            return time.time() - float(self.control['clock_origin'])
+        return float(self.control['clock_media'])
+
+
+class FeatureBus:
+    """Anel de quadros de características; create() no processo dono, attach() nos demais"""
+
+    def __init__(self, memory, owner):
+        self.memory = memory
+        self.owner = owner
+        buffer = memory.buf
+        self.control = np.ndarray((), CONTROL_DTYPE, buffer, 0)
+
+        length = int(self.control['schema_length'])
+        schema = json.loads(bytes(buffer[CONTROL_BYTES:CONTROL_BYTES + length]).decode('utf-8'))
+        self.columns = [(name, kind, tuple(shape)) for name, kind, shape in schema['columns']]
+        self.dtype = columns_dtype(self.columns)
+        self.slots = schema['slots']
+        self.metadata = schema.get('metadata', {})
+        self.ring = np.ndarray((self.slots,), slot_dtype(self.dtype), buffer, HEADER_BYTES)
+        self.clock = MediaClock(self.control)
+        self.writing = None
+
+        # Estatísticas
+        self.retries = 0
+
+    @classmethod
+    def create(cls, columns, slots=RING_SLOTS, name=None, metadata=None):
+        dtype = columns_dtype(columns)
+        schema = json.dumps({'columns': [[n, k, list(s)] for n, k, s in columns], 'slots': slots,
+                             'metadata': metadata or {}}).encode('utf-8')
+        if CONTROL_BYTES + len(schema) > HEADER_BYTES:
+            raise ValueError("Esquema grande demais para o cabeçalho do barramento")
+
+        memory = shared_memory.SharedMemory(name=name, create=True,
+                                            size=HEADER_BYTES + slots * slot_dtype(dtype).itemsize)
+        memory.buf[:HEADER_BYTES] = bytes(HEADER_BYTES)
+        memory.buf[CONTROL_BYTES:CONTROL_BYTES + len(schema)] = schema
+        control = np.ndarray((), CONTROL_DTYPE, memory.buf, 0)
+        control['schema_length'] = len(schema)
+        control['clock_origin'] = time.time()
+        control['play_requested'] = 1
+        del control
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        # Processo independente: seu rastreador de recursos apagaria o segmento ao sair.
+        # Filhos do dono (spawn) compartilham o rastreador do dono e não precisam disso
+        shared_tracker = getattr(resource_tracker._resource_tracker, '_fd', None) is not None
+        memory = shared_memory.SharedMemory(name=name)
+        if not shared_tracker:
+            resource_tracker.unregister(memory._name, 'shared_memory')
+        return cls(memory, owner=False)
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    @property
+    def sequence(self):
+        return int(self.control['sequence'])
+
+    @property
+    def closed(self):
+        return bool(self.control['closed'])
+
+    # Escritor (um único processo)
+
+    def begin(self):
+        """Linha da próxima posição para preencher no lugar (sequência ímpar até commit())"""
+        index = self.sequence % self.slots
+        self.ring['seq'][index] += 1
+        self.writing = index
+        # A posição é reaproveitada: zera o quadro antigo para nada dele sobreviver ao novo
+        self.ring['row'][index] = 0
+        return self.ring['row'][index]
+
+    def commit(self):
+        self.ring['seq'][self.writing] += 1
+        self.control['sequence'] += 1
+        self.control['writer_heartbeat'] = time.time()
+        self.writing = None
+
+    def publish(self, row):
+        self.begin()[...] = row
+        self.commit()
+
+    # Leitores
+
+    def expected_seq(self, sequence):
+        """Sequência par da posição do quadro `sequence` (1 = primeiro) enquanto ele estiver lá"""
+        return 2 * ((sequence - 1) // self.slots + 1)
+
+    def latest(self):
+        """(sequência, linha) do quadro completo mais recente, sem cópia; (0, None) se nenhum"""
+        for _ in range(READ_RETRIES):
+            sequence = self.sequence
+            if sequence == 0:
+                return 0, None
+            index = (sequence - 1) % self.slots
+            if int(self.ring['seq'][index]) == self.expected_seq(sequence):
+                return sequence, self.ring['row'][index]
+            self.retries += 1
+        return 0, None
+
+    def intact(self, sequence):
+        """O quadro `sequence` ainda não foi sobrescrito (confirmação do seqlock após o uso)"""
+        index = (sequence - 1) % self.slots
+        return self.sequence - sequence < self.slots and int(self.ring['seq'][index]) == self.expected_seq(sequence)
+
+    def read(self, convert, after=0):
+        """convert(linha) sobre o quadro mais recente, repetido se o escritor o alcançou no meio
+
+        Retorna (sequência, resultado), ou (sequência, None) se não há quadro mais novo que `after`
+        """
+        for _ in range(READ_RETRIES):
+            sequence, row = self.latest()
+            if sequence <= after:
+                return sequence, None
+            result = convert(row)
+            if self.intact(sequence):
+                return sequence, result
+            self.retries += 1
+        return after, None
+
+    @property
+    def closed_here(self):
+        """close() já foi chamado neste processo"""
+        return self.control is None
+
+    def close(self):
+        """Fecha o mapeamento; o dono também marca o barramento como encerrado e o remove (uma vez)"""
+        if self.closed_here:
+            return
+        if self.owner:
+            self.control['closed'] = 1
+        self.control = self.ring = None
+        self.clock = None
+        try:
+            self.memory.close()
+        except BufferError:
+            pass  # Alguém ainda guarda uma linha sem cópia; o mapeamento some com o processo
+        if self.owner:
+            self.memory.unlink()
+
+    def stats(self):
+        return {'sequence': self.sequence if self.control is not None else 0, 'slots': self.slots,
+                'retries': self.retries}
@@ -0,0 +1,223 @@
+"""
+ESQUEMA DE CARACTERÍSTICAS
+Layout fixo (por quadro de análise) das características produzidas pelos
+analisadores do dashboard e da visualização artística
+"""
+
+import numpy as np
+
+GENRE_INDICATORS = ['percussive', 'melodic', 'harmonic', 'rhythmic']
+DRUM_EVENTS = ['kick', 'snare', 'hihat', 'crash', 'overall_percussion']
+MELODIC_EVENTS = ['piano', 'strings', 'harmony', 'melody_strength', 'chord_progression']
+
+# Dimensões escalares do DNA musical (MusicalDNAAnalyzer.musical_dna)
+DNA_DIMENSIONS = [
+    'tonal_center', 'mode_brightness', 'scale_stability',
+    'tempo_stability', 'rhythmic_complexity', 'syncopation_index',
+    'harmonic_richness', 'consonance_ratio', 'chord_complexity',
+    'melodic_range', 'melodic_direction_bias', 'phrase_complexity', 'melodic_repetition',
+    'spectral_centroid', 'spectral_rolloff', 'spectral_flatness', 'timbral_flux',
+    'dynamic_range', 'energy_variance', 'attack_sharpness', 'sustain_character',
+    'phrase_length_avg', 'section_contrast', 'repetition_density',
+    'surprise_quotient', 'structural_complexity',
+]
+
+# (nome, tipo, forma) - uma linha por quadro de análise
+FEATURE_COLUMNS = [
+    ('time', 'f8', ()),
+
+    # Dashboard (EnhancedAudioAnalyzer)
+    ('band_energy', 'f4', (8,)),        # Energia por banda antes de freq_boost/compressão
+    ('spectrum', 'f4', (8,)),
+    ('raw_spectrum', 'f4', (8,)),
+    ('beat', 'u1', ()),
+    ('onset_strength', 'f4', ()),
+    ('total_energy', 'f4', ()),
+    ('spectral_flux', 'f4', ()),
+    ('tempo', 'f4', ()),
+    ('energy_level', 'f4', ()),
+    ('brightness', 'f4', ()),
+    ('genre_indicators', 'f4', (len(GENRE_INDICATORS),)),
+    ('tactile', 'u1', (4,)),            # PWM dos 4 motores (caminho rápido)
+
+    # Visualização artística (GentleAudioAnalyzer)
+    ('gentle_spectrum', 'f4', (16,)),
+    ('dominant_freq', 'f4', ()),
+    ('gentle_energy', 'f4', ()),
+    ('serenity_level', 'f4', ()),
+    ('beat_energy', 'f4', ()),
+    ('harmonic_richness', 'f4', ()),
+    ('melodic_direction', 'f4', ()),
+    ('drums', 'f4', (len(DRUM_EVENTS),)),
+    ('melodic', 'f4', (len(MELODIC_EVENTS),)),
+    ('bass', 'f4', ()),
+    ('rhythm_intensity', 'f4', ()),
+    ('dna', 'f4', (len(DNA_DIMENSIONS),)),
+]
+
+FEATURE_DTYPE = np.dtype([(name, kind, shape) for name, kind, shape in FEATURE_COLUMNS])
+
+# Parâmetros numéricos do mapeamento DNA -> visual (MusicalDNAAnalyzer.visual_dna_mapping)
+VISUAL_DNA_DIMENSIONS = [
+    'spiral_curvature_factor', 'color_evolution_speed', 'geometric_complexity', 'symmetry_breaking_factor',
+]
+
+# Colunas extras do quadro ao vivo: o que os renderizadores leem além do esquema gravado
+LIVE_EXTRA_COLUMNS = [
+    ('spectral_signature', 'f4', (12,)),
+    ('harmonic_profile', 'f4', (7,)),
+    ('flow_rhythm', 'f8', ()),          # Fases acumuladas: f8 para não perder resolução em sessões longas
+    ('breath_cycle', 'f8', ()),
+    ('band_center_freqs', 'f4', (16,)),
+    ('visual_dna', 'f4', (len(VISUAL_DNA_DIMENSIONS),)),
+    ('tactile_beats', 'u1', ()),        # Batidas do caminho tátil neste quadro
+    ('has_instruments', 'u1', ()),      # O quadro trouxe instrumentos (o estado sereno não traz)
+]
+
+
+def live_columns(magnitude_bins=0):
+    """Esquema do quadro ao vivo (barramento de características): gravado + extras + FFT completa"""
+    columns = FEATURE_COLUMNS + LIVE_EXTRA_COLUMNS
+    if magnitude_bins:
+        columns = columns + [('magnitude', 'f4', (magnitude_bins,))]
+    return columns
+
+
+def pack_features(row, dashboard=None, artistic=None, time_seconds=None):
+    """Preenche uma linha estruturada a partir dos dicionários de características"""
+    if time_seconds is not None:
+        row['time'] = time_seconds
+
+    if dashboard:
+        if 'band_energy' in dashboard:
+            row['band_energy'] = dashboard['band_energy']
+        row['spectrum'] = dashboard['spectrum']
+        row['raw_spectrum'] = dashboard['raw_spectrum']
+        row['beat'] = bool(dashboard['beat_detected'])
+        row['onset_strength'] = dashboard['onset_strength']
+        row['total_energy'] = dashboard['total_energy']
+        row['spectral_flux'] = dashboard['spectral_flux']
+
+        identity = dashboard['identity']
+        row['tempo'] = identity['tempo']
+        row['energy_level'] = identity['energy_level']
+        row['brightness'] = identity['brightness']
+        row['genre_indicators'] = [identity['genre_indicators'][k] for k in GENRE_INDICATORS]
+
+        tactile = dashboard.get('tactile')
+        if tactile:
+            row['tactile'] = tactile['intensities']
+
+    if artistic:
+        row['gentle_spectrum'] = artistic['spectrum']
+        row['dominant_freq'] = artistic.get('dominant_freq', 0.0)
+        row['gentle_energy'] = artistic['gentle_energy']
+        row['serenity_level'] = artistic['serenity_level']
+        row['beat_energy'] = artistic['beat_energy']
+        row['harmonic_richness'] = artistic['harmonic_richness']
+        row['melodic_direction'] = artistic['melodic_direction']
+
+        instruments = artistic.get('instruments')
+        if instruments:
+            row['drums'] = [instruments['drums'][k] for k in DRUM_EVENTS]
+            row['melodic'] = [instruments['melodic'][k] for k in MELODIC_EVENTS]
+            row['bass'] = instruments['bass']
+            row['rhythm_intensity'] = instruments['rhythm_intensity']
+
+        dna = artistic.get('musical_dna')
+        if dna:
+            row['dna'] = [dna[k] for k in DNA_DIMENSIONS]
+
+        if not dashboard and artistic.get('tactile'):
+            row['tactile'] = artistic['tactile']['intensities']
+
+
+def pack_live(row, dashboard=None, artistic=None, time_seconds=None):
+    """pack_features mais as colunas que só os renderizadores ao vivo usam"""
+    pack_features(row, dashboard, artistic, time_seconds)
+
+    if dashboard:
+        identity = dashboard['identity']
+        row['spectral_signature'] = identity['spectral_signature']
+        row['harmonic_profile'] = identity['harmonic_profile']
+        if 'magnitude' in row.dtype.names:
+            row['magnitude'] = dashboard['magnitude']
+
+    if artistic:
+        row['flow_rhythm'] = artistic['flow_rhythm']
+        row['breath_cycle'] = artistic['breath_cycle']
+        row['has_instruments'] = bool(artistic.get('instruments'))
+        if 'band_center_freqs' in artistic:
+            row['band_center_freqs'] = artistic['band_center_freqs']
+        visual_dna = artistic.get('visual_dna')
+        if visual_dna:
+            row['visual_dna'] = [visual_dna[k] for k in VISUAL_DNA_DIMENSIONS]
+
+    source = dashboard or artistic
+    tactile = source.get('tactile') if source else None
+    row['tactile_beats'] = min(255, len(tactile['beat_events'])) if tactile else 0
+
+
+def unpack_tactile(row):
+    """Estado do caminho tátil no formato de TactilePath.process (sem níveis nem latência)"""
+    beats = int(row['tactile_beats'])
+    return {
+        'intensities': row['tactile'].astype(int),
+        'beat_events': [{'time': float(row['time']), 'strength': float(row['onset_strength'])}] * beats,
+        'onset_strength': float(row['onset_strength']),
+    }
+
+
+def unpack_dashboard(row):
+    """Linha ao vivo -> dicionário de EnhancedAudioAnalyzer.analyze (cópias, fora da memória compartilhada)"""
+    identity = {
+        'spectral_signature': row['spectral_signature'].astype(float),
+        'harmonic_profile': row['harmonic_profile'].astype(float),
+        'tempo': float(row['tempo']),
+        'energy_level': float(row['energy_level']),
+        'genre_indicators': dict(zip(GENRE_INDICATORS, row['genre_indicators'].tolist())),
+        'brightness': float(row['brightness']),
+    }
+    features = {
+        'spectrum': row['spectrum'].astype(float),
+        'raw_spectrum': row['raw_spectrum'].astype(float),
+        'band_energy': row['band_energy'].astype(float),
+        'beat_detected': bool(row['beat']),
+        'onset_strength': float(row['onset_strength']),
+        'total_energy': float(row['total_energy']),
+        'spectral_flux': float(row['spectral_flux']),
+        'time': float(row['time']),
+        'identity': identity,
+        'tactile': unpack_tactile(row),
+    }
+    if 'magnitude' in row.dtype.names:
+        features['magnitude'] = row['magnitude'].astype(float)
+    return features
+
+
+def unpack_artistic(row):
+    """Linha ao vivo -> dicionário de GentleAudioAnalyzer.analyze_gently (cópias, fora da memória compartilhada)"""
+    tactile = unpack_tactile(row)
+    return {
+        'spectrum': row['gentle_spectrum'].astype(float),
+        'dominant_freq': float(row['dominant_freq']),
+        'band_center_freqs': row['band_center_freqs'].astype(float),
+        'serenity_level': float(row['serenity_level']),
+        'gentle_energy': float(row['gentle_energy']),
+        'flow_rhythm': float(row['flow_rhythm']),
+        'breath_cycle': float(row['breath_cycle']),
+        'current_time': float(row['time']),
+        'beat_energy': float(row['beat_energy']),
+        'harmonic_richness': float(row['harmonic_richness']),
+        'melodic_direction': float(row['melodic_direction']),
+        'instruments': {
+            'drums': dict(zip(DRUM_EVENTS, row['drums'].tolist())),
+            'melodic': dict(zip(MELODIC_EVENTS, row['melodic'].tolist())),
+            'bass': float(row['bass']),
+            'rhythm_intensity': float(row['rhythm_intensity']),
+        } if row['has_instruments'] else None,
+        'musical_dna': dict(zip(DNA_DIMENSIONS, row['dna'].tolist())),
+        'visual_dna': dict(zip(VISUAL_DNA_DIMENSIONS, row['visual_dna'].tolist())),
+        'tactile': tactile,
+        'beat_events': tactile['beat_events'],
+    }
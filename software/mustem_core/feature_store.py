@@ -0,0 +1,204 @@
+"""
+ARMAZENAMENTO COLUNAR DE CARACTERÍSTICAS
+Um diretório por faixa/sessão com um arquivo binário por coluna (lido via memmap),
+um esquema JSON pequeno e um índice temporal para busca O(1) por posição
+
+Layout:
+    faixa.mfs/
+        schema.json         colunas, taxa de quadros, nº de quadros
+        <coluna>.bin        dados brutos (little-endian), uma linha por quadro
+        time_index.bin      int64: último quadro com tempo <= k * index_step
+"""
+
+import os
+import json
+import numpy as np
+
+from mustem_core.feature_schema import FEATURE_COLUMNS
+
+STORE_VERSION = 1
+STORE_SUFFIX = '.mfs'
+SCHEMA_FILE = 'schema.json'
+INDEX_FILE = 'time_index.bin'
+INDEX_STEP = 0.01  # Resolução do índice temporal (segundos)
+
+
+def column_file(path, name):
+    return os.path.join(path, name + '.bin')
+
+
+def columns_dtype(columns):
+    return np.dtype([(name, np.dtype(kind).newbyteorder('<'), tuple(shape))
+                     for name, kind, shape in columns])
+
+
+class FeatureStoreWriter:
+    """Grava quadros de características; suporta acréscimo (sessões ao vivo)"""
+
+    def __init__(self, path, columns=FEATURE_COLUMNS, frame_rate=None, index_step=INDEX_STEP,
+                 append=False, metadata=None):
+        self.path = path
+        schema_path = os.path.join(path, SCHEMA_FILE)
+
+        if append and os.path.exists(schema_path):
+            with open(schema_path) as f:
+                self.schema = json.load(f)
+            self.columns = [(c['name'], c['dtype'], tuple(c['shape'])) for c in self.schema['columns']]
+            self.num_frames = self.schema['num_frames']
+            self.last_time = self.schema.get('last_time')
+            self.index_len = 0 if self.last_time is None else int(np.floor(self.last_time / self.schema['index_step'])) + 1
+            self.truncate_orphans()
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.columns = list(columns)
+            self.schema = {
+                'version': STORE_VERSION,
+                'frame_rate': frame_rate,
+                'index_step': index_step,
+                'columns': [{'name': n, 'dtype': np.dtype(k).str.lstrip('|<>='), 'shape': list(s)}
+                            for n, k, s in self.columns],
+                'metadata': metadata or {},
+                'num_frames': 0,
+                'last_time': None,
+            }
+            self.num_frames = 0
+            self.last_time = None
+            self.index_len = 0
+            for name, _, _ in self.columns:
+                open(column_file(path, name), 'wb').close()
+            open(os.path.join(path, INDEX_FILE), 'wb').close()
+            self.write_schema()
+
+        self.dtype = columns_dtype(self.columns)
+        self.index_step = self.schema['index_step']
+        self.files = {name: open(column_file(path, name), 'ab') for name, _, _ in self.columns}
+        self.index_file = open(os.path.join(path, INDEX_FILE), 'ab')
+
+    def truncate_orphans(self):
+        """Descarta o que um acréscimo interrompido escreveu depois do último esquema gravado"""
+        dtype = columns_dtype(self.columns)
+        for name, _, _ in self.columns:
+            os.truncate(column_file(self.path, name), self.num_frames * dtype[name].itemsize)
+        os.truncate(os.path.join(self.path, INDEX_FILE), self.index_len * 8)
+
+    def append(self, rows):
+        """Acrescenta um bloco de linhas (array estruturado com a coluna 'time' crescente)"""
+        rows = np.atleast_1d(rows)
+        if len(rows) == 0:
+            return
+        times = rows['time'].astype(np.float64)
+
+        # Dados primeiro, esquema por último: leitores nunca veem quadros incompletos
+        for name, _, _ in self.columns:
+            self.files[name].write(np.ascontiguousarray(rows[name], dtype=self.dtype[name].base).tobytes())
+            self.files[name].flush()
+
+        # Índice: para cada passo k já coberto, o último quadro com tempo <= k * passo
+        last_bin = int(np.floor(times[-1] / self.index_step))
+        if last_bin >= self.index_len:
+            bins = np.arange(self.index_len, last_bin + 1) * self.index_step
+            index = self.num_frames + np.searchsorted(times, bins, side='right') - 1
+            self.index_file.write(index.astype('<i8').tobytes())
+            self.index_file.flush()
+            self.index_len = last_bin + 1
+
+        self.num_frames += len(rows)
+        self.last_time = float(times[-1])
+        self.write_schema()
+
+    def write_schema(self):
+        self.schema['num_frames'] = self.num_frames
+        self.schema['last_time'] = self.last_time
+        schema_path = os.path.join(self.path, SCHEMA_FILE)
+        temp_path = schema_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(self.schema, f, indent=2)
+        os.replace(temp_path, schema_path)
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+        self.index_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FeatureStore:
+    """Leitura por fatias sem carregar o arquivo inteiro (memmap por coluna)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._maps = {}
+        self.refresh()
+
+    def refresh(self):
+        """Relê o esquema (para acompanhar uma sessão ao vivo sendo gravada)"""
+        with open(os.path.join(self.path, SCHEMA_FILE)) as f:
+            self.schema = json.load(f)
+        self.columns = {c['name']: (c['dtype'], tuple(c['shape'])) for c in self.schema['columns']}
+        self.num_frames = self.schema['num_frames']
+        self.frame_rate = self.schema.get('frame_rate')
+        self.index_step = self.schema['index_step']
+        self.metadata = self.schema.get('metadata', {})
+        self._maps = {}
+
+        index_path = os.path.join(self.path, INDEX_FILE)
+        index_len = os.path.getsize(index_path) // 8
+        self.time_index = np.memmap(index_path, dtype='<i8', mode='r', shape=(index_len,)) \
+            if index_len > 0 else np.zeros(0, dtype=np.int64)
+
+    def __len__(self):
+        return self.num_frames
+
+    @property
+    def column_names(self):
+        return list(self.columns)
+
+    def column(self, name):
+        """Coluna inteira como memmap (nada é lido do disco até ser acessado)"""
+        if name not in self._maps:
+            kind, shape = self.columns[name]
+            dtype = np.dtype(kind).newbyteorder('<')
+            if self.num_frames == 0:
+                self._maps[name] = np.zeros((0,) + shape, dtype=dtype)
+            else:
+                self._maps[name] = np.memmap(column_file(self.path, name), dtype=dtype, mode='r',
+                                             shape=(self.num_frames,) + shape)
+        return self._maps[name]
+
+    def frame_at(self, seconds):
+        """Índice do quadro vigente na posição de reprodução (O(1))"""
+        if self.num_frames == 0:
+            return -1
+        k = int(seconds / self.index_step)
+        if k < 0:
+            return 0
+        if k >= len(self.time_index):
+            return self.num_frames - 1
+        index = max(0, int(self.time_index[k]))
+
+        # Quadros entre k * passo e a posição: busca só até o quadro do próximo passo do índice
+        last = int(self.time_index[k + 1]) if k + 1 < len(self.time_index) else self.num_frames - 1
+        times = self.column('time')
+        return index + int(np.searchsorted(times[index + 1:last + 1], seconds, side='right'))
+
+    def slice_frames(self, start, stop, columns=None):
+        names = columns or self.column_names
+        return {name: self.column(name)[start:stop] for name in names}
+
+    def slice_time(self, start_seconds, end_seconds, columns=None):
+        """Fatia [início, fim] em segundos; retorna visões do memmap por coluna"""
+        start = max(0, self.frame_at(start_seconds))
+        stop = self.frame_at(end_seconds) + 1
+        return self.slice_frames(start, stop, columns)
+
+    def row(self, index, columns=None):
+        names = columns or self.column_names
+        return {name: self.column(name)[index] for name in names}
+
+    def at_time(self, seconds, columns=None):
+        return self.row(self.frame_at(seconds), columns)
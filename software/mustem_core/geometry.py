@@ -0,0 +1,129 @@
+"""
+GEOMETRIA EM LOTE
+Polilinhas calculadas com NumPy e desenhadas em trechos: segmentos
+consecutivos e conectados com a mesma cor (quantizada) viram uma única
+chamada de draw.lines/aalines. Curvas de Bézier cujos pontos de
+controle não mudam são tesseladas uma única vez e mantidas em cache
+"""
+
+import numpy as np
+
+from mustem_core import draw
+
+COLOR_QUANTUM = 8  # Passo de quantização por canal (cores a menos de 8 níveis se juntam)
+
+
+def quantize_colors(colors, quantum=COLOR_QUANTUM):
+    """Cores (N, 3) arredondadas para o múltiplo de `quantum` mais próximo"""
+    colors = np.asarray(colors, dtype=float)
+    if quantum <= 1:
+        return np.clip(colors, 0, 255).astype(int)
+    return np.clip(np.round(colors / quantum) * quantum, 0, 255).astype(int)
+
+
+def polyline_runs(starts, ends, colors):
+    """Índices [início, fim) de trechos contínuos de mesma cor"""
+    n = len(colors)
+    if n == 0:
+        return []
+    breaks = np.any(colors[1:] != colors[:-1], axis=1) | np.any(ends[:-1] != starts[1:], axis=1)
+    cuts = np.concatenate(([0], np.nonzero(breaks)[0] + 1, [n]))
+    return list(zip(cuts[:-1].tolist(), cuts[1:].tolist()))
+
+
+def draw_segments(surface, starts, ends, colors, width=1, quantum=COLOR_QUANTUM, antialias=False):
+    """Desenha segmentos (N, 2) -> (N, 2) com cores (N, 3); retorna o número de chamadas"""
+    starts = np.asarray(starts, dtype=int)
+    ends = np.asarray(ends, dtype=int)
+    if len(starts) == 0:
+        return 0
+    colors = quantize_colors(colors, quantum)
+
+    calls = 0
+    for start, end in polyline_runs(starts, ends, colors):
+        points = np.vstack((starts[start:end], ends[end - 1:end])).tolist()
+        color = colors[start].tolist()
+        if antialias:
+            draw.aalines(surface, color, False, points)
+        else:
+            draw.lines(surface, color, False, points, width)
+        calls += 1
+    return calls
+
+
+def draw_polyline(surface, points, colors, width=1, quantum=COLOR_QUANTUM, antialias=False):
+    """Polilinha (N, 2) com uma cor por segmento (N - 1, 3)"""
+    points = np.asarray(points, dtype=int)
+    if len(points) < 2:
+        return 0
+    return draw_segments(surface, points[:-1], points[1:], colors, width, quantum, antialias)
+
+
+def quadratic_bezier(p1, p2, p3, t):
+    """B(t) = (1-t)²P1 + 2(1-t)tP2 + t²P3 para um array de t; retorna (xs, ys)"""
+    t = np.asarray(t, dtype=float)
+    inv_t = 1 - t
+    a, b, c = inv_t * inv_t, 2 * inv_t * t, t * t
+    xs = a * p1[0] + b * p2[0] + c * p3[0]
+    ys = a * p1[1] + b * p2[1] + c * p3[1]
+    return xs, ys
+
+
+class CurveCache:
+    """Curvas quadráticas tesseladas uma única vez, guardadas em ordem de chegada
+
+    Cada curva ocupa uma linha com os `segments` segmentos (x1, y1, x2, y2) e
+    os campos extras pedidos; as mais antigas saem pela frente (como um deque)
+    """
+
+    def __init__(self, segments=8, fields=(), capacity=128):
+        self.segments = segments
+        self.fields = {name: i for i, name in enumerate(fields)}
+        self.t = np.arange(segments + 1) / segments
+        self.head = 0
+        self.tail = 0
+        self.geometry = np.zeros((capacity, 4, segments))
+        self.data = np.zeros((capacity, len(fields)))
+
+        # Estatísticas
+        self.tessellations = 0
+
+    def __len__(self):
+        return self.tail - self.head
+
+    def append(self, p1, p2, p3, **values):
+        """Tessela a curva P1-P2-P3 (pontos de controle como (x, y))"""
+        if self.tail == len(self.geometry):
+            self._make_room()
+        xs, ys = quadratic_bezier(p1, p2, p3, self.t)
+        row = self.tail
+        self.geometry[row] = (xs[:-1], ys[:-1], xs[1:], ys[1:])
+        for name, value in values.items():
+            self.data[row, self.fields[name]] = value
+        self.tail += 1
+        self.tessellations += 1
+
+    def popleft(self):
+        if self.tail > self.head:
+            self.head += 1
+
+    def clear(self):
+        self.head = self.tail = 0
+
+    def _make_room(self):
+        """Move as curvas vivas para o início; dobra a capacidade se estiver cheio"""
+        count = len(self)
+        if count * 2 > len(self.geometry):
+            self.geometry = np.concatenate((self.geometry, np.zeros_like(self.geometry)))
+            self.data = np.concatenate((self.data, np.zeros_like(self.data)))
+        self.geometry[:count] = self.geometry[self.head:self.tail]
+        self.data[:count] = self.data[self.head:self.tail]
+        self.head, self.tail = 0, count
+
+    def segments_view(self):
+        """(x1, y1, x2, y2), cada um com forma (curvas, segmentos)"""
+        g = self.geometry[self.head:self.tail]
+        return g[:, 0], g[:, 1], g[:, 2], g[:, 3]
+
+    def __getitem__(self, name):
+        return self.data[self.head:self.tail, self.fields[name]]
@@ -0,0 +1,139 @@
+"""
+MOTOR DE PARTÍCULAS
+Partículas guardadas em arrays contíguos (struct-of-arrays) com capacidade fixa,
+integração vetorizada e compactação das partículas mortas em uma única passada.
+A posição no início do passo de simulação (px, py) acompanha cada partícula,
+para o desenho interpolar entre passos fixos (mustem_core.timestep)
+"""
+
+import numpy as np
+
+# Colunas presentes em todo motor: (nome, largura)
+CORE_COLUMNS = [('x', 1), ('y', 1), ('vx', 1), ('vy', 1), ('life', 1), ('size', 1), ('color', 3),
+                ('px', 1), ('py', 1)]
+
+
+class ParticleEngine:
+    """Sistema de partículas com capacidade fixa; as vivas ficam sempre em [0:count], na ordem de criação"""
+
+    def __init__(self, capacity, fields=(), evict_oldest=False):
+        self.capacity = capacity
+        self.limit = capacity  # Teto ajustável (governador de qualidade), nunca acima da capacidade
+        self.evict_oldest = evict_oldest  # True = trilha (descarta as mais antigas quando cheio)
+        self.count = 0
+
+        self.columns = {}
+        for spec in list(CORE_COLUMNS) + list(fields):
+            name, width = spec if isinstance(spec, tuple) else (spec, 1)
+            shape = (capacity,) if width == 1 else (capacity, width)
+            self.columns[name] = np.zeros(shape)
+
+        # Estatísticas
+        self.spawned = 0
+        self.dropped = 0
+        self.peak = 0
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, name):
+        """Visão (gravável) da coluna apenas com as partículas vivas"""
+        return self.columns[name][:self.count]
+
+    def __setitem__(self, name, values):
+        self.columns[name][:self.count] = values
+
+    def free(self):
+        return max(0, self.limit - self.count)
+
+    def set_limit(self, limit):
+        """Novo teto de partículas vivas; as que passarem dele morrem naturalmente"""
+        self.limit = max(0, min(self.capacity, int(limit)))
+
+    def spawn(self, n=1, **values):
+        """Cria n partículas; valores escalares ou arrays de tamanho n. Retorna quantas foram criadas"""
+        requested = n
+        if n > self.free() and self.evict_oldest:
+            self.discard_oldest(self.count + min(n, self.limit) - self.limit)
+        n = min(n, self.free())
+        self.dropped += requested - n
+        if n <= 0:
+            return 0
+
+        start, end = self.count, self.count + n
+        for name, column in self.columns.items():
+            if name in values:
+                value = values[name]
+                if np.ndim(value) > 0 and len(value) != n and np.ndim(value) == column.ndim:
+                    value = value[:n]  # Capacidade atingida no meio de um lote
+                column[start:end] = value
+            else:
+                column[start:end] = 0
+        # Recém-criadas não têm passo anterior: a interpolação as mantém paradas
+        if 'px' not in values:
+            self.columns['px'][start:end] = self.columns['x'][start:end]
+        if 'py' not in values:
+            self.columns['py'][start:end] = self.columns['y'][start:end]
+
+        self.count = end
+        self.spawned += n
+        self.peak = max(self.peak, self.count)
+        return n
+
+    def discard_oldest(self, k):
+        """Remove as k partículas mais antigas (início dos arrays)"""
+        k = min(k, self.count)
+        if k <= 0:
+            return
+        remaining = self.count - k
+        for column in self.columns.values():
+            column[:remaining] = column[k:self.count]
+        self.count = remaining
+
+    def compact(self, alive):
+        """Mantém apenas as partículas com alive=True, preservando a ordem"""
+        kept = int(np.count_nonzero(alive))
+        if kept == self.count:
+            return
+        for column in self.columns.values():
+            column[:kept] = column[:self.count][alive]
+        self.count = kept
+
+    def kill(self, dead):
+        self.compact(~dead)
+
+    def integrate(self, dt, gravity=0.0):
+        """Movimento balístico: posição += velocidade * dt, gravidade opcional em y"""
+        n = self.count
+        c = self.columns
+        c['x'][:n] += c['vx'][:n] * dt
+        c['y'][:n] += c['vy'][:n] * dt
+        if gravity:
+            c['vy'][:n] += gravity * dt
+
+    def begin_step(self):
+        """Guarda as posições no início de um passo de simulação"""
+        n = self.count
+        c = self.columns
+        c['px'][:n] = c['x'][:n]
+        c['py'][:n] = c['y'][:n]
+
+    def interpolate(self, alpha):
+        """Posições entre o passo anterior e o atual (alpha 0-1); retorna as atuais para restore()"""
+        n = self.count
+        c = self.columns
+        current = (c['x'][:n].copy(), c['y'][:n].copy())
+        c['x'][:n] = c['px'][:n] + (current[0] - c['px'][:n]) * alpha
+        c['y'][:n] = c['py'][:n] + (current[1] - c['py'][:n]) * alpha
+        return current
+
+    def restore(self, positions):
+        n = self.count
+        self.columns['x'][:n], self.columns['y'][:n] = positions
+
+    def clear(self):
+        self.count = 0
+
+    def stats(self):
+        return {'count': self.count, 'capacity': self.capacity, 'limit': self.limit, 'peak': self.peak,
+                'spawned': self.spawned, 'dropped': self.dropped}
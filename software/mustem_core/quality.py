@@ -0,0 +1,140 @@
+"""
+GOVERNADOR DE QUALIDADE
+Mede o tempo de trabalho de cada quadro e sobe/desce um nível de qualidade
+para manter o orçamento (60 FPS por padrão). Cada knob declara seus limites
+(valor na qualidade máxima e na mínima) e recebe o valor interpolado do
+nível atual. Histerese: degrada rápido quando estoura o orçamento, só
+melhora depois de um bom tempo com folga, e espera entre mudanças
+"""
+
+import time
+import numpy as np
+from collections import deque
+
+FRAME_BUDGET_MS = 1000.0 / 60
+QUALITY_TIERS = 5          # Nível 0 = qualidade máxima, 4 = mínima
+
+DOWNGRADE_RATIO = 1.10     # Média acima de 110% do orçamento -> desce um nível
+UPGRADE_RATIO = 0.70       # Média abaixo de 70% do orçamento -> pode subir um nível
+DOWNGRADE_HOLD_S = 0.5     # Tempo contínuo acima do limite antes de degradar
+UPGRADE_HOLD_S = 3.0       # Tempo contínuo com folga antes de melhorar
+SETTLE_S = 1.0             # Espera após uma mudança (medições do nível anterior)
+
+
+class QualityKnob:
+    """Parâmetro ajustável entre o valor de qualidade máxima e o de mínima"""
+
+    def __init__(self, name, best, worst, apply, integer=True):
+        self.name = name
+        self.best = best
+        self.worst = worst
+        self.apply = apply          # Função chamada com o novo valor
+        self.integer = integer
+        self.value = None
+
+    def value_at(self, level):
+        """level 0 = best, 1 = worst"""
+        if isinstance(self.best, bool):
+            return self.best if level < 0.5 else self.worst
+        value = self.best + (self.worst - self.best) * level
+        return int(round(value)) if self.integer else value
+
+    def set_level(self, level):
+        value = self.value_at(level)
+        if value != self.value:
+            self.value = value
+            self.apply(value)
+
+
+class QualityGovernor:
+    """Escolhe o nível de qualidade pelo tempo médio de quadro, com histerese"""
+
+    def __init__(self, budget_ms=FRAME_BUDGET_MS, tiers=QUALITY_TIERS, window=30,
+                 downgrade_ratio=DOWNGRADE_RATIO, upgrade_ratio=UPGRADE_RATIO,
+                 downgrade_hold=DOWNGRADE_HOLD_S, upgrade_hold=UPGRADE_HOLD_S, settle=SETTLE_S):
+        self.budget_ms = budget_ms
+        self.tiers = tiers
+        self.downgrade_ratio = downgrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.downgrade_hold = downgrade_hold
+        self.upgrade_hold = upgrade_hold
+        self.settle = settle
+        self.enabled = True
+
+        self.knobs = []
+        self.tier = 0
+        self.samples = deque(maxlen=window)
+        self._over_since = None
+        self._under_since = None
+        self._changed_at = None
+
+        # Estatísticas
+        self.downgrades = 0
+        self.upgrades = 0
+        self.tier_frames = [0] * tiers
+
+    def add_knob(self, name, best, worst, apply, integer=True):
+        knob = QualityKnob(name, best, worst, apply, integer)
+        knob.set_level(self.level())
+        self.knobs.append(knob)
+        return knob
+
+    def level(self):
+        return self.tier / (self.tiers - 1) if self.tiers > 1 else 0.0
+
+    def set_tier(self, tier, now=None):
+        tier = max(0, min(self.tiers - 1, tier))
+        if tier == self.tier:
+            return
+        if tier > self.tier:
+            self.downgrades += 1
+        else:
+            self.upgrades += 1
+        self.tier = tier
+        for knob in self.knobs:
+            knob.set_level(self.level())
+
+        # O histórico foi medido com outra qualidade
+        self.samples.clear()
+        self._over_since = self._under_since = None
+        self._changed_at = time.perf_counter() if now is None else now
+
+    def record(self, frame_ms, now=None):
+        """Registra o tempo de trabalho de um quadro; retorna o nível atual"""
+        now = time.perf_counter() if now is None else now
+        self.samples.append(frame_ms)
+        self.tier_frames[self.tier] += 1
+        if not self.enabled or len(self.samples) < self.samples.maxlen // 2:
+            return self.tier
+        if self._changed_at is not None and now - self._changed_at < self.settle:
+            return self.tier
+
+        average = float(np.mean(self.samples))
+        if average > self.budget_ms * self.downgrade_ratio:
+            self._under_since = None
+            if self._over_since is None:
+                self._over_since = now
+            elif now - self._over_since >= self.downgrade_hold:
+                self.set_tier(self.tier + 1, now)
+        elif average < self.budget_ms * self.upgrade_ratio:
+            self._over_since = None
+            if self._under_since is None:
+                self._under_since = now
+            elif now - self._under_since >= self.upgrade_hold:
+                self.set_tier(self.tier - 1, now)
+        else:
+            # Zona morta entre os dois limites: mantém o nível
+            self._over_since = self._under_since = None
+        return self.tier
+
+    def stats(self):
+        return {
+            'tier': self.tier,
+            'tiers': self.tiers,
+            'budget_ms': self.budget_ms,
+            'avg_frame_ms': float(np.mean(self.samples)) if self.samples else 0.0,
+            'downgrades': self.downgrades,
+            'upgrades': self.upgrades,
+            'tier_frames': list(self.tier_frames),
+            'knobs': {knob.name: knob.value for knob in self.knobs},
+        }
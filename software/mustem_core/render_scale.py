@@ -0,0 +1,132 @@
+"""
+ESCALA DE RENDERIZAÇÃO
+Os componentes continuam desenhando em coordenadas de layout
+(SCREEN_WIDTH × SCREEN_HEIGHT). A tela interna tem a resolução da janela
+vezes a escala de renderização e é ampliada uma única vez, com smoothscale,
+na apresentação. A conversão é explícita: a tela interna é uma Surface de
+tamanho real (get_size() em pixels) cujos blit/fill recebem coordenadas de
+layout, e o desenho passa por mustem_core.draw, que escala pontos, raios e
+espessuras quando o destino é escalado. Textos (superfícies estáticas) são
+reduzidos uma vez e reaproveitados
+
+Configuração (variáveis de ambiente, sobrepostas pelos argumentos):
+    MUSTEM_RENDER_SCALE=0.5          escala interna (padrão 1.0)
+    MUSTEM_DISPLAY_SIZE=2800x1600    tamanho da janela (padrão: o do layout)
+"""
+
+import os
+import weakref
+import pygame
+
+# Superfícies que não mudam depois de criadas (textos): a versão reduzida fica em cache
+_static_sources = weakref.WeakSet()
+
+
+def render_settings(layout_size, render_scale=None, display_size=None):
+    """(tamanho da janela, escala interna) a partir dos argumentos ou do ambiente"""
+    if render_scale is None:
+        render_scale = float(os.environ.get('MUSTEM_RENDER_SCALE', '1.0'))
+    if display_size is None:
+        value = os.environ.get('MUSTEM_DISPLAY_SIZE')
+        display_size = tuple(int(v) for v in value.lower().split('x')) if value else tuple(layout_size)
+    return tuple(display_size), render_scale
+
+
+def scaled_size(size, factor):
+    return max(1, int(round(size[0] * factor))), max(1, int(round(size[1] * factor)))
+
+
+def static_source(surface):
+    """Marca uma superfície que não será mais alterada (ex.: texto renderizado); retorna a própria"""
+    _static_sources.add(surface)
+    return surface
+
+
+class ScaledSurface(pygame.Surface):
+    """Surface em resolução interna (get_size() em pixels) cujos blit/fill aceitam coordenadas de layout"""
+
+    def __init__(self, layout_size, factor, flags=0):
+        super().__init__(scaled_size(layout_size, factor), flags)
+        self.layout_size = (int(layout_size[0]), int(layout_size[1]))
+        self.factor = factor
+        self.inverse = 1.0 / factor
+        self.reduced = weakref.WeakKeyDictionary()  # Superfície estática -> cópia reduzida
+
+    def layout_rect(self):
+        return pygame.Rect((0, 0), self.layout_size)
+
+    def to_pixels(self, rect):
+        """Retângulo de layout -> pixels internos (bordas arredondadas: regiões vizinhas não deixam frestas)"""
+        rect = pygame.Rect(rect)
+        f = self.factor
+        left, top = int(round(rect.left * f)), int(round(rect.top * f))
+        right, bottom = int(round(rect.right * f)), int(round(rect.bottom * f))
+        return pygame.Rect(left, top, max(right - left, 1 if rect.width else 0),
+                           max(bottom - top, 1 if rect.height else 0))
+
+    def to_layout(self, rect):
+        """Pixels internos -> retângulo de layout que os cobre (com folga de arredondamento)"""
+        inverse = self.inverse
+        return pygame.Rect(int(rect.x * inverse), int(rect.y * inverse),
+                           int(rect.w * inverse) + 2, int(rect.h * inverse) + 2)
+
+    def fill(self, color, rect=None, special_flags=0):
+        area = None if rect is None else self.to_pixels(rect)
+        return self.to_layout(super().fill(color, area, special_flags))
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        f = self.factor
+        position = (int(round(dest[0] * f)), int(round(dest[1] * f)))
+        if isinstance(source, ScaledSurface) and source.factor == f:
+            area = None if area is None else self.to_pixels(area)
+            return self.to_layout(super().blit(source, position, area, special_flags))
+
+        # Superfície em resolução de layout: reduzida antes de copiar (textos, uma única vez)
+        if area is None and source in _static_sources:
+            reduced = self.reduced.get(source)
+            if reduced is None:
+                reduced = self.reduced[source] = self.reduce(source)
+            return self.to_layout(super().blit(reduced, position, None, special_flags))
+        if area is not None:
+            area = pygame.Rect(area).clip(source.get_rect())
+            if not area.width or not area.height:
+                return pygame.Rect(dest[0], dest[1], 0, 0)
+            source = source.subsurface(area)
+        return self.to_layout(super().blit(self.reduce(source), position, None, special_flags))
+
+    def reduce(self, source):
+        size = scaled_size(source.get_size(), self.factor)
+        if source.get_bitsize() in (24, 32):
+            return pygame.transform.smoothscale(source, size)
+        return pygame.transform.scale(source, size)
+
+    def blit_native(self, source, dest, area=None, special_flags=0):
+        """Copia uma superfície já em pixels internos para a posição de layout `dest`"""
+        position = (int(round(dest[0] * self.factor)), int(round(dest[1] * self.factor)))
+        return self.to_layout(super().blit(source, position, area, special_flags))
+
+    def blits(self, blit_sequence, doreturn=True):
+        rects = [self.blit(*item) for item in blit_sequence]
+        return rects if doreturn else None
+
+
+def layout_size(surface):
+    """Tamanho em coordenadas de layout (o próprio tamanho para superfícies comuns)"""
+    return surface.layout_size if type(surface) is ScaledSurface else surface.get_size()
+
+
+def layout_rect(surface):
+    return pygame.Rect((0, 0), layout_size(surface))
+
+
+def present_canvas(canvas, target):
+    """Amplia (ou copia) o quadro interno para a superfície de destino (a janela)"""
+    if pygame.Surface.get_size(canvas) == target.get_size():
+        target.blit(canvas, (0, 0))
+    else:
+        pygame.transform.smoothscale(canvas, target.get_size(), target)
+
+
+def surface_factor(surface):
+    """Pixels internos por unidade de layout (1.0 para superfícies comuns)"""
+    return surface.factor if type(surface) is ScaledSurface else 1.0
@@ -0,0 +1,37 @@
+"""
+FLUXOS ALEATÓRIOS POR COMPONENTE
+Cada componente visual pede o seu gerador pelo nome em vez de usar o estado
+global de np.random. Ao vivo os geradores vêm da entropia do sistema; na
+renderização offline a semente base e o índice do segmento fixam cada fluxo,
+então um segmento renderizado em outro processo sorteia exatamente o mesmo
+"""
+
+import zlib
+import numpy as np
+
+
+class RandomStreams:
+    """Registro de geradores nomeados, derivados de (semente, segmento, nome)"""
+
+    def __init__(self):
+        self.base_seed = None
+        self.segment = 0
+        self.issued = {}
+
+    def seed(self, base_seed, segment=0):
+        """Fixa a semente (None volta à entropia do sistema); vale para os próximos fluxos"""
+        self.base_seed = base_seed
+        self.segment = segment
+        self.issued = {}
+
+    def stream(self, name):
+        """Novo gerador para o componente; instâncias repetidas do mesmo nome recebem fluxos distintos"""
+        occurrence = self.issued.get(name, 0)
+        self.issued[name] = occurrence + 1
+        if self.base_seed is None:
+            return np.random.default_rng()
+        entropy = [self.base_seed, self.segment, zlib.crc32(name.encode('utf-8')), occurrence]
+        return np.random.default_rng(np.random.SeedSequence(entropy))
+
+
+random_streams = RandomStreams()
@@ -0,0 +1,314 @@
+"""
+RUNTIME ASSÍNCRONO
+Captura, análise, renderização, eventos e saídas (serial/rede) rodam como
+tarefas asyncio separadas, ligadas por filas limitadas com política de
+descarte explícita. Cada estágio mede a própria latência (LatencyMeter) e
+cada fila expõe profundidade, pico e descartes.
+
+Cada saída tem fila e tarefa próprias: publicar nunca espera, um
+dispositivo lento só descarta as próprias mensagens e E/S bloqueante roda
+numa thread do executor padrão do laço, sem atrasar o quadro
+
+Saídas (variável de ambiente, sobreposta pelos argumentos):
+    MUSTEM_SINKS=udp:127.0.0.1:9000         datagramas JSON por quadro de análise
+    MUSTEM_SINKS=serial:/dev/ttyUSB0        linha PWM dos 4 motores por quadro (pyserial)
+"""
+
+import os
+import json
+import time
+import socket
+import asyncio
+from collections import deque
+
+from mustem_core.analysis_paths import LatencyMeter
+
+# Políticas de descarte das filas
+DROP_OLDEST = 'drop_oldest'  # Fila cheia: sai a mais antiga (características velhas não servem)
+DROP_NEWEST = 'drop_newest'  # Fila cheia: a nova é recusada (ordem importa mais que frescor)
+BLOCK = 'block'              # Fila cheia: o produtor espera (só entre estágios de mesmo ritmo)
+
+SINK_QUEUE_SIZE = 8
+SINK_BUDGET_MS = 5.0
+SERIAL_BAUD = 115200  # Mesma taxa do firmware tactile_4motors.ino
+
+
+class StageQueue:
+    """Fila limitada entre dois estágios; mede o tempo de espera de cada item"""
+
+    def __init__(self, name, maxsize=1, policy=DROP_OLDEST):
+        self.name = name
+        self.maxsize = maxsize
+        self.policy = policy
+        self.items = deque()
+        self.readable = asyncio.Event()
+        self.writable = asyncio.Event()
+        self.writable.set()
+        self.wait = LatencyMeter(f"{name}_queue", 0.0)
+
+        # Estatísticas
+        self.accepted = 0
+        self.dropped = 0
+        self.peak = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def put_nowait(self, item):
+        """Enfileira sem esperar (BLOCK cheio recusa); retorna False se algum item foi descartado"""
+        kept = True
+        if len(self.items) >= self.maxsize:
+            self.dropped += 1
+            kept = False
+            if self.policy == DROP_OLDEST:
+                self.items.popleft()
+            else:
+                return kept
+        self.items.append((item, time.perf_counter()))
+        self.accepted += 1
+        self.peak = max(self.peak, len(self.items))
+        self.readable.set()
+        if len(self.items) >= self.maxsize:
+            self.writable.clear()
+        return kept
+
+    async def put(self, item):
+        """Enfileira; com BLOCK espera haver espaço"""
+        if self.policy == BLOCK:
+            while len(self.items) >= self.maxsize:
+                await self.writable.wait()
+        return self.put_nowait(item)
+
+    def _take(self, index):
+        item, queued = self.items[index]
+        if index == 0:
+            self.items.popleft()
+        else:
+            self.items.clear()
+        self.wait.record((time.perf_counter() - queued) * 1000.0)
+        if not self.items:
+            self.readable.clear()
+        self.writable.set()
+        return item
+
+    async def get(self):
+        """Próximo item, em ordem (espera se vazia)"""
+        while not self.items:
+            await self.readable.wait()
+        return self._take(0)
+
+    def get_latest(self, default=None):
+        """Item mais recente sem esperar; os anteriores contam como descartados"""
+        if not self.items:
+            return default
+        self.dropped += len(self.items) - 1
+        return self._take(-1)
+
+    def stats(self):
+        wait = self.wait.stats()
+        return {'depth': len(self.items), 'maxsize': self.maxsize, 'policy': self.policy,
+                'accepted': self.accepted, 'dropped': self.dropped, 'peak': self.peak,
+                'wait_avg_ms': wait['avg_ms'], 'wait_p95_ms': wait['p95_ms']}
+
+
+class UDPSink:
+    """Saída de rede: um datagrama JSON por mensagem (socket não bloqueante)"""
+
+    blocking = False
+
+    def __init__(self, host, port):
+        self.name = f"udp:{host}:{port}"
+        self.address = (host, int(port))
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.setblocking(False)
+
+    def send(self, message):
+        self.socket.sendto(json.dumps(message).encode('utf-8'), self.address)
+
+    def close(self):
+        self.socket.close()
+
+
+class SerialSink:
+    """Saída serial para os motores: 'M,kick,bass,voice,treble' (PWM 0-255) por linha
+
+    Protocolo lido por hardware/firmware/tactille_system/tactile_4motors.ino, que volta
+    ao microfone quando as linhas param de chegar
+    """
+
+    blocking = True  # write() da pyserial bloqueia: roda numa thread
+
+    def __init__(self, port, baud=SERIAL_BAUD):
+        import serial  # pyserial, só necessária com esta saída
+        self.name = f"serial:{port}"
+        self.port = serial.Serial(port, baud, write_timeout=0.05)
+
+    def send(self, message):
+        line = 'M,' + ','.join(str(int(v)) for v in message['motors']) + '\n'
+        self.port.write(line.encode('ascii'))
+
+    def close(self):
+        self.port.close()
+
+
+def sink_settings(specs=None):
+    """Saídas a partir de 'tipo:destino' separados por vírgula (padrão: MUSTEM_SINKS)"""
+    if specs is None:
+        specs = os.environ.get('MUSTEM_SINKS', '')
+    if isinstance(specs, str):
+        specs = [spec.strip() for spec in specs.split(',') if spec.strip()]
+
+    sinks = []
+    for spec in specs:
+        if not isinstance(spec, str):
+            sinks.append(spec)  # Saída já construída
+            continue
+        kind, _, target = spec.partition(':')
+        if kind == 'udp':
+            host, _, port = target.rpartition(':')
+            sinks.append(UDPSink(host or '127.0.0.1', port))
+        elif kind == 'serial':
+            sinks.append(SerialSink(target))
+        else:
+            raise ValueError(f"Saída desconhecida: {spec}")
+    return sinks
+
+
+def tactile_message(features, media_time):
+    """Mensagem das saídas: PWM dos motores e batidas do caminho tátil"""
+    tactile = features.get('tactile') or {}
+    return {
+        'time': round(float(media_time), 4),
+        'motors': [int(v) for v in tactile.get('intensities', ())],
+        'beats': [round(float(event['time']), 4) for event in tactile.get('beat_events', ())],
+    }
+
+
+class Runtime:
+    """Tarefas, filas e saídas de um app; run() bloqueia até stop()"""
+
+    def __init__(self):
+        self.queues = {}
+        self.stages = {}
+        self.sinks = []
+        self.factories = []
+        self.tasks = []
+        self.running = False
+        self.sink_errors = {}
+
+    def queue(self, name, maxsize=1, policy=DROP_OLDEST):
+        self.queues[name] = StageQueue(name, maxsize, policy)
+        return self.queues[name]
+
+    def stage(self, name, budget_ms):
+        """Medidor de latência de um estágio"""
+        self.stages[name] = LatencyMeter(name, budget_ms)
+        return self.stages[name]
+
+    def add_task(self, name, factory):
+        """Registra uma corrotina (função sem argumentos) iniciada em run()"""
+        self.factories.append((name, factory))
+
+    def periodic(self, name, period, callback, budget_ms=None):
+        """Tarefa que chama callback() a cada `period` segundos (prazo fixo, sem acumular atraso)
+
+        period pode ser uma função (ex.: cadência ajustada pelo governador de qualidade)
+        """
+        meter = self.stage(name, budget_ms if budget_ms is not None else 1000.0 * self.period_of(period))
+
+        async def loop():
+            clock = asyncio.get_running_loop()
+            deadline = clock.time()
+            while self.running:
+                meter.start()
+                callback()
+                meter.stop()
+                deadline += self.period_of(period)
+                delay = deadline - clock.time()
+                if delay < 0:
+                    deadline = clock.time()  # Atrasado: recomeça do agora, sem rajada
+                await asyncio.sleep(max(0.0, delay))
+
+        self.add_task(name, loop)
+
+    @staticmethod
+    def period_of(period):
+        return period() if callable(period) else period
+
+    def call_later(self, delay, callback):
+        """Chama callback() uma vez após `delay` segundos (no lugar de threading.Timer)"""
+        async def later():
+            await asyncio.sleep(delay)
+            if self.running:
+                callback()
+
+        self.add_task(f"later_{len(self.factories)}", later)
+
+    def add_sink(self, sink, maxsize=SINK_QUEUE_SIZE, policy=DROP_OLDEST):
+        """Saída com fila e tarefa próprias; mensagens velhas saem quando ela não acompanha"""
+        queue = self.queue(sink.name, maxsize, policy)
+        meter = self.stage(sink.name, SINK_BUDGET_MS)
+        self.sinks.append((sink, queue))
+
+        async def drain():
+            while self.running:
+                message = await queue.get()
+                meter.start()
+                try:
+                    if sink.blocking:
+                        await asyncio.get_running_loop().run_in_executor(None, sink.send, message)
+                    else:
+                        sink.send(message)
+                except Exception as e:
+                    errors = self.sink_errors.get(sink.name, 0)
+                    if errors == 0:
+                        print(f"Saída {sink.name} falhou: {e}")
+                    self.sink_errors[sink.name] = errors + 1
+                meter.stop()
+
+        self.add_task(sink.name, drain)
+
+    def publish(self, message):
+        """Entrega uma mensagem a todas as saídas sem esperar"""
+        for _, queue in self.sinks:
+            queue.put_nowait(message)
+
+    def stop(self):
+        self.running = False
+        for task in self.tasks:
+            task.cancel()
+
+    async def main(self):
+        self.running = True
+        self.tasks = [asyncio.create_task(factory(), name=name) for name, factory in self.factories]
+        try:
+            await asyncio.gather(*self.tasks)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.running = False
+            for sink, _ in self.sinks:
+                sink.close()
+
+    def run(self):
+        asyncio.run(self.main())
+
+    def stats(self):
+        return {
+            'stages': {name: meter.stats() for name, meter in self.stages.items()},
+            'queues': {name: queue.stats() for name, queue in self.queues.items()},
+            'sink_errors': dict(self.sink_errors),
+        }
+
+    def summary(self):
+        """Uma linha por estágio e fila, para o relatório de encerramento"""
+        lines = []
+        for name, meter in self.stages.items():
+            stats = meter.stats()
+            lines.append(f"{name}: {stats['avg_ms']:.1f} ms médio, p95 {stats['p95_ms']:.1f} ms "
+                         f"({stats['over_budget']}/{stats['count']} acima de {stats['budget_ms']:.0f} ms)")
+        for name, queue in self.queues.items():
+            stats = queue.stats()
+            lines.append(f"fila {name}: pico {stats['peak']}/{stats['maxsize']}, "
+                         f"{stats['dropped']} descartes ({stats['policy']})")
+        return lines
@@ -0,0 +1,137 @@
+"""
+FAIXAS DE ROLAGEM
+Painéis de histórico (forma de onda, hélice de DNA) guardam o próprio
+desenho numa superfície persistente: a cada amostra nova a faixa rola uma
+coluna para a esquerda com Surface.scroll e só a coluna mais recente é
+desenhada. O custo por quadro é constante, qualquer que seja o comprimento
+do histórico. A faixa fica na resolução interna da tela de destino (escala
+de renderização) e é refeita a partir do histórico quando ela muda.
+Quando cada amostra é uma coluna de pixels pronta (espectrograma), a
+textura em anel nem rola: a coluna é escrita com surfarray na posição da
+cabeça e a apresentação são dois blits (mais antiga à esquerda)
+"""
+
+import pygame
+
+from mustem_core.render_scale import ScaledSurface, surface_factor
+
+TRANSPARENT = (0, 0, 0, 0)
+
+
+class ScrollStrip:
+    """Faixa de `columns` colunas sobre o retângulo de layout `rect`; coordenadas de desenho em pixels da faixa"""
+
+    def __init__(self, rect, columns, flags=pygame.SRCALPHA):
+        self.rect = pygame.Rect(rect)
+        self.columns = columns
+        self.flags = flags
+        self.surface = None
+        self.factor = None
+        self.column_width = 0.0
+        self.offset = 0     # Colunas roladas desde a criação (posição em pixels sem erro acumulado)
+
+        # Moduladores de apresentação (ex.: esmaecimento por idade) e cópia reaproveitada
+        self.shade = None
+        self.scratch = None
+
+        # Estatísticas
+        self.rebuilds = 0
+        self.advances = 0
+
+    def prepare(self, target):
+        """Garante a faixa na resolução de `target`; True se foi (re)criada e o histórico deve ser redesenhado"""
+        factor = surface_factor(target)
+        if self.surface is not None and factor == self.factor:
+            return False
+        self.factor = factor
+        size = self.pixel_size()
+        self.surface = pygame.Surface(size, self.flags)
+        self.surface.fill(TRANSPARENT)
+        self.column_width = size[0] / self.columns
+        self.offset = 0
+        self.shade = None
+        self.scratch = None
+        self.rebuilds += 1
+        return True
+
+    def pixel_size(self):
+        width, height = self.rect.size
+        return max(1, int(round(width * self.factor))), max(1, int(round(height * self.factor)))
+
+    def advance(self):
+        """Rola uma coluna; retorna (x0, x1): x da coluna anterior e da nova (borda direita)"""
+        previous = int(round(self.offset * self.column_width))
+        self.offset += 1
+        step = int(round(self.offset * self.column_width)) - previous
+        width, height = self.surface.get_size()
+        if step > 0:
+            self.surface.scroll(-step, 0)
+            self.surface.fill(TRANSPARENT, (width - step, 0, step, height))
+        self.advances += 1
+        right = width - 1
+        return right - step, right
+
+    def to_pixels(self, value):
+        """Distância de layout -> pixels da faixa"""
+        return value * self.factor
+
+    def set_shade(self, levels):
+        """Multiplica cada coluna na apresentação por levels[coluna] (0-1; índice 0 = mais antiga)"""
+        width, height = self.surface.get_size()
+        shade = pygame.Surface((width, height))
+        for x in range(width):
+            value = int(round(255 * levels[min(len(levels) - 1, int(x / self.column_width))]))
+            shade.fill((value, value, value), (x, 0, 1, height))
+        self.shade = shade
+
+    def present(self, target):
+        """Copia a faixa para o destino na posição do retângulo"""
+        surface = self.surface
+        if self.shade is not None:
+            if self.scratch is None:
+                self.scratch = pygame.Surface(surface.get_size(), self.flags)
+            self.scratch.fill(TRANSPARENT)
+            self.scratch.blit(surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            self.scratch.blit(self.shade, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+            surface = self.scratch
+        if type(target) is ScaledSurface:
+            # Faixa já em pixels internos: direto na Surface
+            return target.blit_native(surface, self.rect.topleft)
+        return target.blit(surface, self.rect.topleft)
+
+    def stats(self):
+        return {'rebuilds': self.rebuilds, 'advances': self.advances}
+
+
+class RingTexture:
+    """Textura de colunas escritas em anel; `head` é a próxima coluna (a mais antiga)"""
+
+    def __init__(self, size, color=(0, 0, 0)):
+        self.size = (int(size[0]), int(size[1]))
+        self.surface = pygame.Surface(self.size)
+        self.surface.fill(color)
+        self.head = 0
+
+        # Estatísticas
+        self.columns_written = 0
+
+    def push(self, column):
+        """Escreve uma coluna (altura, 3) uint8, de cima para baixo"""
+        pixels = pygame.surfarray.pixels3d(self.surface)
+        try:
+            pixels[self.head] = column
+        finally:
+            del pixels  # Libera o lock da superfície
+        self.head = (self.head + 1) % self.size[0]
+        self.columns_written += 1
+
+    def present(self, target, position):
+        """Dois blits: da cabeça ao fim (mais antigas) e do início à cabeça (mais novas)"""
+        width, height = self.size
+        x, y = position
+        head = self.head
+        rects = [target.blit(self.surface, (x, y), (head, 0, width - head, height))]
+        if head:
+            rects.append(target.blit(self.surface, (x + width - head, y), (0, 0, head, height)))
+        return rects
+
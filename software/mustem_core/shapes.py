@@ -0,0 +1,78 @@
+"""
+BIBLIOTECA DE FORMAS
+Formas unitárias (polígonos regulares, círculos, contornos de pétala) e
+tabelas de direções pelo ângulo áureo são calculadas uma única vez e
+mantidas em cache. A cada quadro um lote de instâncias é posicionado com
+uma única transformação afim do NumPy (escala, rotação e translação),
+em vez de cos/sin por vértice em Python.
+
+Os pontos são números complexos (x + iy): rotação e escala viram uma
+multiplicação por escala·e^(i·rotação) e a translação uma soma; a
+conversão para pixels reinterpreta o array como pares (x, y) sem cópia
+"""
+
+import math
+import functools
+import numpy as np
+
+GOLDEN_RATIO = (1 + math.sqrt(5)) / 2
+
+
+def _frozen(array):
+    array.flags.writeable = False  # Compartilhada pelo cache: ninguém altera
+    return array
+
+
+@functools.lru_cache(maxsize=None)
+def unit_polygon(sides, start=0.0):
+    """Vértices (sides,) do polígono regular de raio 1; o primeiro no ângulo `start`"""
+    return _frozen(np.exp(1j * (start + np.arange(sides) * (2 * math.pi / sides))))
+
+
+def unit_circle(segments=32):
+    """Contorno do círculo de raio 1 (polígono de `segments` lados)"""
+    return unit_polygon(segments)
+
+
+@functools.lru_cache(maxsize=None)
+def unit_ellipse(segments, aspect):
+    """Contorno (segments,) da elipse de semieixos 1 e `aspect` (pétalas)"""
+    angles = np.arange(segments) * (2 * math.pi / segments)
+    return _frozen(np.cos(angles) + 1j * aspect * np.sin(angles))
+
+
+@functools.lru_cache(maxsize=None)
+def polygon_table(max_sides):
+    """Polígonos unitários de 0 a max_sides lados, (max_sides + 1, max_sides), preenchidos com zeros"""
+    table = np.zeros((max_sides + 1, max_sides), dtype=complex)
+    for sides in range(3, max_sides + 1):
+        table[sides, :sides] = unit_polygon(sides)
+    return _frozen(table)
+
+
+@functools.lru_cache(maxsize=None)
+def golden_directions(count, step=2 * math.pi / GOLDEN_RATIO):
+    """Vetores unitários (count,) nos ângulos i * step (padrão: volta / proporção áurea)"""
+    return _frozen(np.exp(1j * np.arange(count) * step))
+
+
+def place(shape, scale=1.0, rotation=0.0, translation=(0.0, 0.0)):
+    """Posiciona formas unitárias: shape * scale * e^(i·rotation) + translation (broadcast do NumPy)
+
+    Para N instâncias de uma forma (V,), passe scale/rotation com forma (N, 1);
+    (V,) ou (N, V) dão valores por vértice. translation: (x, y) ou complexo(s)
+    """
+    if isinstance(translation, tuple):
+        translation = complex(*translation)
+    rotation = np.asarray(rotation, dtype=float)
+    if rotation.ndim == 0:
+        factor = scale * complex(math.cos(rotation), math.sin(rotation))
+    else:
+        factor = scale * np.exp(1j * rotation)
+    return shape * factor + translation
+
+
+def to_points(placed):
+    """Pontos complexos (..., V) -> listas de pixels inteiros [[x, y], ...] (truncados como int())"""
+    placed = np.ascontiguousarray(placed, dtype=complex)
+    return placed.view(float).reshape(placed.shape + (2,)).astype(int).tolist()
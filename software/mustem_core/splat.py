@@ -0,0 +1,108 @@
+"""
+RASTERIZADOR DE PONTOS (SPLATTING ADITIVO)
+Nuvens de pontos escritas direto nos pixels da superfície
+(pygame.surfarray.pixels3d): cada ponto soma sua cor num disco de raio
+inteiro, as contribuições de todos os pontos são acumuladas por pixel com
+np.bincount (scatter-add) e o resultado satura em 255. O custo cresce com
+o número de pixels tocados, não com uma chamada Python por círculo
+
+Seleção por componente (variável de ambiente, sobreposta pelos argumentos):
+    MUSTEM_SPLAT=all                    todos os componentes com nuvens de pontos
+    MUSTEM_SPLAT=phyllotaxis,petals     só os nomeados
+"""
+
+import os
+import numpy as np
+import pygame
+
+from mustem_core.render_scale import surface_factor
+
+MAX_RADIUS = 24
+DENSE_RATIO = 8   # Caixa com até 8 pixels por contribuição: acumulação densa
+
+
+def _disk(radius):
+    """Deslocamentos (dx, dy) dos pixels do disco de raio inteiro"""
+    span = np.arange(-radius, radius + 1)
+    dx, dy = np.meshgrid(span, span, indexing='ij')
+    inside = dx * dx + dy * dy <= radius * radius
+    return dx[inside], dy[inside]
+
+
+DISKS = [_disk(radius) for radius in range(MAX_RADIUS + 1)]
+
+
+def splat_settings(names=None):
+    """Conjunto de componentes que usam splatting ('all' = todos)"""
+    if names is None:
+        names = os.environ.get('MUSTEM_SPLAT', '')
+    if isinstance(names, str):
+        names = [name.strip() for name in names.split(',') if name.strip()]
+    return set(names)
+
+
+def splat_enabled(settings, name):
+    return 'all' in settings or name in settings
+
+
+def _colors(colors, count):
+    """Cor (N, 3) ou uma cor para todos -> (count, 3) inteira em 0..255"""
+    colors = np.clip(np.asarray(np.atleast_2d(colors), dtype=np.int64)[..., :3], 0, 255)
+    return np.broadcast_to(colors, (count, 3))
+
+
+def _bincount(index, channels, size):
+    """Scatter-add de cada canal separado (somas exatas e sem vazamento entre canais)"""
+    return np.stack([np.bincount(index, channel, minlength=size) for channel in channels], axis=-1)
+
+
+def splat(surface, xs, ys, colors, radii=0):
+    """Soma cores (N, 3) em discos centrados em (xs, ys); raio 0 = um pixel. Retorna pixels tocados"""
+    xs = np.asarray(xs, dtype=float)
+    if len(xs) == 0:
+        return 0
+    factor = surface_factor(surface)
+    width, height = pygame.Surface.get_size(surface)
+    px = np.rint(xs * factor).astype(np.int64)
+    py = np.rint(np.asarray(ys, dtype=float) * factor).astype(np.int64)
+    radii = np.clip(np.rint(np.asarray(radii, dtype=float) * factor), 0, MAX_RADIUS).astype(int)
+    radii = np.broadcast_to(radii, px.shape)
+    colors = _colors(colors, len(px))
+
+    # Pixels de todos os discos, agrupados por raio, com o ponto que gerou cada um
+    xs_all, ys_all, owners = [], [], []
+    for radius in np.unique(radii):
+        group = radii == radius
+        dx, dy = DISKS[radius]
+        xs_all.append((px[group][:, None] + dx).ravel())
+        ys_all.append((py[group][:, None] + dy).ravel())
+        owners.append(np.repeat(np.flatnonzero(group), len(dx)))
+    x, y, owners = np.concatenate(xs_all), np.concatenate(ys_all), np.concatenate(owners)
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    if not inside.all():
+        x, y, owners = x[inside], y[inside], owners[inside]
+    if len(x) == 0:
+        return 0
+    channels = colors[owners].T
+
+    # Scatter-add: contagem densa na caixa delimitadora se os pontos a cobrem bem, esparsa (np.unique) se não
+    x0, y0 = int(x.min()), int(y.min())
+    box_w, box_h = int(x.max()) - x0 + 1, int(y.max()) - y0 + 1
+    local = (x - x0) * box_h + (y - y0)
+    if box_w * box_h <= DENSE_RATIO * len(local):
+        sums = _bincount(local, channels, box_w * box_h)
+        touched = np.flatnonzero(sums.any(axis=1))
+        sums = sums[touched]
+    else:
+        touched, inverse = np.unique(local, return_inverse=True)
+        sums = _bincount(inverse, channels, len(touched))
+    if len(touched) == 0:
+        return 0
+
+    tx, ty = touched // box_h + x0, touched % box_h + y0
+    pixels = pygame.surfarray.pixels3d(surface)
+    try:
+        pixels[tx, ty] = np.minimum(pixels[tx, ty] + sums, 255)
+    finally:
+        del pixels  # Libera o lock da superfície
+    return len(touched)
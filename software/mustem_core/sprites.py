@@ -0,0 +1,137 @@
+"""
+CACHE DE SPRITES
+Brilhos radiais (halo, núcleo, centro) e pétalas são renderizados uma vez
+por chave quantizada (raio, matiz, intensidade[, ângulo]) e desenhados com
+um único Surface.blits por camada, em vez de duas ou três chamadas de
+pygame.draw por ponto. Os sprites usam colorkey: a cópia é opaca, como o
+desenho direto. Numa tela interna escalada o sprite já nasce na resolução
+interna (o cache separa as entradas por fator)
+"""
+
+import math
+import numpy as np
+import pygame
+
+from mustem_core.render_scale import surface_factor
+from mustem_core.shapes import place, unit_ellipse
+
+COLORKEY = (255, 0, 255)  # Fora das paletas dos dois apps
+HUE_LEVELS = 64           # Matiz em passos de 5,6°
+INTENSITY_LEVELS = 32     # Intensidade/vida 0-1
+ANGLE_LEVELS = 16         # Rotações pré-calculadas das pétalas (meia volta: a elipse é simétrica)
+PETAL_VERTICES = 16
+
+
+def quantize(values, levels):
+    """Valores 0-1 -> níveis inteiros 0..levels-1 (lista, pronta para compor chaves)"""
+    return np.rint(np.clip(values, 0.0, 1.0) * (levels - 1)).astype(int).tolist()
+
+
+def level_value(level, levels):
+    """Nível quantizado -> valor 0-1 usado para renderizar o sprite"""
+    return level / (levels - 1)
+
+
+def angle_levels(angles):
+    """Ângulos (rad) -> índices das rotações pré-calculadas"""
+    return (np.rint(np.mod(angles, math.pi) / math.pi * ANGLE_LEVELS).astype(int) % ANGLE_LEVELS).tolist()
+
+
+def _pixel_radius(radius, factor):
+    return max(1.0, radius * factor) if radius > 0 else 0
+
+
+def render_glow(discs, factor=1.0):
+    """Discos concêntricos [(cor, raio, espessura)] desenhados em ordem; retorna (sprite, centro)"""
+    outer = max(int(math.ceil(_pixel_radius(radius, factor))) for _, radius, _ in discs)
+    surface = pygame.Surface((2 * outer + 1, 2 * outer + 1))
+    surface.fill(COLORKEY)
+    for color, radius, width in discs:
+        if width > 0:
+            width = max(1, int(round(width * factor)))
+        pygame.draw.circle(surface, color, (outer, outer), _pixel_radius(radius, factor), width)
+    surface.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return surface, outer
+
+
+def render_petal(color, highlight, size, angle, factor=1.0):
+    """Pétala elíptica (comprimento 2×size, largura size) girada, com brilho central"""
+    length = size * factor
+    outer = int(math.ceil(length)) + 1
+    surface = pygame.Surface((2 * outer + 1, 2 * outer + 1))
+    surface.fill(COLORKEY)
+    points = place(unit_ellipse(PETAL_VERTICES, 0.5), length, angle, (outer, outer))
+    pygame.draw.polygon(surface, color, list(zip(points.real.tolist(), points.imag.tolist())))
+    pygame.draw.circle(surface, highlight, (outer, outer), _pixel_radius(max(1, size // 2), factor))
+    surface.set_colorkey(COLORKEY, pygame.RLEACCEL)
+    return surface, outer
+
+
+class SpriteCache:
+    """Sprites prontos para blit, indexados por chave quantizada; os mais antigos saem quando enche"""
+
+    def __init__(self, max_entries=2048):
+        self.max_entries = max_entries
+        self.entries = {}   # fator -> {chave: (sprite, centro em pixels)}
+        self.size = 0
+
+        # Estatísticas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, keys, render, factor=1.0):
+        """Sprites das chaves; `render(chave, fator)` cria os que faltam"""
+        entries = self.entries.get(factor)
+        if entries is None:
+            entries = self.entries[factor] = {}
+        found = []
+        misses = 0
+        for key in keys:
+            entry = entries.get(key)
+            if entry is None:
+                entry = entries[key] = render(key, factor)
+                misses += 1
+            found.append(entry)
+        self.hits += len(found) - misses
+        self.misses += misses
+        self.size += misses
+        if self.size > self.max_entries:
+            self.evict()
+        return found
+
+    def evict(self):
+        """Descarta as entradas mais antigas (ordem de inserção) até metade da capacidade"""
+        target = self.max_entries // 2
+        for entries in list(self.entries.values()):
+            while entries and self.size > target:
+                del entries[next(iter(entries))]
+                self.size -= 1
+                self.evictions += 1
+
+    def draw(self, surface, keys, render, xs, ys):
+        """Sprites das chaves centrados em (xs, ys) inteiros, num único blits"""
+        factor = surface_factor(surface)
+        sprites = self.lookup(keys, render, factor)
+        if factor != 1.0:
+            xs = np.rint(np.asarray(xs, dtype=float) * factor).astype(int).tolist()
+            ys = np.rint(np.asarray(ys, dtype=float) * factor).astype(int).tolist()
+        elif isinstance(xs, np.ndarray):
+            xs, ys = xs.tolist(), ys.tolist()
+        # Tela escalada: posições já em pixels internos, direto na Surface
+        pygame.Surface.blits(surface, [(sprite, (x - center, y - center))
+                                       for (sprite, center), x, y in zip(sprites, xs, ys)], doreturn=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'sprites': self.size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,82 @@
+"""
+POOL DE SUPERFÍCIES
+Superfícies com alpha reutilizadas entre quadros para sobreposições
+translúcidas: cada forma usa uma superfície do tamanho de sua caixa
+delimitadora e só a região suja do uso anterior é limpa
+"""
+
+import numpy as np
+import pygame
+
+TRANSPARENT = (0, 0, 0, 0)
+
+
+def points_bounds(points, pad=1, clip=None):
+    """Caixa delimitadora (Rect) de uma lista de pontos, opcionalmente recortada"""
+    return coords_bounds([p[0] for p in points], [p[1] for p in points], pad, clip)
+
+
+def coords_bounds(xs, ys, pad=1, clip=None):
+    """Caixa delimitadora de coordenadas separadas (listas ou arrays)"""
+    left, top = int(np.min(xs)) - pad, int(np.min(ys)) - pad
+    rect = pygame.Rect(left, top, int(np.max(xs)) + pad + 1 - left, int(np.max(ys)) + pad + 1 - top)
+    return rect.clip(clip) if clip is not None else rect
+
+
+class SurfacePool:
+    """Empresta superfícies SRCALPHA; reaproveita a menor livre em que a forma caiba"""
+
+    def __init__(self, granularity=64, flags=pygame.SRCALPHA):
+        self.granularity = granularity
+        self.flags = flags
+        self.free = []      # [(superfície, região suja)]
+        self.in_use = {}    # id(superfície) -> região emprestada
+
+        # Estatísticas
+        self.allocations = 0
+        self.reuses = 0
+        self.allocated_bytes = 0
+        self.cleared_pixels = 0
+
+    def bucket(self, size):
+        g = self.granularity
+        return (max(g, -(-size[0] // g) * g), max(g, -(-size[1] // g) * g))
+
+    def acquire(self, size):
+        """Superfície transparente com pelo menos `size` pixels; usar só a região (0, 0, *size)"""
+        best = None
+        for i, (surface, _) in enumerate(self.free):
+            w, h = surface.get_size()
+            if w >= size[0] and h >= size[1] and (best is None or w * h < best[1]):
+                best = (i, w * h)
+
+        if best is not None:
+            surface, dirty = self.free.pop(best[0])
+            if dirty.width and dirty.height:
+                surface.fill(TRANSPARENT, dirty)
+                self.cleared_pixels += dirty.width * dirty.height
+            self.reuses += 1
+        else:
+            key = self.bucket(size)
+            surface = pygame.Surface(key, self.flags)
+            self.allocations += 1
+            self.allocated_bytes += key[0] * key[1] * surface.get_bytesize()
+
+        self.in_use[id(surface)] = pygame.Rect((0, 0), size)
+        return surface
+
+    def release(self, surface, dirty=None):
+        """Devolve a superfície; `dirty` = região desenhada (padrão: a região emprestada)"""
+        used = self.in_use.pop(id(surface))
+        self.free.append((surface, pygame.Rect(dirty) if dirty else used))
+
+    def stats(self):
+        requests = self.allocations + self.reuses
+        return {
+            'allocations': self.allocations,
+            'reuses': self.reuses,
+            'reuse_ratio': self.reuses / requests if requests else 0.0,
+            'pooled_surfaces': len(self.free) + len(self.in_use),
+            'allocated_bytes': self.allocated_bytes,
+            'cleared_pixels': self.cleared_pixels,
+        }
@@ -0,0 +1,68 @@
+"""
+CACHE DE TEXTO
+Textos constantes são renderizados uma única vez; textos dinâmicos
+(BPM, porcentagens, rótulos que alternam) ficam num cache LRU indexado
+por (fonte, texto, cor)
+"""
+
+from collections import OrderedDict
+
+from mustem_core.render_scale import static_source
+
+
+class TextCache:
+    """Superfícies de texto prontas para blit"""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.pinned = {}            # Constantes: nunca descartadas
+        self.recent = OrderedDict() # Dinâmicos: LRU
+
+        # Estatísticas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def static(self, font, text, color, antialias=True):
+        """Texto constante (título, rótulos fixos)"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.pinned.get(key)
+        if surface is None:
+            surface = static_source(font.render(text, antialias, color))
+            self.pinned[key] = surface
+            self.misses += 1
+        else:
+            self.hits += 1
+        return surface
+
+    def render(self, font, text, color, antialias=True):
+        """Texto dinâmico; o menos usado recentemente sai quando o cache enche"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.recent.get(key)
+        if surface is not None:
+            self.recent.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        surface = static_source(font.render(text, antialias, color))
+        self.recent[key] = surface
+        self.misses += 1
+        if len(self.recent) > self.max_entries:
+            self.recent.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self.pinned.clear()
+        self.recent.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'static': len(self.pinned),
+            'dynamic': len(self.recent),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+        }
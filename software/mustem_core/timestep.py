@@ -0,0 +1,89 @@
+"""
+PASSO FIXO DE SIMULAÇÃO
+A simulação (partículas, espirais, históricos) avança em passos fixos de
+1/60 s, qualquer que seja a taxa de quadros: um quadro a 30 FPS roda dois
+passos, um quadro a 120 FPS às vezes nenhum. O desenho interpola as
+posições das partículas entre os dois últimos passos pela fração de passo
+que sobrou no acumulador.
+
+Decaimentos e suavizações são constantes de tempo τ (segundos) aplicadas
+como exp(-dt/τ), em vez de fatores por quadro (0.98, 0.9, ...) que mudam o
+visual quando a taxa muda. As constantes usadas nos apps reproduzem o
+visual anterior a 60 FPS: fator k por quadro <=> τ = -1 / (60 ln k)
+
+Taxa de quadros (variável de ambiente):
+    MUSTEM_FPS=30     quadros por segundo da janela (padrão: 60)
+"""
+
+import os
+import math
+import contextlib
+import numpy as np
+
+SIMULATION_HZ = 60
+SIMULATION_STEP = 1.0 / SIMULATION_HZ
+MAX_STEPS_PER_FRAME = 8  # Quadros muito longos (janela arrastada) não viram uma rajada de passos
+
+
+def frame_rate(default=60):
+    """Quadros por segundo da janela (MUSTEM_FPS ou o padrão do app)"""
+    return int(os.environ.get('MUSTEM_FPS', default))
+
+
+def decay(dt, time_constant):
+    """Fração que sobra após dt segundos: exp(-dt/τ) (τ escalar ou array)"""
+    return np.exp(-max(0.0, dt) / np.asarray(time_constant, dtype=float))
+
+
+def smoothing(dt, time_constant):
+    """Peso do valor novo numa média exponencial de constante τ"""
+    return 1.0 - decay(dt, time_constant)
+
+
+def ema(current, target, dt, time_constant):
+    """Média exponencial independente da taxa: current -> target com constante τ"""
+    return current + (target - current) * smoothing(dt, time_constant)
+
+
+def time_constant(per_frame, fps=SIMULATION_HZ):
+    """τ equivalente a um fator por quadro antigo (referência para converter constantes)"""
+    return -1.0 / (fps * math.log(per_frame))
+
+
+class FixedTimestep:
+    """Acumulador de tempo: quantos passos fixos rodar neste quadro e a fração que sobrou"""
+
+    def __init__(self, step=SIMULATION_STEP, max_steps=MAX_STEPS_PER_FRAME):
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0  # Fração do próximo passo já decorrida (0-1), para interpolar o desenho
+
+        # Estatísticas
+        self.steps = 0
+        self.frames = 0
+
+    def advance(self, dt):
+        """Acumula dt; retorna o número de passos a simular"""
+        self.accumulator += min(max(0.0, dt), self.max_steps * self.step)
+        steps = int(self.accumulator / self.step + 1e-9)  # 1/30 s = dois passos, apesar do arredondamento
+        self.accumulator = max(0.0, self.accumulator - steps * self.step)
+        self.alpha = self.accumulator / self.step
+        self.steps += steps
+        self.frames += 1
+        return steps
+
+    def stats(self):
+        return {'steps': self.steps, 'frames': self.frames,
+                'steps_per_frame': self.steps / self.frames if self.frames else 0.0}
+
+
+@contextlib.contextmanager
+def interpolated(engines, alpha):
+    """Durante o bloco, as partículas dos motores ficam na posição interpolada entre os dois últimos passos"""
+    saved = [engine.interpolate(alpha) for engine in engines]
+    try:
+        yield
+    finally:
+        for engine, positions in zip(engines, saved):
+            engine.restore(positions)
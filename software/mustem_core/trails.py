@@ -0,0 +1,99 @@
+"""
+RASTROS POR REALIMENTAÇÃO
+Históricos que só existem para desenhar um rastro que some (espiral de DNA,
+espiral winding, filotaxia) podem usar um buffer persistente: o quadro
+anterior é esmaecido com um blit multiplicativo e só a geometria nova é
+desenhada. O custo por quadro passa a ser proporcional aos pontos novos,
+não ao comprimento do histórico. O esmaecimento é exp(-dt/τ), com uma
+cauda linear que leva o rastro a zero, ambos independentes da taxa de
+quadros
+
+Seleção por componente (variável de ambiente, sobreposta pelos argumentos):
+    MUSTEM_TRAILS=all                       todos os componentes com rastros
+    MUSTEM_TRAILS=circular_spectrum         só os nomeados
+"""
+
+import os
+import math
+import pygame
+
+from mustem_core.render_scale import ScaledSurface
+
+
+def trail_settings(names=None):
+    """Conjunto de componentes que desenham rastros no buffer persistente ('all' = todos)"""
+    if names is None:
+        names = os.environ.get('MUSTEM_TRAILS', '')
+    if isinstance(names, str):
+        names = [name.strip() for name in names.split(',') if name.strip()]
+    return set(names)
+
+
+def trail_enabled(settings, name):
+    return 'all' in settings or name in settings
+
+
+def retention(dt, time_constant):
+    """Fração do rastro que sobrevive a um quadro de duração dt"""
+    return math.exp(-max(0.0, dt) / time_constant)
+
+
+def fresh_count(engine, mark):
+    """Partículas criadas desde a marca (contador `spawned` do motor), limitadas às vivas"""
+    return max(0, min(len(engine), engine.spawned - mark))
+
+
+MIN_FADE_LEVELS = 4   # Passo mínimo do produto (níveis de 256): abaixo disso o arredondamento domina
+FLOOR_LEVEL = 64      # A cauda que o produto não alcança some como um pixel neste nível: 64 níveis por τ
+
+
+class TrailFader:
+    """Esmaece uma região do buffer: BLEND_MULT por uma cor constante e BLEND_SUB de alguns níveis
+
+    O produto do pygame arredonda para cima ((v * k + 255) >> 8): com k perto de
+    256 (quadros curtos) ele não reduz nada abaixo de 255 / (256 - k). Por isso
+    as frações mantidas se acumulam entre quadros e o produto só é aplicado
+    quando tira pelo menos MIN_FADE_LEVELS níveis; a subtração tira a cauda que
+    o produto não alcança, FLOOR_LEVEL níveis por τ. As duas dependem só de
+    dt/τ = -ln(fração mantida), não do número de quadros
+    """
+
+    def __init__(self):
+        self.multiply = None
+        self.floor = None
+        self.level = None
+        self.floor_levels = None
+        self.pending = 1.0      # Fração acumulada ainda não aplicada pelo produto
+        self.floor_debt = 0.0   # Níveis da subtração ainda não aplicados (parte fracionária)
+
+    def fade(self, surface, area, retain):
+        if type(surface) is ScaledSurface:
+            area = surface.to_pixels(area)
+        area = pygame.Rect(area)
+        if self.multiply is None or self.multiply.get_size() != area.size:
+            self.multiply = pygame.Surface(area.size)
+            self.floor = pygame.Surface(area.size)
+            self.level = self.floor_levels = None
+
+        retain = max(1e-9, min(1.0, retain))
+        self.pending *= retain
+        self.floor_debt -= math.log(retain) * FLOOR_LEVEL
+        level = max(0, min(255, int(round(self.pending * 256))))
+        if level > 256 - MIN_FADE_LEVELS:
+            return
+        # O que o nível inteiro não aplicou (ou aplicou a mais) fica para o próximo produto
+        self.pending = self.pending * 256 / level if level else 1.0
+        floor_levels = min(255, int(self.floor_debt))
+        self.floor_debt -= floor_levels
+
+        if level != self.level:
+            self.multiply.fill((level, level, level))
+            self.level = level
+        if floor_levels != self.floor_levels:
+            self.floor.fill((floor_levels, floor_levels, floor_levels))
+            self.floor_levels = floor_levels
+
+        # Direto na Surface: a região já está em pixels internos
+        pygame.Surface.blit(surface, self.multiply, area.topleft, special_flags=pygame.BLEND_MULT)
+        if floor_levels:
+            pygame.Surface.blit(surface, self.floor, area.topleft, special_flags=pygame.BLEND_SUB)
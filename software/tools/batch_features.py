@@ -0,0 +1,201 @@
+"""
+EXTRAÇÃO DE CARACTERÍSTICAS EM LOTE
+Executa os analisadores do dashboard e da visualização artística sobre um
+diretório de WAVs, sem interface e mais rápido que o tempo real
+
+Uso:
+    python batch_features.py <diretorio_wavs> <diretorio_saida> [--workers N] [--rate 60]
+"""
+
+import os
+import sys
+import io
+import json
+import time
+import shutil
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+SOFTWARE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, SOFTWARE_DIR)
+sys.path.insert(0, os.path.join(SOFTWARE_DIR, 'dashboard'))
+sys.path.insert(0, os.path.join(SOFTWARE_DIR, 'visualization'))
+
+import numpy as np
+from mustem_core.feature_schema import FEATURE_DTYPE, pack_features
+from mustem_core.feature_store import FeatureStoreWriter, STORE_SUFFIX
+
+MANIFEST_NAME = 'manifest.jsonl'
+ANALYSIS_RATE = 60  # Quadros de análise por segundo (mesma cadência do app ao vivo)
+WRITE_BLOCK = 600   # Quadros acumulados antes de cada escrita no armazenamento
+
+
+def extract_features(audio_file, writer, rate=ANALYSIS_RATE):
+    """Roda os dois pipelines de análise sobre um arquivo, gravando blocos no armazenamento"""
+    import mustem_assistive_dashboard as dashboard
+    import mustem_artistic_visualization as artistic
+
+    # Os analisadores imprimem mensagens de boas-vindas; silencia no modo lote
+    with contextlib.redirect_stdout(io.StringIO()):
+        dash_analyzer = dashboard.EnhancedAudioAnalyzer(audio_file, playback=False)
+        art_analyzer = artistic.GentleAudioAnalyzer(audio_file, playback=False)
+
+    duration = dash_analyzer.duration
+    num_frames = int(duration * rate)
+    block = np.zeros(WRITE_BLOCK, dtype=FEATURE_DTYPE)
+
+    for start in range(0, num_frames, WRITE_BLOCK):
+        count = min(WRITE_BLOCK, num_frames - start)
+        block[:] = 0
+        for j in range(count):
+            t = (start + j) / rate
+            dash_analyzer.set_media_time(t)
+            art_analyzer.set_media_time(t)
+            pack_features(block[j], dash_analyzer.analyze(), art_analyzer.analyze_gently(), t)
+        writer.append(block[:count])
+
+    return num_frames, duration
+
+
+def output_path_for(audio_file, input_dir, output_dir):
+    relative = os.path.relpath(audio_file, input_dir)
+    return os.path.join(output_dir, os.path.splitext(relative)[0] + STORE_SUFFIX)
+
+
+def process_file(audio_file, output_file, rate):
+    """Tarefa do worker: extrai e grava o resultado de um arquivo"""
+    started = time.perf_counter()
+    try:
+        # Grava num diretório temporário e renomeia: uma interrupção nunca deixa saída pela metade
+        temp_dir = output_file + '.partial'
+        for stale in (temp_dir, output_file):
+            if os.path.exists(stale):
+                shutil.rmtree(stale)
+
+        metadata = {'source': os.path.basename(audio_file)}
+        with FeatureStoreWriter(temp_dir, frame_rate=rate, metadata=metadata) as writer:
+            num_frames, duration = extract_features(audio_file, writer, rate)
+        os.replace(temp_dir, output_file)
+
+        return {'file': audio_file, 'output': output_file, 'status': 'ok',
+                'duration': duration, 'frames': num_frames,
+                'seconds': time.perf_counter() - started}
+    except Exception as e:
+        return {'file': audio_file, 'output': output_file, 'status': 'error',
+                'error': f'{type(e).__name__}: {e}', 'duration': 0.0,
+                'seconds': time.perf_counter() - started}
+
+
+def find_wavs(input_dir):
+    wavs = []
+    for root, _, files in os.walk(input_dir):
+        for name in files:
+            if name.lower().endswith('.wav'):
+                wavs.append(os.path.join(root, name))
+    return sorted(wavs)
+
+
+def load_completed(manifest_file, output_dir):
+    """Lê o manifesto para retomar após interrupção (caminhos relativos ao diretório de entrada)"""
+    completed = set()
+    if not os.path.exists(manifest_file):
+        return completed
+    with open(manifest_file) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # Linha truncada por interrupção
+            source = entry.get('source')
+            if entry.get('status') != 'ok' or source is None:
+                continue
+            # A saída é procurada no diretório atual: entrada e saída podem ter mudado de lugar
+            if os.path.exists(os.path.join(output_dir, os.path.splitext(source)[0] + STORE_SUFFIX)):
+                completed.add(source)
+    return completed
+
+
+def format_throughput(audio_seconds, wall_seconds):
+    """Vazão em horas de áudio por minuto de relógio"""
+    if wall_seconds <= 0:
+        return 0.0
+    return (audio_seconds / 3600.0) / (wall_seconds / 60.0)
+
+
+def run_batch(input_dir, output_dir, workers=None, rate=ANALYSIS_RATE):
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_file = os.path.join(output_dir, MANIFEST_NAME)
+
+    wavs = find_wavs(input_dir)
+    completed = load_completed(manifest_file, output_dir)
+    pending = [w for w in wavs if os.path.relpath(w, input_dir) not in completed]
+
+    print(f"Arquivos encontrados: {len(wavs)} | já processados: {len(completed)} | pendentes: {len(pending)}")
+    if not pending:
+        return
+
+    started = time.perf_counter()
+    audio_seconds = 0.0
+    failures = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as pool, open(manifest_file, 'a') as manifest:
+        futures = {
+            pool.submit(process_file, wav, output_path_for(wav, input_dir, output_dir), rate): wav
+            for wav in pending
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            wav = futures[future]
+            try:
+                entry = future.result()
+            except BrokenProcessPool as e:
+                # Um worker morreu (ex.: falta de memória): os arquivos restantes ficam como falha
+                # e são refeitos na próxima execução
+                entry = {'file': wav, 'output': output_path_for(wav, input_dir, output_dir), 'status': 'error',
+                         'error': f'{type(e).__name__}: {e}', 'duration': 0.0, 'seconds': 0.0}
+            entry['source'] = os.path.relpath(wav, input_dir)
+            manifest.write(json.dumps(entry) + '\n')
+            manifest.flush()
+
+            if entry['status'] == 'ok':
+                audio_seconds += entry['duration']
+            else:
+                failures += 1
+                print(f"  Erro em {entry['file']}: {entry['error']}")
+
+            elapsed = time.perf_counter() - started
+            print(f"[{done}/{len(pending)}] {os.path.basename(entry['file'])} "
+                  f"({entry['duration']:.1f}s de áudio em {entry['seconds']:.1f}s) - "
+                  f"{format_throughput(audio_seconds, elapsed):.3f} h de áudio/min")
+
+    elapsed = time.perf_counter() - started
+    print("=" * 60)
+    print(f"Concluído: {len(pending) - failures} arquivos, {failures} erros")
+    print(f"Áudio processado: {audio_seconds / 3600.0:.3f} h em {elapsed / 60.0:.2f} min")
+    print(f"Vazão: {format_throughput(audio_seconds, elapsed):.3f} h de áudio por minuto")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extração de características MUSTEM em lote')
+    parser.add_argument('input_dir', help='Diretório com arquivos WAV (busca recursiva)')
+    parser.add_argument('output_dir', help='Diretório de saída (um armazenamento .mfs por faixa + manifesto)')
+    parser.add_argument('--workers', type=int, default=None, help='Processos paralelos (padrão: nº de CPUs)')
+    parser.add_argument('--rate', type=float, default=ANALYSIS_RATE, help='Quadros de análise por segundo')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.input_dir):
+        print(f"Erro: diretório '{args.input_dir}' não encontrado.")
+        sys.exit(1)
+
+    try:
+        run_batch(args.input_dir, args.output_dir, args.workers, args.rate)
+    except KeyboardInterrupt:
+        print("\nInterrompido. Execute novamente para retomar de onde parou.")
+
+
+if __name__ == "__main__":
+    main()
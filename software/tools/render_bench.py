@@ -0,0 +1,219 @@
+"""
+BENCHMARK DE RENDERIZAÇÃO
+Roda o dashboard ou a visualização artística fora da tela (driver SDL dummy)
+sobre um WAV, posicionando a análise quadro a quadro, e mede o tempo de
+atualização/desenho e o número de chamadas de pygame.draw por camada
+
+Uso:
+    python render_bench.py <arquivo.wav> [--app art|dash] [--frames 600] [--start 2.0] [--seed 1]
+                           [--budget MS]  (liga o governador de qualidade com este orçamento)
+                           [--scale 1,0.75,0.5] [--display WxH]  (taxa de preenchimento por escala interna)
+                           [--splat all|nome,nome]  (rasterizador de splatting nos componentes)
+                           [--trails all|nome,nome]  (rastros em buffer persistente)
+"""
+
+import os
+import sys
+import io
+import time
+import argparse
+import contextlib
+from collections import defaultdict
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+SOFTWARE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, SOFTWARE_DIR)
+sys.path.insert(0, os.path.join(SOFTWARE_DIR, 'dashboard'))
+sys.path.insert(0, os.path.join(SOFTWARE_DIR, 'visualization'))
+
+import numpy as np
+import pygame
+from mustem_core.rng import random_streams
+from render_offline import parse_size
+
+DRAW_FUNCTIONS = ['line', 'lines', 'aaline', 'aalines', 'circle', 'rect', 'polygon',
+                  'ellipse', 'arc']
+WARMUP_FRAMES = 30
+
+
+class DrawCounter:
+    """Conta chamadas de pygame.draw.* (substitui as funções do módulo)"""
+
+    def __init__(self):
+        self.calls = 0
+        self.by_function = defaultdict(int)
+        self.originals = {}
+
+    def install(self):
+        for name in DRAW_FUNCTIONS:
+            original = getattr(pygame.draw, name)
+            self.originals[name] = original
+            setattr(pygame.draw, name, self.wrap(name, original))
+
+    def wrap(self, name, original):
+        def counted(*args, **kwargs):
+            self.calls += 1
+            self.by_function[name] += 1
+            return original(*args, **kwargs)
+        return counted
+
+    def uninstall(self):
+        for name, original in self.originals.items():
+            setattr(pygame.draw, name, original)
+
+
+def create_app(app, audio_file, render_scale=None, display_size=None, splat_components=None,
+               trail_components=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        if app == 'dash':
+            import mustem_assistive_dashboard as dashboard
+            visualizer = dashboard.TherapeuticMusicVisualizer(audio_file, render_scale=render_scale,
+                                                              display_size=display_size,
+                                                              splat_components=splat_components,
+                                                              trail_components=trail_components)
+        else:
+            import mustem_artistic_visualization as artistic
+            visualizer = artistic.DelicateVisualizer(audio_file, render_scale=render_scale,
+                                                     display_size=display_size,
+                                                     splat_components=splat_components,
+                                                     trail_components=trail_components)
+    return visualizer
+
+
+def instrument_layers(visualizer, counter, layer_ms, layer_calls):
+    """Mede tempo e chamadas de desenho de cada camada do compositor"""
+    for layer in visualizer.compositor.layers:
+        def timed(surface, render=layer.render, name=layer.name):
+            calls = counter.calls
+            started = time.perf_counter()
+            render(surface)
+            layer_ms[name].append((time.perf_counter() - started) * 1000.0)
+            layer_calls[name].append(counter.calls - calls)
+        layer.render = timed
+
+
+def run_bench(audio_file, app='art', frames=600, start=2.0, seed=1, rate=60.0, budget_ms=None,
+              render_scale=None, display_size=None, splat_components=None, trail_components=None):
+    random_streams.seed(seed)
+    visualizer = create_app(app, audio_file, render_scale, display_size, splat_components, trail_components)
+    analyzer = visualizer.analyzer
+    
+    # Governador desligado por padrão para medir sempre a qualidade máxima
+    quality = visualizer.quality
+    quality.enabled = budget_ms is not None
+    if budget_ms is not None:
+        quality.budget_ms = budget_ms
+
+    # Apresentação não entra na medida
+    pygame.display.flip = lambda *args: None
+    pygame.display.update = lambda *args: None
+
+    counter = DrawCounter()
+    counter.install()
+    layer_ms, layer_calls = defaultdict(list), defaultdict(list)
+    instrument_layers(visualizer, counter, layer_ms, layer_calls)
+
+    update_ms, draw_ms, draw_calls = [], [], []
+    dt = 1.0 / rate
+    for k in range(frames):
+        analyzer.set_media_time(start + k * dt)
+
+        started = time.perf_counter()
+        visualizer.update(dt)
+        updated = time.perf_counter()
+        calls = counter.calls
+        visualizer.draw()
+        finished = time.perf_counter()
+
+        update_ms.append((updated - started) * 1000.0)
+        draw_ms.append((finished - updated) * 1000.0)
+        draw_calls.append(counter.calls - calls)
+        quality.record((finished - started) * 1000.0, now=k * dt)
+
+    counter.uninstall()
+    skip = min(WARMUP_FRAMES, frames // 2)
+    return {
+        'frames': frames - skip,
+        'update_ms': float(np.mean(update_ms[skip:])),
+        'draw_ms': float(np.mean(draw_ms[skip:])),
+        'draw_p95_ms': float(np.percentile(draw_ms[skip:], 95)),
+        'draw_calls': float(np.mean(draw_calls[skip:])),
+        # Camadas em cache só aparecem se foram redesenhadas durante a medida
+        'layers': {name: (float(np.sum(layer_ms[name][skip:])) / (frames - skip),
+                          float(np.sum(layer_calls[name][skip:])) / (frames - skip))
+                   for name in layer_ms if len(layer_ms[name]) > skip},
+        'quality': quality.stats(),
+        'present': visualizer.compositor.present_stats(),
+        'sprites': sys.modules[type(visualizer).__module__].sprite_cache.stats(),
+        'display_size': visualizer.screen.get_size(),
+    }
+
+
+def print_report(app, result):
+    print(f"App: {app} | quadros medidos: {result['frames']}")
+    print(f"  update: {result['update_ms']:.2f} ms")
+    print(f"  draw:   {result['draw_ms']:.2f} ms (p95 {result['draw_p95_ms']:.2f} ms)")
+    print(f"  chamadas pygame.draw por quadro: {result['draw_calls']:.0f}")
+    print("  Por camada (ms, chamadas):")
+    for name, (ms, calls) in result['layers'].items():
+        print(f"    {name:<20} {ms:7.2f} ms {calls:8.0f}")
+    quality = result['quality']
+    print(f"  Qualidade: nível {quality['tier']} | quadros por nível {quality['tier_frames']} | "
+          f"reduções {quality['downgrades']}, aumentos {quality['upgrades']}")
+    present = result['present']
+    print(f"  Escala interna: {present['render_scale']:g} | ampliação {present['upscale_ms']:.2f} ms")
+    sprites = result['sprites']
+    print(f"  Sprites: {sprites['sprites']} em cache | acertos {sprites['hit_ratio']:.1%} "
+          f"({sprites['misses']} renderizados, {sprites['evictions']} descartados)")
+
+
+def print_scale_summary(results):
+    """Taxa de preenchimento: custo de desenho por escala interna (ampliação incluída no draw)"""
+    width, height = results[0]['display_size']
+    print(f"Escalas de renderização (janela {width}x{height}):")
+    print(f"  {'escala':>6} {'pixels':>10} {'draw ms':>8} {'ampliação':>10} {'vs 1.0':>7}")
+    reference = results[0]['draw_ms']
+    for result in results:
+        scale = result['present']['render_scale']
+        pixels = int(width * scale) * int(height * scale)
+        print(f"  {scale:>6g} {pixels:>10} {result['draw_ms']:>8.2f} "
+              f"{result['present']['upscale_ms']:>8.2f}ms {result['draw_ms'] / reference:>6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de renderização MUSTEM')
+    parser.add_argument('audio_file', help='Arquivo WAV')
+    parser.add_argument('--app', choices=['art', 'dash'], default='art')
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--start', type=float, default=2.0, help='Posição inicial no áudio (s)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--budget', type=float, default=None, help='Orçamento do governador (ms/quadro)')
+    parser.add_argument('--scale', default=None, help='Escalas internas separadas por vírgula (ex.: 1,0.75,0.5)')
+    parser.add_argument('--display', type=parse_size, default=None, help='Tamanho da janela (ex.: 2800x1600)')
+    parser.add_argument('--splat', default=None, help="Componentes com splatting ('all' ou nomes separados por vírgula)")
+    parser.add_argument('--trails', default=None, help="Componentes com rastro em buffer persistente ('all' ou nomes)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.audio_file):
+        print(f"Erro: arquivo '{args.audio_file}' não encontrado.")
+        sys.exit(1)
+
+    scales = [float(value) for value in args.scale.split(',')] if args.scale else [None]
+    results = []
+    for scale in scales:
+        result = run_bench(args.audio_file, args.app, args.frames, args.start, args.seed,
+                           budget_ms=args.budget, render_scale=scale, display_size=args.display,
+                           splat_components=args.splat, trail_components=args.trails)
+        print_report(args.app, result)
+        results.append(result)
+    if len(results) > 1:
+        print_scale_summary(results)
+    pygame.quit()
+    os._exit(0)  # Timer de auto-início da visualização artística não deve segurar o processo
+
+
+if __name__ == "__main__":
+    main()
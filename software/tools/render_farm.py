@@ -0,0 +1,278 @@
+"""
+FAZENDA DE RENDERIZAÇÃO
+Renderização offline em paralelo: as características são calculadas uma vez,
+em sequência (o analisador tem estado: médias móveis, DNA musical), e a linha
+do tempo é dividida em segmentos de duração fixa renderizados num pool de
+processos. Cada segmento começa alguns segundos antes (aquecimento, quadros
+descartados) para que partículas, espiral e histórico já estejam povoados,
+e cada componente visual recebe um fluxo aleatório semeado por (semente,
+segmento). Os segmentos são concatenados em ordem
+
+A saída é idêntica bit a bit entre execuções e independe do número de
+processos: ela depende só da semente, da duração do segmento e do aquecimento
+
+Uso:
+    python render_farm.py <arquivo.wav> <saida> [--app art|dash] [--fps 60]
+                          [--workers N] [--segment 10] [--warmup 2] [--seed 1]
+
+    saida: video.y4m | video.rgb | - (RGB24 na saída padrão) | pasta/ (PNGs)
+"""
+
+import os
+import sys
+import io
+import time
+import pickle
+import shutil
+import argparse
+import tempfile
+import contextlib
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from render_offline import (create_app, disable_presentation, frame_count, frame_time,
+                            RawWriter, Y4MWriter, PNGWriter, y4m_header)
+
+import pygame
+from mustem_core.clock import animation_clock
+from mustem_core.rng import random_streams
+
+SEGMENT_S = 10.0   # Duração de cada segmento (fixa: não depende do número de processos)
+WARMUP_S = 2.0     # Quadros renderizados e descartados antes de cada segmento
+
+
+def create_analyzer(app, audio_file):
+    """Analisador do app sem reprodução; retorna (analisador, método de análise)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        if app == 'dash':
+            import mustem_assistive_dashboard as dashboard
+            analyzer = dashboard.EnhancedAudioAnalyzer(audio_file, playback=False)
+            return analyzer, analyzer.analyze
+        import mustem_artistic_visualization as artistic
+        analyzer = artistic.GentleAudioAnalyzer(audio_file, playback=False)
+        return analyzer, analyzer.analyze_gently
+
+
+def screen_size(app):
+    """Tamanho da tela do app (cabeçalho do Y4M, escrito antes de qualquer segmento terminar)"""
+    if app == 'dash':
+        import mustem_assistive_dashboard as dashboard
+        return dashboard.SCREEN_WIDTH, dashboard.SCREEN_HEIGHT
+    import mustem_artistic_visualization as artistic
+    return artistic.SCREEN_WIDTH, artistic.SCREEN_HEIGHT
+
+
+class ReplayAnalyzer:
+    """Substitui o analisador no processo de renderização: devolve as características pré-calculadas do quadro atual"""
+
+    def __init__(self, frames, first_frame):
+        self.frames = frames            # Características serializadas (pickle), uma por quadro
+        self.first_frame = first_frame
+        self.frame = first_frame
+
+    def seek(self, frame):
+        self.frame = frame
+
+    def set_media_time(self, seconds):
+        pass
+
+    def analyze(self):
+        # Cópia nova a cada chamada, como o analisador real
+        return pickle.loads(self.frames[self.frame - self.first_frame])
+
+    analyze_gently = analyze
+    get_serene_state = analyze
+
+
+class SegmentPool:
+    """Pool com um processo novo por segmento antes do Python 3.11 (sem max_tasks_per_child)
+
+    Mesmo uso de ProcessPoolExecutor: submit() devolve um Future
+    """
+
+    def __init__(self, workers):
+        self.pool = multiprocessing.Pool(workers, maxtasksperchild=1)
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.pool.apply_async(fn, args, callback=future.set_result, error_callback=future.set_exception)
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, kind, value, traceback):
+        if kind is None:
+            self.pool.close()
+        else:
+            self.pool.terminate()
+        self.pool.join()
+
+
+def segment_pool(workers):
+    """Processos novos por segmento: nenhum estado de módulo passa de um segmento a outro"""
+    if sys.version_info >= (3, 11):
+        return ProcessPoolExecutor(workers, max_tasks_per_child=1)
+    return SegmentPool(workers)
+
+
+def plan_segments(frames, fps, segment_s=SEGMENT_S, warmup_s=WARMUP_S):
+    """Segmentos (índice, início do aquecimento, início, fim) em quadros"""
+    length = max(1, int(round(segment_s * fps)))
+    warmup = max(0, int(round(warmup_s * fps)))
+    return [(index, max(0, start - warmup), start, min(frames, start + length))
+            for index, start in enumerate(range(0, frames, length))]
+
+
+def output_kind(path):
+    if path == '-' or path.endswith('.rgb') or path.endswith('.raw'):
+        return 'raw'
+    if path.endswith('.y4m'):
+        return 'y4m'
+    return 'png'
+
+
+def render_segment(job):
+    """Processo de renderização: um segmento, do aquecimento ao fim, gravado numa parte"""
+    random_streams.seed(job['seed'], job['index'])
+    visualizer = create_app(job['app'], job['audio_file'])
+    visualizer.analyzer = replay = ReplayAnalyzer(job['features'], job['warm_start'])
+    screen = visualizer.screen
+    disable_presentation()
+
+    kind, size, fps = job['kind'], screen.get_size(), job['fps']
+    if kind == 'png':
+        writer = PNGWriter(job['part'], size, fps, first_index=job['start'])
+    elif kind == 'y4m':
+        writer = Y4MWriter(job['part'], size, fps, header=False)
+    else:
+        writer = RawWriter(job['part'], size, fps)
+
+    dt = 1.0 / fps
+    try:
+        for k, media_time in enumerate(job['times'], job['warm_start']):
+            replay.seek(k)
+            animation_clock.set(media_time)
+            visualizer.update(dt)
+            visualizer.draw()
+            if k >= job['start']:
+                writer.write(screen)
+    finally:
+        writer.close()
+        animation_clock.release()
+    pygame.quit()
+    return job['end'] - job['start']
+
+
+def render_farm(audio_file, output, app='art', fps=60, seed=1, workers=None,
+                segment_s=SEGMENT_S, warmup_s=WARMUP_S, log=sys.stderr):
+    started = time.perf_counter()
+    analyzer, analyze = create_analyzer(app, audio_file)
+    sample_rate = analyzer.sample_rate
+    frames = frame_count(sample_rate, 0, len(analyzer.audio_data), fps)
+    times = [frame_time(k, 0, sample_rate, fps) for k in range(frames)]
+    segments = plan_segments(frames, fps, segment_s, warmup_s)
+
+    kind = output_kind(output)
+    if kind == 'png':
+        parts_dir = None
+    else:
+        parent = None if output == '-' else os.path.dirname(os.path.abspath(output))
+        parts_dir = tempfile.mkdtemp(prefix='mustem_farm_', dir=parent)
+
+    features = [None] * frames
+    futures = []
+    analysis_s = 0.0
+    try:
+        with segment_pool(workers) as pool:
+            pending = 0
+            for k in range(frames):
+                # Análise sequencial; cada segmento é enviado assim que suas características ficam prontas
+                analysis_started = time.perf_counter()
+                analyzer.set_media_time(times[k])
+                features[k] = pickle.dumps(analyze(), protocol=pickle.HIGHEST_PROTOCOL)
+                analysis_s += time.perf_counter() - analysis_started
+
+                while pending < len(segments) and segments[pending][3] == k + 1:
+                    index, warm_start, start, end = segments[pending]
+                    futures.append(pool.submit(render_segment, {
+                        'app': app, 'audio_file': audio_file, 'fps': fps, 'seed': seed,
+                        'index': index, 'warm_start': warm_start, 'start': start, 'end': end,
+                        'features': features[warm_start:end], 'times': times[warm_start:end],
+                        'kind': kind,
+                        'part': output if kind == 'png' else os.path.join(parts_dir, f"part_{index:05d}"),
+                    }))
+                    pending += 1
+                    # Quadros anteriores ao próximo aquecimento não são mais necessários
+                    if pending < len(segments):
+                        features[:segments[pending][1]] = [None] * segments[pending][1]
+
+            # Concatena as partes em ordem
+            stream = None
+            if kind != 'png':
+                stream = sys.stdout.buffer if output == '-' else open(output, 'wb')
+                if kind == 'y4m':
+                    stream.write(y4m_header(screen_size(app), fps))
+            try:
+                for (index, warm_start, start, end), future in zip(segments, futures):
+                    future.result()
+                    if stream is not None:
+                        part = os.path.join(parts_dir, f"part_{index:05d}")
+                        with open(part, 'rb') as source:
+                            shutil.copyfileobj(source, stream, 1 << 24)
+                        os.remove(part)
+                    if log is not None:
+                        elapsed = time.perf_counter() - started
+                        print(f"  segmento {index + 1}/{len(segments)} ({end} quadros, "
+                              f"{end / elapsed:.1f} FPS)", file=log)
+            finally:
+                if stream is sys.stdout.buffer:
+                    stream.flush()
+                elif stream is not None:
+                    stream.close()
+    finally:
+        if parts_dir is not None:
+            shutil.rmtree(parts_dir, ignore_errors=True)
+
+    elapsed = time.perf_counter() - started
+    warmup_frames = sum(start - warm_start for _, warm_start, start, _ in segments)
+    return {
+        'frames': frames,
+        'segments': len(segments),
+        'warmup_frames': warmup_frames,
+        'analysis_seconds': analysis_s,
+        'seconds': elapsed,
+        'fps': frames / elapsed if elapsed > 0 else 0.0,
+        'realtime_factor': (frames / fps) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Renderização offline MUSTEM em paralelo')
+    parser.add_argument('audio_file', help='Arquivo WAV')
+    parser.add_argument('output', help='video.y4m, video.rgb, - (stdout) ou pasta para PNGs')
+    parser.add_argument('--app', choices=['art', 'dash'], default='art')
+    parser.add_argument('--fps', type=int, default=60)
+    parser.add_argument('--workers', type=int, default=None, help='Processos (padrão: nº de núcleos)')
+    parser.add_argument('--segment', type=float, default=SEGMENT_S, help='Duração de cada segmento (s)')
+    parser.add_argument('--warmup', type=float, default=WARMUP_S, help='Aquecimento antes de cada segmento (s)')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.audio_file):
+        print(f"Erro: arquivo '{args.audio_file}' não encontrado.", file=sys.stderr)
+        sys.exit(1)
+
+    workers = args.workers or os.cpu_count()
+    print(f"Renderizando {args.audio_file} ({args.app}, {args.fps} FPS, {workers} processos) "
+          f"-> {args.output}", file=sys.stderr)
+    result = render_farm(args.audio_file, args.output, args.app, args.fps, args.seed, workers,
+                         args.segment, args.warmup)
+    print(f"Concluído: {result['frames']} quadros em {result['segments']} segmentos "
+          f"(+{result['warmup_frames']} de aquecimento) em {result['seconds']:.1f}s | "
+          f"{result['fps']:.1f} FPS ({result['realtime_factor']:.2f}x tempo real) | "
+          f"análise {result['analysis_seconds']:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+RENDERIZAÇÃO OFFLINE
+Renderiza o dashboard ou a visualização artística fora da tela (driver SDL
+dummy), mais rápido que o tempo real: cada quadro k é posicionado na amostra
+round(k * taxa / fps) do WAV, e análise e animações seguem esse relógio.
+Os quadros saem da superfície em vídeo bruto RGB24, Y4M (YUV 4:4:4) ou PNGs
+
+Uso:
+    python render_offline.py <arquivo.wav> <saida> [--app art|dash] [--fps 60]
+                             [--start 0] [--duration S] [--seed 1] [--scale 1.0] [--display WxH]
+
+    saida: video.y4m | video.rgb | - (RGB24 na saída padrão) | pasta/ (PNGs)
+
+Exemplos:
+    python render_offline.py musica.wav musica.y4m --app art
+    python render_offline.py musica.wav - --fps 30 | ffmpeg -f rawvideo -pix_fmt rgb24 \\
+        -s 1400x800 -r 30 -i - -i musica.wav -shortest musica.mp4
+"""
+
+import os
+import sys
+import io
+import time
+import argparse
+import contextlib
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+SOFTWARE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, SOFTWARE_DIR)
+sys.path.insert(0, os.path.join(SOFTWARE_DIR, 'dashboard'))
+sys.path.insert(0, os.path.join(SOFTWARE_DIR, 'visualization'))
+
+import numpy as np
+import pygame
+from mustem_core.clock import animation_clock
+from mustem_core.rng import random_streams
+
+# BT.601 em faixa limitada, coeficientes inteiros (x256), padrão esperado pelo ffmpeg para Y4M
+YUV_COEFFICIENTS = ((66, 129, 25, 16), (-38, -74, 112, 128), (112, -94, -18, 128))
+
+
+def create_app(app, audio_file, render_scale=None, display_size=None):
+    """Visualizador sem reprodução de áudio (o relógio vem das amostras)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        if app == 'dash':
+            import mustem_assistive_dashboard as dashboard
+            visualizer = dashboard.TherapeuticMusicVisualizer(audio_file, playback=False, render_scale=render_scale,
+                                                              display_size=display_size)
+        else:
+            import mustem_artistic_visualization as artistic
+            visualizer = artistic.DelicateVisualizer(audio_file, playback=False, render_scale=render_scale,
+                                                     display_size=display_size)
+    # Offline sempre em qualidade máxima
+    visualizer.quality.enabled = False
+    return visualizer
+
+
+def disable_presentation():
+    """Apresentação na tela não faz sentido offline"""
+    pygame.display.flip = lambda *args: None
+    pygame.display.update = lambda *args: None
+
+
+def frame_count(sample_rate, first_sample, last_sample, fps):
+    return max(0, int((last_sample - first_sample) * fps // sample_rate))
+
+
+def frame_time(k, first_sample, sample_rate, fps):
+    """Relógio de amostras: instante de mídia do quadro k (amostra round(k * taxa / fps))"""
+    sample = first_sample + int(round(k * sample_rate / fps))
+    return sample / sample_rate
+
+
+def frame_bytes(surface):
+    """Quadro RGB24 em ordem de linhas"""
+    return pygame.image.tobytes(surface, 'RGB')
+
+
+def frame_rgb(surface):
+    """Quadro como array (altura, largura, 3)"""
+    width, height = surface.get_size()
+    return np.frombuffer(frame_bytes(surface), dtype=np.uint8).reshape(height, width, 3)
+
+
+class RawWriter:
+    """RGB24 bruto, quadro após quadro (arquivo ou saída padrão)"""
+
+    def __init__(self, path, size, fps):
+        self.stream = sys.stdout.buffer if path == '-' else open(path, 'wb')
+
+    def write(self, surface):
+        self.stream.write(frame_bytes(surface))
+
+    def close(self):
+        if self.stream is not sys.stdout.buffer:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+
+def y4m_header(size, fps):
+    width, height = size
+    return f"YUV4MPEG2 W{width} H{height} F{fps}:1 Ip A1:1 C444\n".encode('ascii')
+
+
+class Y4MWriter:
+    """YUV4MPEG2 4:4:4 (sem subamostragem de croma: as linhas finas não borram)"""
+
+    def __init__(self, path, size, fps, header=True):
+        self.stream = open(path, 'wb')
+        width, height = size
+        if header:
+            self.stream.write(y4m_header(size, fps))
+        self.planes = np.empty((3, height, width), dtype=np.uint8)
+
+    def write(self, surface):
+        rgb = frame_rgb(surface)
+        channels = [rgb[..., c].astype(np.int16) for c in range(3)]
+        for plane, (kr, kg, kb, offset) in zip(self.planes, YUV_COEFFICIENTS):
+            if offset == 16:
+                # Luma passa de 32767: mesma conta em uint16 (canais são não negativos)
+                r, g, b = (c.view(np.uint16) for c in channels)
+            else:
+                r, g, b = channels
+            value = kr * r + kg * g + kb * b + 128
+            plane[:] = (value >> 8) + offset
+        self.stream.write(b'FRAME\n')
+        self.stream.write(self.planes.tobytes())
+
+    def close(self):
+        self.stream.close()
+
+
+class PNGWriter:
+    """Um PNG por quadro numa pasta"""
+
+    def __init__(self, path, size, fps, first_index=0):
+        self.folder = path
+        os.makedirs(path, exist_ok=True)
+        self.index = first_index
+
+    def write(self, surface):
+        pygame.image.save(surface, os.path.join(self.folder, f"frame_{self.index:06d}.png"))
+        self.index += 1
+
+    def close(self):
+        pass
+
+
+def open_writer(path, size, fps):
+    if path == '-' or path.endswith('.rgb') or path.endswith('.raw'):
+        return RawWriter(path, size, fps)
+    if path.endswith('.y4m'):
+        return Y4MWriter(path, size, fps)
+    return PNGWriter(path, size, fps)
+
+
+def parse_size(value):
+    """'2800x1600' -> (2800, 1600)"""
+    width, height = value.lower().split('x')
+    return int(width), int(height)
+
+
+def render(audio_file, output, app='art', fps=60, start=0.0, duration=None, seed=1, log=sys.stderr,
+           render_scale=None, display_size=None):
+    random_streams.seed(seed)
+    visualizer = create_app(app, audio_file, render_scale, display_size)
+    analyzer = visualizer.analyzer
+    screen = visualizer.screen
+    disable_presentation()
+
+    sample_rate = analyzer.sample_rate
+    total_samples = len(analyzer.audio_data)
+    first_sample = int(round(start * sample_rate))
+    last_sample = total_samples if duration is None else min(total_samples, first_sample + int(duration * sample_rate))
+    frames = frame_count(sample_rate, first_sample, last_sample, fps)
+
+    writer = open_writer(output, screen.get_size(), fps)
+    dt = 1.0 / fps
+    started = time.perf_counter()
+    try:
+        for k in range(frames):
+            # Análise e animações no mesmo instante de mídia
+            media_time = frame_time(k, first_sample, sample_rate, fps)
+            analyzer.set_media_time(media_time)
+            animation_clock.set(media_time)
+
+            visualizer.update(dt)
+            visualizer.draw()
+            writer.write(screen)
+
+            if log is not None and (k + 1) % (fps * 5) == 0:
+                elapsed = time.perf_counter() - started
+                print(f"  {k + 1}/{frames} quadros ({(k + 1) / elapsed:.1f} FPS)", file=log)
+    finally:
+        writer.close()
+        animation_clock.release()
+
+    elapsed = time.perf_counter() - started
+    return {
+        'frames': frames,
+        'seconds': elapsed,
+        'fps': frames / elapsed if elapsed > 0 else 0.0,
+        'realtime_factor': (frames / fps) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Renderização offline MUSTEM')
+    parser.add_argument('audio_file', help='Arquivo WAV')
+    parser.add_argument('output', help='video.y4m, video.rgb, - (stdout) ou pasta para PNGs')
+    parser.add_argument('--app', choices=['art', 'dash'], default='art')
+    parser.add_argument('--fps', type=int, default=60)
+    parser.add_argument('--start', type=float, default=0.0, help='Posição inicial no áudio (s)')
+    parser.add_argument('--duration', type=float, default=None, help='Duração a renderizar (s)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--scale', type=float, default=None, help='Escala de renderização interna (ex.: 0.5)')
+    parser.add_argument('--display', type=parse_size, default=None, help='Tamanho do quadro de saída (ex.: 2800x1600)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.audio_file):
+        print(f"Erro: arquivo '{args.audio_file}' não encontrado.", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Renderizando {args.audio_file} ({args.app}, {args.fps} FPS) -> {args.output}", file=sys.stderr)
+    result = render(args.audio_file, args.output, args.app, args.fps, args.start, args.duration, args.seed,
+                    render_scale=args.scale, display_size=args.display)
+    print(f"Concluído: {result['frames']} quadros em {result['seconds']:.1f}s | "
+          f"{result['fps']:.1f} FPS ({result['realtime_factor']:.2f}x tempo real)", file=sys.stderr)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
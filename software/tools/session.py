@@ -0,0 +1,128 @@
+"""
+SESSÃO COM VÁRIAS VISÕES
+Um único processo decodifica e analisa o áudio, toca o som e publica as
+características e o relógio da mídia no barramento (feature_bus). Cada visão
+(dashboard do terapeuta, visualização artística do paciente, visões futuras)
+roda no seu processo, com a sua janela, inscrita no barramento: nenhuma
+analisa nem toca áudio, e todas seguem o relógio de quem toca
+
+ESPAÇO em qualquer visão pausa/retoma a sessão inteira; ESC fecha só aquela
+visão. A sessão termina quando a última visão fecha
+
+Uso:
+    python session.py <arquivo.wav> [--views dash,art] [--display VISÃO=WxH] [--scale 1.0]
+
+Exemplos:
+    python session.py musica.wav
+    python session.py musica.wav --views dash,art --display art=1920x1080
+
+Outra visão pode entrar numa sessão em andamento pelo nome do barramento:
+    MUSTEM_FEATURE_BUS=<nome> python mustem_artistic_visualization.py musica.wav
+"""
+
+import os
+import sys
+import time
+import argparse
+import importlib
+import multiprocessing
+
+SOFTWARE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, SOFTWARE_DIR)
+sys.path.insert(0, os.path.join(SOFTWARE_DIR, 'dashboard'))
+sys.path.insert(0, os.path.join(SOFTWARE_DIR, 'visualization'))
+
+from mustem_core.analysis_worker import AnalysisWorker
+
+# Visão -> (papel no barramento, módulo, classe do visualizador, classe do analisador)
+VIEWS = {
+    'dash': ('dashboard', 'mustem_assistive_dashboard', 'TherapeuticMusicVisualizer', 'EnhancedAudioAnalyzer'),
+    'art': ('artistic', 'mustem_artistic_visualization', 'DelicateVisualizer', 'GentleAudioAnalyzer'),
+}
+
+
+def parse_views(value):
+    views = [view.strip() for view in value.split(',') if view.strip()]
+    unknown = [view for view in views if view not in VIEWS]
+    if unknown or not views:
+        raise argparse.ArgumentTypeError(f"Visões disponíveis: {', '.join(VIEWS)}")
+    return views
+
+
+def parse_display(value):
+    """'art=1920x1080' -> ('art', (1920, 1080))"""
+    view, _, size = value.partition('=')
+    width, _, height = size.lower().partition('x')
+    if view not in VIEWS or not width.isdigit() or not height.isdigit():
+        raise argparse.ArgumentTypeError("Use VISÃO=LARGURAxALTURA (ex.: art=1920x1080)")
+    return view, (int(width), int(height))
+
+
+def publisher(audio_file, views):
+    """Processo de análise das visões pedidas; ele toca o áudio e publica o relógio"""
+    factories = {}
+    magnitude_bins = 0
+    for view in views:
+        role, module_name, _, analyzer_name = VIEWS[view]
+        module = importlib.import_module(module_name)
+        factories[role] = getattr(module, analyzer_name)
+        if view == 'dash':
+            magnitude_bins = module.CHUNK_SIZE // 2 + 1  # FFT completa do espectrograma
+    return AnalysisWorker(audio_file, factories, magnitude_bins=magnitude_bins, playback=True)
+
+
+def run_view(view, audio_file, bus_name, render_scale=None, display_size=None):
+    """Corpo do processo de uma visão: janela própria, inscrita no barramento"""
+    _, module_name, class_name, _ = VIEWS[view]
+    module = importlib.import_module(module_name)
+    visualizer = getattr(module, class_name)(audio_file, render_scale=render_scale, display_size=display_size,
+                                             feature_bus=bus_name)
+    visualizer.run()
+
+
+def run_session(audio_file, views, render_scale=None, displays=None):
+    displays = displays or {}
+    worker = publisher(audio_file, views).start()
+    print(f"Sessão no barramento {worker.bus.name}: {', '.join(views)}")
+
+    context = multiprocessing.get_context('spawn')
+    processes = [context.Process(target=run_view, name=f"mustem-{view}",
+                                 args=(view, audio_file, worker.bus.name, render_scale, displays.get(view)))
+                 for view in views]
+    started = time.time()
+    try:
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+    finally:
+        # Um segundo Ctrl-C durante o encerramento não impede a remoção do barramento
+        try:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            stats = worker.stats()
+        finally:
+            worker.stop()
+    print(f"Sessão encerrada: {time.time() - started:.0f} s, {stats['sequence']} quadros de características")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sessão MUSTEM: uma análise e um áudio, várias visões')
+    parser.add_argument('audio_file', help='Arquivo WAV')
+    parser.add_argument('--views', type=parse_views, default=['dash', 'art'], help='Visões (ex.: dash,art)')
+    parser.add_argument('--display', type=parse_display, action='append', default=[],
+                        help='Tamanho da janela de uma visão (ex.: art=1920x1080); repetível')
+    parser.add_argument('--scale', type=float, default=None, help='Escala de renderização interna (ex.: 0.5)')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.audio_file):
+        sys.exit(f"Arquivo não encontrado: {args.audio_file}")
+    try:
+        run_session(args.audio_file, args.views, args.scale, dict(args.display))
+    except KeyboardInterrupt:
+        print("Sessão interrompida")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,15 +10,41 @@ import numpy as np
 import math
 import time
 import sys
+import os
 import wave
-import threading
 from collections import deque
-import colorsys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from mustem_core.analysis_paths import TactilePath, LatencyMeter, VISUAL_LATENCY_BUDGET_MS
+from mustem_core.particles import ParticleEngine
+from mustem_core.compositor import Compositor, Layer, SLOW, TRAIL
+from mustem_core.geometry import draw_polyline, draw_segments, CurveCache
+from mustem_core import colors as palette
+from mustem_core import draw
+from mustem_core.colors import pastel_array, flowing_array, scale_array
+from mustem_core.quality import QualityGovernor
+from mustem_core.clock import animation_clock
+from mustem_core.rng import random_streams
+from mustem_core.render_scale import render_settings, ScaledSurface
+from mustem_core.splat import splat, splat_settings, splat_enabled
+from mustem_core.sprites import (SpriteCache, render_glow, render_petal, quantize, level_value, angle_levels,
+                                 HUE_LEVELS, INTENSITY_LEVELS, ANGLE_LEVELS)
+from mustem_core.trails import trail_settings, trail_enabled, retention
+from mustem_core.shapes import place, to_points, polygon_table, golden_directions
+from mustem_core.timestep import FixedTimestep, SIMULATION_STEP, decay, ema, frame_rate, interpolated
+from mustem_core.runtime import Runtime, sink_settings, tactile_message
+from mustem_core.analysis_worker import AnalysisWorker, analysis_mode, feature_bus_name, subscribe
+from mustem_core.feature_schema import unpack_artistic
 
 SCREEN_WIDTH = 1400
 SCREEN_HEIGHT = 800
-FPS = 60
+FPS = frame_rate(60)  # MUSTEM_FPS: a simulação roda em passos fixos, o visual não muda com a taxa
 CHUNK_SIZE = 512  
+BREATH_LEVELS = 64  # Níveis de respiração do fundo (cada nível = um redesenho do gradiente)
+SPIRAL_TRAIL_TAU = 1.2  # Constante de tempo (s) do rastro da espiral (120 curvas = 2s a 60 FPS)
+
+# Brilhos e pétalas pré-renderizados, compartilhados pelos componentes
+sprite_cache = SpriteCache()
 
 class DelicateColors:
     """Paleta de cores extremamente suaves e delicadas"""
@@ -49,14 +75,8 @@ class DelicateColors:
         base_hue = max(0.0, min(1.0, float(base_hue))) if base_hue is not None else 0.0
         energy = max(0.0, min(1.0, float(energy))) if energy is not None else 0.5
         
-        # Saturação muito baixa para delicadeza
-        saturation = 0.15 + energy * 0.25  # Máximo 40% saturação
-        # Brilho alto para suavidade
-        value = 0.75 + energy * 0.2  # Entre 75-95% brilho
-        
-        rgb = colorsys.hsv_to_rgb(base_hue, saturation, value)
-        # Garante valores válidos para pygame (0-255)
-        return tuple(max(0, min(255, int(c * 255))) for c in rgb)
+        # Saturação baixa (15-40%) e brilho alto (75-95%) pré-calculados na tabela matiz × energia
+        return palette.pastel(base_hue, energy)
     
     @staticmethod
     def safe_color(color_tuple, alpha=1.0):
@@ -64,15 +84,8 @@ class DelicateColors:
         if not color_tuple or len(color_tuple) < 3:
             return (100, 100, 150)  # Cor padrão azul suave
         
-        alpha = max(0.0, min(1.0, float(alpha)))
-        r, g, b = color_tuple[:3]
-        
-        # Aplica alpha e valida
-        return (
-            max(0, min(255, int(r * alpha))),
-            max(0, min(255, int(g * alpha))),
-            max(0, min(255, int(b * alpha)))
-        )
+        # Aplica alpha e valida (tabela alpha × canal)
+        return palette.scale(color_tuple, float(alpha))
     
     @staticmethod
     def flowing_harmonic_color(base_hue, time_phase, frequency_influence, energy=0.5):
@@ -94,8 +107,7 @@ class DelicateColors:
         # Brilho que ondula suavemente
         value = 0.72 + energy * 0.18 + math.sin(time_phase * 0.7) * 0.05
         
-        rgb = colorsys.hsv_to_rgb(flowing_hue, saturation, value)
-        return tuple(max(0, min(255, int(c * 255))) for c in rgb)
+        return palette.hsv(flowing_hue, saturation, value)
     
     @staticmethod
     def laminar_gradient(hue1, hue2, position, flow_distortion=0.0):
@@ -118,8 +130,7 @@ class DelicateColors:
         saturation = 0.18 + laminar_pos * 0.22
         value = 0.75 + math.sin(laminar_pos * 3.14159) * 0.15
         
-        rgb = colorsys.hsv_to_rgb(blended_hue, saturation, value)
-        return tuple(max(0, min(255, int(c * 255))) for c in rgb)
+        return palette.hsv(blended_hue, saturation, value)
     
     @staticmethod
     def breathing_gradient(phase):
@@ -410,279 +421,292 @@ class MelodicDetector:
             
         return 0.0
 
+# Matiz de cada tipo de elemento de bateria (onda de choque e partículas)
+DRUM_SHOCK_HUES = {'kick': 0.0, 'snare': 0.1}
+DRUM_PARTICLE_HUES = {'kick': 0.0, 'snare': 0.06, 'crash': 0.15}
+
+# Matiz do núcleo de cada corpo celeste
+CELESTIAL_HUES = {'piano': 0.15, 'strings': 0.55, 'harmony': 0.8}
+
 class DrumExplosions:
     """Sistema de explosões para elementos de bateria"""
     
-    def __init__(self):
+    def __init__(self, max_particles=1500, max_explosions=64):
+        # Ondas de choque (poucas e curtas) e partículas de matéria escura em arrays
         self.explosions = []
+        self.max_explosions = max_explosions
+        self.halos = True  # Auras das partículas (desligadas em qualidade baixa)
+        self.rng = random_streams.stream('drum_explosions')
+        self.splat = False  # Partículas somadas direto nos pixels (rasterizador de splatting)
+        self.particles = ParticleEngine(max_particles, fields=[
+            'age', 'decay_rate', 'dark_matter_phase', 'hue'
+        ])
         
     def create_explosion(self, x, y, intensity, explosion_type='kick'):
         """Cria explosão baseada no tipo de elemento de bateria"""
-        explosion = {
-            'x': x, 'y': y,
-            'intensity': intensity,
-            'type': explosion_type,
-            'particles': [],
-            'life': 1.0,
-            'age': 0.0,
-            'expansion_rate': 50 + intensity * 80
-        }
+        if len(self.explosions) < self.max_explosions:
+            self.explosions.append({
+                'x': x, 'y': y,
+                'intensity': intensity,
+                'type': explosion_type,
+                'age': 0.0,
+                'expansion_rate': 50 + intensity * 80
+            })
         
         # Cria partículas de matéria escura
         num_particles = int(8 + intensity * 15)
-        for i in range(num_particles):
-            angle = (i / num_particles) * 2 * math.pi + np.random.random() * 0.5
-            speed = 30 + intensity * 50 + np.random.random() * 20
-            
-            particle = {
-                'x': x, 'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': 1.0,
-                'size': 2 + intensity * 4 + np.random.random() * 3,
-                'decay_rate': 0.8 + np.random.random() * 0.4,
-                'dark_matter_phase': np.random.random() * 2 * math.pi
-            }
-            explosion['particles'].append(particle)
-            
-        self.explosions.append(explosion)
+        angles = (np.arange(num_particles) / num_particles) * 2 * math.pi + self.rng.random(num_particles) * 0.5
+        speeds = 30 + intensity * 50 + self.rng.random(num_particles) * 20
+        
+        self.particles.spawn(
+            num_particles,
+            x=x, y=y,
+            vx=np.cos(angles) * speeds,
+            vy=np.sin(angles) * speeds,
+            life=1.0,
+            size=2 + intensity * 4 + self.rng.random(num_particles) * 3,
+            decay_rate=0.8 + self.rng.random(num_particles) * 0.4,
+            dark_matter_phase=self.rng.random(num_particles) * 2 * math.pi,
+            hue=DRUM_PARTICLE_HUES.get(explosion_type, 0.8)
+        )
         
     def update(self, dt):
         """Atualiza explosões e desintegração"""
-        for explosion in self.explosions[:]:
+        # Só a onda de choque (primeiros 0.3s) precisa do estado da explosão
+        for explosion in self.explosions:
             explosion['age'] += dt
-            explosion['life'] = max(0, 1 - explosion['age'] / 2.0)
-            
-            # Atualiza partículas
-            for particle in explosion['particles'][:]:
-                # Movimento
-                particle['x'] += particle['vx'] * dt
-                particle['y'] += particle['vy'] * dt
-                
-                # Desaceleração (resistência da matéria escura)
-                particle['vx'] *= 0.98
-                particle['vy'] *= 0.98
-                
-                # Desintegração
-                particle['life'] -= particle['decay_rate'] * dt
-                particle['size'] *= 0.99  # Encolhimento
-                
-                # Fase de matéria escura
-                particle['dark_matter_phase'] += dt * 3
-                
-                # Remove partícula morta
-                if particle['life'] <= 0 or particle['size'] < 0.5:
-                    explosion['particles'].remove(particle)
-            
-            # Remove explosão se sem partículas
-            if len(explosion['particles']) == 0 or explosion['life'] <= 0:
-                self.explosions.remove(explosion)
+        self.explosions = [e for e in self.explosions if e['age'] < 0.3]
+        
+        p = self.particles
+        p['age'] += dt
+        
+        # Movimento
+        p.integrate(dt)
+        
+        # Desaceleração (resistência da matéria escura)
+        drag = decay(dt, 0.825)  # Arrasto: 0.98 por quadro a 60 FPS
+        p['vx'] *= drag
+        p['vy'] *= drag
+        
+        # Desintegração
+        p['life'] -= p['decay_rate'] * dt
+        p['size'] *= decay(dt, 1.66)  # Encolhimento
+        
+        # Fase de matéria escura
+        p['dark_matter_phase'] += dt * 3
+        
+        # Remove partículas mortas (e as de explosões com mais de 2s)
+        p.kill((p['life'] <= 0) | (p['size'] < 0.5) | (p['age'] >= 2.0))
                 
     def draw(self, screen):
         """Desenha explosões de matéria escura"""
         for explosion in self.explosions:
-            explosion_x = explosion['x']
-            explosion_y = explosion['y']
-            
             # Onda de choque inicial
-            if explosion['age'] < 0.3:
-                shock_radius = int(explosion['expansion_rate'] * explosion['age'])
-                shock_alpha = (0.3 - explosion['age']) / 0.3
-                
-                # Cor da onda de choque baseada no tipo
-                if explosion['type'] == 'kick':
-                    shock_color = DelicateColors.soft_pastel(0.0, explosion['intensity'])  # Vermelho
-                elif explosion['type'] == 'snare':
-                    shock_color = DelicateColors.soft_pastel(0.1, explosion['intensity'])  # Laranja
-                else:
-                    shock_color = DelicateColors.soft_pastel(0.8, explosion['intensity'])  # Roxo
-                    
-                final_shock = DelicateColors.safe_color(shock_color, shock_alpha * 0.6)
-                
-                if shock_radius > 0:
-                    try:
-                        pygame.draw.circle(screen, final_shock, 
-                                         (int(explosion_x), int(explosion_y)), shock_radius, 2)
-                    except:
-                        pass
+            shock_radius = int(explosion['expansion_rate'] * explosion['age'])
+            shock_alpha = (0.3 - explosion['age']) / 0.3
             
-            # Partículas de matéria escura
-            for particle in explosion['particles']:
-                if particle['life'] <= 0:
-                    continue
-                    
-                # Efeito de matéria escura (oscilação dimensional)
-                dark_oscillation = math.sin(particle['dark_matter_phase']) * 0.3 + 0.7
-                
-                # Tamanho oscilante
-                display_size = max(1, int(particle['size'] * dark_oscillation))
-                
-                # Cor de matéria escura (tons escuros com brilho sutil)
-                darkness = 0.2 + particle['life'] * 0.3
-                if explosion['type'] == 'kick':
-                    hue = 0.0  # Vermelho escuro
-                elif explosion['type'] == 'snare':
-                    hue = 0.06  # Laranja escuro
-                elif explosion['type'] == 'crash':
-                    hue = 0.15  # Amarelo escuro
-                else:
-                    hue = 0.8   # Roxo escuro
-                    
-                particle_color = DelicateColors.soft_pastel(hue, darkness)
-                final_color = DelicateColors.safe_color(particle_color, particle['life'] * 0.8)
-                
-                # Posição validada
-                px = max(0, min(SCREEN_WIDTH, int(particle['x'])))
-                py = max(0, min(SCREEN_HEIGHT, int(particle['y'])))
-                
+            # Cor da onda de choque baseada no tipo
+            shock_color = DelicateColors.soft_pastel(DRUM_SHOCK_HUES.get(explosion['type'], 0.8),
+                                                     explosion['intensity'])
+            final_shock = DelicateColors.safe_color(shock_color, shock_alpha * 0.6)
+            
+            if shock_radius > 0:
                 try:
-                    # Núcleo da partícula
-                    pygame.draw.circle(screen, final_color, (px, py), display_size)
-                    
-                    # Aura de matéria escura
-                    if display_size > 1:
-                        aura_size = display_size + 2
-                        aura_color = DelicateColors.safe_color(particle_color, particle['life'] * 0.3)
-                        pygame.draw.circle(screen, aura_color, (px, py), aura_size, 1)
+                    draw.circle(screen, final_shock, 
+                                     (int(explosion['x']), int(explosion['y'])), shock_radius, 2)
                 except:
-                    continue
+                    pass
+        
+        # Partículas de matéria escura
+        p = self.particles
+        if len(p) == 0:
+            return
+        
+        # Efeito de matéria escura (oscilação dimensional) e tamanho oscilante
+        dark_oscillation = np.sin(p['dark_matter_phase']) * 0.3 + 0.7
+        display_sizes = np.maximum(1, (p['size'] * dark_oscillation).astype(int)).tolist()
+        
+        # Posição validada
+        xs = np.clip(p['x'].astype(int), 0, SCREEN_WIDTH)
+        ys = np.clip(p['y'].astype(int), 0, SCREEN_HEIGHT)
+        lives = p['life']
+        
+        if self.splat:
+            # Cor de matéria escura (tons escuros com brilho sutil)
+            particle_colors = pastel_array(p['hue'], 0.2 + lives * 0.3)
+            final_colors = scale_array(particle_colors, lives * 0.8)
+            aura_colors = scale_array(particle_colors, lives * 0.3)
+            
+            # Aura como disco tênue sob o núcleo (a soma aditiva faz o brilho)
+            sizes = np.asarray(display_sizes)
+            if self.halos:
+                haloed = sizes > 1
+                splat(screen, p['x'][haloed], p['y'][haloed], aura_colors[haloed], sizes[haloed] + 2)
+            splat(screen, p['x'], p['y'], final_colors, sizes)
+            return
+        
+        # Núcleo e aura num sprite por (tamanho, matiz, vida); um único blits
+        keys = zip(display_sizes, quantize(p['hue'], HUE_LEVELS), quantize(lives, INTENSITY_LEVELS))
+        keys = [(size, hue, life, self.halos) for size, hue, life in keys]
+        sprite_cache.draw(screen, keys, self.render_particle, xs, ys)
+    
+    @staticmethod
+    def render_particle(key, factor):
+        """Sprite de matéria escura: núcleo e, com halos, aura de 1 pixel"""
+        size, hue_level, life_level, halos = key
+        life = level_value(life_level, INTENSITY_LEVELS)
+        color = DelicateColors.soft_pastel(level_value(hue_level, HUE_LEVELS), 0.2 + life * 0.3)
+        discs = [(DelicateColors.safe_color(color, life * 0.8), size, 0)]
+        if halos and size > 1:
+            discs.append((DelicateColors.safe_color(color, life * 0.3), size + 2, 1))
+        return render_glow(discs, factor)
 
 class CelestialBodies:
     """Corpos celestes para instrumentos melódicos"""
     
-    def __init__(self):
-        self.bodies = []
+    def __init__(self, max_bodies=96, max_orbitals=1100):
+        self.bodies = ParticleEngine(max_bodies, fields=[
+            'intensity', 'hue', 'age', 'core_pulse_phase', 'gravitational_pull'
+        ])
+        # Órbitas guardam o centro e a matiz do corpo; a vida decai no mesmo ritmo do corpo
+        self.orbitals = ParticleEngine(max_orbitals, fields=[
+            'cx', 'cy', 'core_hue', 'distance', 'angle', 'speed', 'harmonic_phase', 'brightness'
+        ])
+        self.halos = True  # Campo harmônico (aura) dos corpos
+        self.rng = random_streams.stream('celestial_bodies')
+        self.splat = False
         
     def create_celestial_body(self, x, y, intensity, body_type='piano'):
         """Cria corpo celeste harmônico"""
-        body = {
-            'x': x, 'y': y,
-            'intensity': intensity,
-            'type': body_type,
-            'life': 3.0 + intensity * 2,
-            'age': 0.0,
-            'orbit_particles': [],
-            'core_pulse_phase': 0.0,
-            'harmonic_field': intensity,
-            'gravitational_pull': 20 + intensity * 30
-        }
+        life = 3.0 + intensity * 2
+        core_hue = CELESTIAL_HUES.get(body_type, 0.3)
+        if not self.bodies.spawn(
+            x=x, y=y, intensity=intensity, hue=core_hue, life=life,
+            gravitational_pull=20 + intensity * 30
+        ):
+            return
         
         # Cria partículas orbitais harmoniosas
         num_orbitals = int(3 + intensity * 8)
-        for i in range(num_orbitals):
-            orbital_distance = 15 + i * 8 + np.random.random() * 10
-            orbital_speed = 0.5 + intensity * 0.8 + np.random.random() * 0.3
-            
-            orbital = {
-                'distance': orbital_distance,
-                'angle': (i / num_orbitals) * 2 * math.pi,
-                'speed': orbital_speed,
-                'size': 1 + intensity * 2,
-                'harmonic_phase': np.random.random() * 2 * math.pi,
-                'brightness': 0.7 + np.random.random() * 0.3
-            }
-            body['orbit_particles'].append(orbital)
-            
-        self.bodies.append(body)
+        index = np.arange(num_orbitals)
+        self.orbitals.spawn(
+            num_orbitals,
+            x=x, y=y, cx=x, cy=y, core_hue=core_hue, life=life,
+            distance=15 + index * 8 + self.rng.random(num_orbitals) * 10,
+            angle=(index / num_orbitals) * 2 * math.pi,
+            speed=0.5 + intensity * 0.8 + self.rng.random(num_orbitals) * 0.3,
+            size=1 + intensity * 2,
+            harmonic_phase=self.rng.random(num_orbitals) * 2 * math.pi,
+            brightness=0.7 + self.rng.random(num_orbitals) * 0.3
+        )
         
     def update(self, dt):
         """Atualiza corpos celestes"""
-        for body in self.bodies[:]:
-            body['age'] += dt
-            body['life'] -= dt / 4
-            body['core_pulse_phase'] += dt * 2
-            
-            # Atualiza órbitas
-            for orbital in body['orbit_particles']:
-                orbital['angle'] += orbital['speed'] * dt
-                orbital['harmonic_phase'] += dt * 1.5
-                
-                # Calcula posição orbital com perturbação harmônica
-                harmonic_offset = math.sin(orbital['harmonic_phase']) * 3
-                
-                orbital['x'] = body['x'] + (orbital['distance'] + harmonic_offset) * math.cos(orbital['angle'])
-                orbital['y'] = body['y'] + (orbital['distance'] + harmonic_offset) * math.sin(orbital['angle'])
-                
-            # Remove corpo morto
-            if body['life'] <= 0:
-                self.bodies.remove(body)
+        bodies = self.bodies
+        bodies['age'] += dt
+        bodies['life'] -= dt / 4
+        bodies['core_pulse_phase'] += dt * 2
+        
+        # Atualiza órbitas
+        orbitals = self.orbitals
+        orbitals['life'] -= dt / 4
+        orbitals['angle'] += orbitals['speed'] * dt
+        orbitals['harmonic_phase'] += dt * 1.5
+        
+        # Calcula posição orbital com perturbação harmônica
+        radius = orbitals['distance'] + np.sin(orbitals['harmonic_phase']) * 3
+        orbitals['x'] = orbitals['cx'] + radius * np.cos(orbitals['angle'])
+        orbitals['y'] = orbitals['cy'] + radius * np.sin(orbitals['angle'])
+        
+        # Remove corpos mortos (e suas órbitas)
+        bodies.kill(bodies['life'] <= 0)
+        orbitals.kill(orbitals['life'] <= 0)
                 
     def draw(self, screen):
         """Desenha corpos celestes harmoniosos"""
-        for body in self.bodies:
-            if body['life'] <= 0:
-                continue
-                
+        bodies = self.bodies
+        if len(bodies) > 0:
             # Núcleo do corpo celeste
-            core_pulse = 0.7 + 0.3 * math.sin(body['core_pulse_phase'])
-            core_size = max(2, int((3 + body['intensity'] * 6) * core_pulse))
-            
-            # Cor baseada no tipo de instrumento
-            if body['type'] == 'piano':
-                core_hue = 0.15  # Dourado
-            elif body['type'] == 'strings':
-                core_hue = 0.55  # Azul celestial
-            elif body['type'] == 'harmony':
-                core_hue = 0.8   # Roxo místico
-            else:
-                core_hue = 0.3   # Verde etéreo
-                
-            core_color = DelicateColors.soft_pastel(core_hue, body['intensity'])
-            final_core = DelicateColors.safe_color(core_color, body['life'] * 0.9)
-
-            # Posição validada
-            bx = max(0, min(SCREEN_WIDTH, int(body['x'])))
-            by = max(0, min(SCREEN_HEIGHT, int(body['y'])))
-            
-            # Campo harmônico (aura)
-            aura_radius = int(body['gravitational_pull'] * body['life'])
-            if aura_radius > 0:
-                aura_color = DelicateColors.safe_color(core_color, body['life'] * 0.2)
-                try:
-                    pygame.draw.circle(screen, aura_color, (bx, by), aura_radius, 1)
-                except:
-                    pass
+            core_pulse = 0.7 + 0.3 * np.sin(bodies['core_pulse_phase'])
+            core_sizes = np.maximum(2, ((3 + bodies['intensity'] * 6) * core_pulse).astype(int)).tolist()
+            aura_radii = (bodies['gravitational_pull'] * bodies['life']).astype(int).tolist()
             
-            # Núcleo brilhante
-            try:
-                pygame.draw.circle(screen, final_core, (bx, by), core_size)
-                
-                # Brilho interno
-                if core_size > 2:
-                    inner_size = max(1, core_size // 2)
-                    inner_color = DelicateColors.safe_color(core_color, body['life'])
-                    pygame.draw.circle(screen, inner_color, (bx, by), inner_size)
-            except:
-                continue
-                
-            # Partículas orbitais
-            for orbital in body['orbit_particles']:
-                orbital_brightness = orbital['brightness'] * body['life']
-                if orbital_brightness <= 0:
-                    continue
-                    
-                # Oscilação harmônica
-                harmonic_glow = math.sin(orbital['harmonic_phase']) * 0.2 + 0.8
-                orbital_size = max(1, int(orbital['size'] * harmonic_glow))
-                
-                # Cor orbital complementar
-                orbital_hue = (core_hue + 0.1) % 1.0
-                orbital_color = DelicateColors.soft_pastel(orbital_hue, orbital_brightness)
-                final_orbital = DelicateColors.safe_color(orbital_color, orbital_brightness * 0.8)
-                
-                # Posição validada
-                ox = max(0, min(SCREEN_WIDTH, int(orbital['x'])))
-                oy = max(0, min(SCREEN_HEIGHT, int(orbital['y'])))
-                
-                try:
-                    pygame.draw.circle(screen, final_orbital, (ox, oy), orbital_size)
-                    
-                    # Trilha orbital sutil
-                    if orbital_size > 1:
-                        trail_color = DelicateColors.safe_color(orbital_color, orbital_brightness * 0.3)
-                        pygame.draw.line(screen, trail_color, (bx, by), (ox, oy), 1)
-                except:
-                    continue
+            # Posição validada
+            bxs = np.clip(bodies['x'].astype(int), 0, SCREEN_WIDTH).tolist()
+            bys = np.clip(bodies['y'].astype(int), 0, SCREEN_HEIGHT).tolist()
+            lives = bodies['life']
+            
+            # Campo harmônico (aura): anéis grandes e finos continuam em draw.circle
+            if self.halos:
+                core_colors = pastel_array(bodies['hue'], bodies['intensity'])
+                aura_colors = scale_array(core_colors, lives * 0.2).tolist()
+                for i in range(len(bxs)):
+                    if aura_radii[i] > 0:
+                        draw.circle(screen, aura_colors[i], (bxs[i], bys[i]), aura_radii[i], 1)
+            
+            # Núcleo brilhante e brilho interno num sprite por (tamanho, matiz, intensidade, vida)
+            keys = zip(core_sizes, quantize(bodies['hue'], HUE_LEVELS),
+                       quantize(bodies['intensity'], INTENSITY_LEVELS), quantize(lives * 0.9, INTENSITY_LEVELS))
+            sprite_cache.draw(screen, list(keys), self.render_core, bxs, bys)
+        
+        # Partículas orbitais
+        orbitals = self.orbitals
+        if len(orbitals) == 0:
+            return
+        
+        brightness = orbitals['brightness'] * orbitals['life']
+        
+        # Oscilação harmônica
+        harmonic_glow = np.sin(orbitals['harmonic_phase']) * 0.2 + 0.8
+        sizes = np.maximum(1, (orbitals['size'] * harmonic_glow).astype(int)).tolist()
+        oxs = np.clip(orbitals['x'].astype(int), 0, SCREEN_WIDTH).tolist()
+        oys = np.clip(orbitals['y'].astype(int), 0, SCREEN_HEIGHT).tolist()
+        cxs = np.clip(orbitals['cx'].astype(int), 0, SCREEN_WIDTH).tolist()
+        cys = np.clip(orbitals['cy'].astype(int), 0, SCREEN_HEIGHT).tolist()
+        hues = (orbitals['core_hue'] + 0.1) % 1.0  # Cor orbital complementar
+        orbital_colors = pastel_array(hues, brightness)
+        final_orbitals = scale_array(orbital_colors, brightness * 0.8)
+        trail_colors = scale_array(orbital_colors, brightness * 0.3)
+        
+        if self.splat:
+            lit = brightness > 0
+            trailed = lit & (np.asarray(sizes) > 1)
+            draw_segments(screen, np.stack((cxs, cys), axis=1)[trailed], np.stack((oxs, oys), axis=1)[trailed],
+                          trail_colors[trailed])
+            splat(screen, orbitals['x'][lit], orbitals['y'][lit], final_orbitals[lit], np.asarray(sizes)[lit])
+            return
+        
+        # Trilhas orbitais sutis, depois as partículas num sprite por (tamanho, matiz, brilho)
+        lit = brightness > 0
+        trailed = lit & (np.asarray(sizes) > 1)
+        draw_segments(screen, np.stack((cxs, cys), axis=1)[trailed], np.stack((oxs, oys), axis=1)[trailed],
+                      trail_colors[trailed])
+        lit_index = np.flatnonzero(lit)
+        keys = zip(np.asarray(sizes)[lit_index].tolist(), quantize(hues[lit_index], HUE_LEVELS),
+                   quantize(brightness[lit_index] * 0.8, INTENSITY_LEVELS))
+        sprite_cache.draw(screen, list(keys), self.render_orbital,
+                          np.asarray(oxs)[lit_index], np.asarray(oys)[lit_index])
+    
+    @staticmethod
+    def render_core(key, factor):
+        """Sprite do núcleo de um corpo celeste (com brilho interno a partir de 3 pixels)"""
+        size, hue_level, intensity_level, core_level = key
+        core_alpha = level_value(core_level, INTENSITY_LEVELS)  # vida × 0.9 (a vida passa de 1)
+        color = DelicateColors.soft_pastel(level_value(hue_level, HUE_LEVELS),
+                                           level_value(intensity_level, INTENSITY_LEVELS))
+        discs = [(DelicateColors.safe_color(color, core_alpha), size, 0)]
+        if size > 2:
+            inner_alpha = 1.0 if core_alpha >= 1.0 else core_alpha / 0.9
+            discs.append((DelicateColors.safe_color(color, inner_alpha), max(1, size // 2), 0))
+        return render_glow(discs, factor)
+    
+    @staticmethod
+    def render_orbital(key, factor):
+        size, hue_level, glow_level = key
+        glow = level_value(glow_level, INTENSITY_LEVELS)  # brilho × 0.8 (o brilho passa de 1)
+        brightness = 1.0 if glow >= 1.0 else glow / 0.8
+        color = DelicateColors.soft_pastel(level_value(hue_level, HUE_LEVELS), min(1.0, brightness))
+        return render_glow([(DelicateColors.safe_color(color, glow), size, 0)], factor)
 
 class MusicalDNAAnalyzer:
     """🧬 ANALISADOR DE DNA MUSICAL - Identidade Visual Única por Música"""
@@ -763,9 +787,12 @@ class MusicalDNAAnalyzer:
             'fractional_dimensions': np.zeros(3),   # Dimensões fractais
             'resonance_frequencies': np.zeros(8),   # Frequências de ressonância visual
         }
+        
+        self.dt = SIMULATION_STEP  # Tempo desde a análise anterior (peso das médias exponenciais)
     
-    def analyze_musical_dna(self, spectrum, chunk_data, tempo_estimate=120):
-        """🧬 Análise completa do DNA musical"""
+    def analyze_musical_dna(self, spectrum, chunk_data, tempo_estimate=120, dt=SIMULATION_STEP):
+        """🧬 Análise completa do DNA musical (dt: segundos desde a análise anterior)"""
+        self.dt = dt
         
         # Armazena dados para análise temporal
         self.spectral_memory.append(spectrum.copy())
@@ -827,7 +854,7 @@ class MusicalDNAAnalyzer:
         # Centro tonal (nota mais proeminente)
         dominant_note = np.argmax(chroma_vector)
         self.musical_dna['tonal_center'] = (
-            self.musical_dna['tonal_center'] * 0.98 + dominant_note * 0.02
+            ema(self.musical_dna['tonal_center'], dominant_note, self.dt, 0.825)
         )
         
         # Brilho modal (maior vs menor)
@@ -841,12 +868,12 @@ class MusicalDNAAnalyzer:
         if major_energy + minor_energy > 0:
             brightness = major_energy / (major_energy + minor_energy)
             self.musical_dna['mode_brightness'] = (
-                self.musical_dna['mode_brightness'] * 0.95 + brightness * 0.05
+                ema(self.musical_dna['mode_brightness'], brightness, self.dt, 0.325)
             )
         
         # Assinatura cromática (distribuição de notas)
         self.musical_dna['chromatic_signature'] = (
-            self.musical_dna['chromatic_signature'] * 0.99 + chroma_vector * 0.01
+            ema(self.musical_dna['chromatic_signature'], chroma_vector, self.dt, 1.66)
         )
         
         # Estabilidade tonal
@@ -857,7 +884,7 @@ class MusicalDNAAnalyzer:
                 for i in range(12)
             ])
             self.musical_dna['scale_stability'] = (
-                self.musical_dna['scale_stability'] * 0.9 + stability * 0.1
+                ema(self.musical_dna['scale_stability'], stability, self.dt, 0.158)
             )
     
     def analyze_rhythmic_identity(self, chunk_data, tempo_estimate):
@@ -872,13 +899,13 @@ class MusicalDNAAnalyzer:
             rhythm_variance = np.var(list(self.rhythm_memory)[-20:])
             complexity = min(1.0, rhythm_variance * 10)
             self.musical_dna['rhythmic_complexity'] = (
-                self.musical_dna['rhythmic_complexity'] * 0.95 + complexity * 0.05
+                ema(self.musical_dna['rhythmic_complexity'], complexity, self.dt, 0.325)
             )
         
         # Padrão de beat único
         beat_position = int((len(self.rhythm_memory) % 16))
         self.musical_dna['beat_pattern_dna'][beat_position] = (
-            self.musical_dna['beat_pattern_dna'][beat_position] * 0.9 + onset_strength * 0.1
+            ema(self.musical_dna['beat_pattern_dna'][beat_position], onset_strength, self.dt, 0.158)
         )
         
         # Índice de sincopa (off-beat emphasis)
@@ -890,7 +917,7 @@ class MusicalDNAAnalyzer:
             if on_beat + off_beat > 0:
                 syncopation = off_beat / (on_beat + off_beat)
                 self.musical_dna['syncopation_index'] = (
-                    self.musical_dna['syncopation_index'] * 0.9 + syncopation * 0.1
+                    ema(self.musical_dna['syncopation_index'], syncopation, self.dt, 0.158)
                 )
         
         # Assinatura do groove
@@ -915,7 +942,7 @@ class MusicalDNAAnalyzer:
         active_bands = sum(1 for x in spectrum if x > 0.1)
         richness = active_bands / len(spectrum)
         self.musical_dna['harmonic_richness'] = (
-            self.musical_dna['harmonic_richness'] * 0.95 + richness * 0.05
+            ema(self.musical_dna['harmonic_richness'], richness, self.dt, 0.325)
         )
         
         # Armazena para análise harmônica
@@ -930,14 +957,14 @@ class MusicalDNAAnalyzer:
             if consonant_energy + dissonant_energy > 0:
                 consonance = consonant_energy / (consonant_energy + dissonant_energy)
                 self.musical_dna['consonance_ratio'] = (
-                    self.musical_dna['consonance_ratio'] * 0.92 + consonance * 0.08
+                    ema(self.musical_dna['consonance_ratio'], consonance, self.dt, 0.2)
                 )
         
         # Complexidade de acordes (distribuição de energia)
         if len(spectrum) > 0:
             chord_complexity = np.std(spectrum) / (np.mean(spectrum) + 1e-10)
             self.musical_dna['chord_complexity'] = (
-                self.musical_dna['chord_complexity'] * 0.9 + chord_complexity * 0.1
+                ema(self.musical_dna['chord_complexity'], chord_complexity, self.dt, 0.158)
             )
         
         # Ritmo harmônico (mudanças nas harmonias)
@@ -963,7 +990,7 @@ class MusicalDNAAnalyzer:
             if len(significant_freqs) > 1:
                 melodic_range = (max(significant_freqs) - min(significant_freqs)) / len(spectrum)
                 self.musical_dna['melodic_range'] = (
-                    self.musical_dna['melodic_range'] * 0.9 + melodic_range * 0.1
+                    ema(self.musical_dna['melodic_range'], melodic_range, self.dt, 0.158)
                 )
         
         # Direção melódica (ascendente/descendente)
@@ -975,7 +1002,7 @@ class MusicalDNAAnalyzer:
             direction = np.tanh(direction * 5)  # Normaliza entre -1 e 1
             
             self.musical_dna['melodic_direction_bias'] = (
-                self.musical_dna['melodic_direction_bias'] * 0.95 + direction * 0.05
+                ema(self.musical_dna['melodic_direction_bias'], direction, self.dt, 0.325)
             )
         
         # Assinatura de intervalos
@@ -993,7 +1020,7 @@ class MusicalDNAAnalyzer:
             if np.sum(interval_counts) > 0:
                 interval_signature = interval_counts / np.sum(interval_counts)
                 self.musical_dna['interval_signature'] = (
-                    self.musical_dna['interval_signature'] * 0.9 + interval_signature * 0.1
+                    ema(self.musical_dna['interval_signature'], interval_signature, self.dt, 0.158)
                 )
     
     def calculate_spectral_centroid(self, spectrum):
@@ -1021,7 +1048,7 @@ class MusicalDNAAnalyzer:
         centroid = self.calculate_spectral_centroid(spectrum)
         normalized_centroid = centroid / len(spectrum)
         self.musical_dna['spectral_centroid'] = (
-            self.musical_dna['spectral_centroid'] * 0.9 + normalized_centroid * 0.1
+            ema(self.musical_dna['spectral_centroid'], normalized_centroid, self.dt, 0.158)
         )
         
         # Rolloff espectral (85% da energia)
@@ -1032,7 +1059,7 @@ class MusicalDNAAnalyzer:
         if len(rolloff_index) > 0:
             rolloff = rolloff_index[0] / len(spectrum)
             self.musical_dna['spectral_rolloff'] = (
-                self.musical_dna['spectral_rolloff'] * 0.9 + rolloff * 0.1
+                ema(self.musical_dna['spectral_rolloff'], rolloff, self.dt, 0.158)
             )
         
         # Planura espectral (ruído vs tonal)
@@ -1042,7 +1069,7 @@ class MusicalDNAAnalyzer:
             flatness = geometric_mean / arithmetic_mean
             
             self.musical_dna['spectral_flatness'] = (
-                self.musical_dna['spectral_flatness'] * 0.9 + flatness * 0.1
+                ema(self.musical_dna['spectral_flatness'], flatness, self.dt, 0.158)
             )
         
         # Fluxo tímbrico (mudança espectral)
@@ -1052,7 +1079,7 @@ class MusicalDNAAnalyzer:
             flux = np.sum(np.abs(current - previous))
             
             self.musical_dna['timbral_flux'] = (
-                self.musical_dna['timbral_flux'] * 0.9 + flux * 0.1
+                ema(self.musical_dna['timbral_flux'], flux, self.dt, 0.158)
             )
     
     def analyze_dynamic_identity(self):
@@ -1066,20 +1093,20 @@ class MusicalDNAAnalyzer:
         # Range dinâmico
         dynamic_range = (max(recent_energies) - min(recent_energies)) / (max(recent_energies) + 1e-10)
         self.musical_dna['dynamic_range'] = (
-            self.musical_dna['dynamic_range'] * 0.9 + dynamic_range * 0.1
+            ema(self.musical_dna['dynamic_range'], dynamic_range, self.dt, 0.158)
         )
         
         # Variância energética
         energy_variance = np.var(recent_energies) / (np.mean(recent_energies) + 1e-10)
         self.musical_dna['energy_variance'] = (
-            self.musical_dna['energy_variance'] * 0.9 + energy_variance * 0.1
+            ema(self.musical_dna['energy_variance'], energy_variance, self.dt, 0.158)
         )
         
         # Nitidez dos ataques
         energy_diffs = np.diff(recent_energies)
         attack_sharpness = np.mean(np.maximum(energy_diffs, 0))
         self.musical_dna['attack_sharpness'] = (
-            self.musical_dna['attack_sharpness'] * 0.9 + attack_sharpness * 0.1
+            ema(self.musical_dna['attack_sharpness'], attack_sharpness, self.dt, 0.158)
         )
     
     def analyze_structural_identity(self):
@@ -1101,7 +1128,7 @@ class MusicalDNAAnalyzer:
             if similarities:
                 repetition_density = np.mean(similarities)
                 self.musical_dna['repetition_density'] = (
-                    self.musical_dna['repetition_density'] * 0.95 + repetition_density * 0.05
+                    ema(self.musical_dna['repetition_density'], repetition_density, self.dt, 0.325)
                 )
         
         # Quociente de surpresa (mudanças inesperadas)
@@ -1112,7 +1139,7 @@ class MusicalDNAAnalyzer:
             
             surprise = abs(actual_energy - expected_energy) / (expected_energy + 1e-10)
             self.musical_dna['surprise_quotient'] = (
-                self.musical_dna['surprise_quotient'] * 0.9 + surprise * 0.1
+                ema(self.musical_dna['surprise_quotient'], surprise, self.dt, 0.158)
             )
     
     def calculate_cosine_similarity(self, vec1, vec2):
@@ -1203,9 +1230,11 @@ class MusicalDNAAnalyzer:
 class GentleAudioAnalyzer:
     """Analisador de áudio ultra-suave"""
     
-    def __init__(self, audio_file):
+    def __init__(self, audio_file, playback=True):
         print("🌸 Preparando experiência delicada...")
         
+        self.playback = playback  # False = análise offline, sem mixer
+        self.media_time = None
         self.load_audio(audio_file)
         self.chunk_size = CHUNK_SIZE
         self.audio_start_time = None
@@ -1220,6 +1249,7 @@ class GentleAudioAnalyzer:
         self.flow_rhythm = 0.0
         self.breath_cycle = 0.0
         self.gentle_energy = 0.0
+        self.last_analysis_time = None
         
         # Histórico para suavização
         self.energy_memory = deque(maxlen=60)  # 1 segundo de memória
@@ -1231,8 +1261,15 @@ class GentleAudioAnalyzer:
         # 🧬 DNA Musical Analyzer - Identidade Única
         self.dna_analyzer = MusicalDNAAnalyzer()
         
-        pygame.mixer.pre_init(frequency=44100, size=-16, channels=1, buffer=256)
-        pygame.mixer.init()
+        # Caminho tátil (hop curto) e caminho visual (janela longa) sobre o mesmo buffer
+        self.tactile_path = TactilePath(self.sample_rate)
+        self.visual_latency = LatencyMeter('visual', VISUAL_LATENCY_BUDGET_MS,
+                                           (self.chunk_size / 2) / self.sample_rate * 1000.0)
+        self.tactile_state = None
+        
+        if self.playback:
+            pygame.mixer.pre_init(frequency=44100, size=-16, channels=1, buffer=256)
+            pygame.mixer.init()
         
     def load_audio(self, filename):
         """Carrega áudio com processamento gentil"""
@@ -1253,7 +1290,9 @@ class GentleAudioAnalyzer:
             if np.max(np.abs(self.audio_data)) > 0:
                 self.audio_data /= np.max(np.abs(self.audio_data))
                 
-        pygame.mixer.music.load(filename)
+        self.duration = len(self.audio_data) / self.sample_rate
+        if self.playback:
+            pygame.mixer.music.load(filename)
         print(f"🎵 Áudio preparado com delicadeza")
         
     def start_playback(self):
@@ -1273,9 +1312,15 @@ class GentleAudioAnalyzer:
             print("🌸 Continuando em modo silencioso...")
         
     def get_current_time(self):
+        if self.media_time is not None:
+            return self.media_time
         if self.audio_start_time is None:
             return 0
         return time.time() - self.audio_start_time
+    
+    def set_media_time(self, seconds):
+        """Posiciona a análise num instante do áudio (modo offline)"""
+        self.media_time = seconds
         
     def get_current_chunk(self):
         current_time = self.get_current_time()
@@ -1288,12 +1333,37 @@ class GentleAudioAnalyzer:
         # Janela ultra-suave
         return chunk * np.hanning(len(chunk))
         
+    def get_playhead(self):
+        return int(self.get_current_time() * self.sample_rate)
+    
+    def get_latency_stats(self):
+        return {'tactile': self.tactile_path.latency.stats(), 'visual': self.visual_latency.stats()}
+    
+    def analysis_dt(self):
+        """Tempo de mídia desde a análise anterior (peso das médias exponenciais)"""
+        now = self.get_current_time()
+        last, self.last_analysis_time = self.last_analysis_time, now
+        if last is None:
+            return SIMULATION_STEP
+        return min(max(0.0, now - last), 0.25)
+    
+    def analyze_tactile(self):
+        """Caminho rápido: motores táteis e eventos de batida, sem a análise visual"""
+        self.tactile_state = self.tactile_path.process(self.audio_data, self.get_playhead())
+        return self.tactile_state
+    
     def analyze_gently(self):
         """Análise extremamente suave e orgânica com identidade musical e detecção de instrumentos"""
+        self.analyze_tactile()
+        
+        dt = self.analysis_dt()
+        
+        self.visual_latency.start()
         chunk = self.get_current_chunk()
         self.current_chunk_data = chunk.copy()
         
         if len(chunk) == 0 or np.max(np.abs(chunk)) < 1e-6:
+            self.visual_latency.stop()
             return self.get_serene_state()
             
         # FFT com suavização extrema
@@ -1327,14 +1397,10 @@ class GentleAudioAnalyzer:
             if end_idx > start_idx:
                 new_spectrum[i] = np.mean(magnitude[start_idx:end_idx])
                 
-        # Tripla suavização para máxima delicadeza
-        alpha1 = 0.02  # Ultra-lento
-        alpha2 = 0.05  # Muito lento
-        alpha3 = 0.1   # Lento
-        
-        self.spectrum = self.spectrum * (1 - alpha1) + new_spectrum * alpha1
-        self.smooth_spectrum = self.smooth_spectrum * (1 - alpha2) + self.spectrum * alpha2
-        self.ultra_smooth = self.ultra_smooth * (1 - alpha3) + self.smooth_spectrum * alpha3
+        # Tripla suavização para máxima delicadeza (constantes de tempo em segundos)
+        self.spectrum = ema(self.spectrum, new_spectrum, dt, 0.825)              # Ultra-lento
+        self.smooth_spectrum = ema(self.smooth_spectrum, self.spectrum, dt, 0.325)  # Muito lento
+        self.ultra_smooth = ema(self.ultra_smooth, self.smooth_spectrum, dt, 0.158)  # Lento
         
         # Estados de serenidade
         total_energy = np.sum(self.ultra_smooth)
@@ -1348,11 +1414,11 @@ class GentleAudioAnalyzer:
             energy_variance = np.var(list(self.energy_memory)[-20:])
             self.serenity_level = 0.3 + (1.0 - min(1.0, energy_variance * 10)) * 0.6
             
-        # Ritmo de fluxo orgânico
-        self.flow_rhythm += 0.01 * (1 + self.gentle_energy)
+        # Ritmo de fluxo orgânico (0.6 rad/s em repouso)
+        self.flow_rhythm += 0.6 * (1 + self.gentle_energy) * dt
         
         # Ciclo de respiração natural
-        self.breath_cycle += 0.005 * (0.5 + self.serenity_level * 0.5)
+        self.breath_cycle += 0.3 * (0.5 + self.serenity_level * 0.5) * dt
         
         # Extração de características musicais avançadas
         beat_energy = self.detect_beat_energy(chunk)
@@ -1363,7 +1429,9 @@ class GentleAudioAnalyzer:
         instruments = self.instrument_detector.analyze_instruments(self.ultra_smooth, chunk)
         
         # 🧬 ANÁLISE DE DNA MUSICAL - Identidade Única
-        musical_dna = self.dna_analyzer.analyze_musical_dna(self.ultra_smooth, chunk)
+        musical_dna = self.dna_analyzer.analyze_musical_dna(self.ultra_smooth, chunk, dt=dt)
+        
+        self.visual_latency.stop()
         
         return {
             'spectrum': self.ultra_smooth,
@@ -1379,7 +1447,10 @@ class GentleAudioAnalyzer:
             'melodic_direction': melodic_direction,
             'instruments': instruments,
             'musical_dna': musical_dna,  # 🧬 DNA Musical único
-            'visual_dna': self.dna_analyzer.visual_dna_mapping  # 🎨 Mapeamento visual
+            'visual_dna': self.dna_analyzer.visual_dna_mapping,  # 🎨 Mapeamento visual
+            'tactile': self.tactile_state,  # 🤲 Caminho rápido (motores + batidas)
+            'beat_events': self.tactile_state['beat_events'],
+            'latency': self.get_latency_stats()
         }
     
     def detect_beat_energy(self, chunk):
@@ -1437,7 +1508,10 @@ class GentleAudioAnalyzer:
             'current_time': self.get_current_time(),
             'beat_energy': 0.0,
             'harmonic_richness': 0.3,
-            'melodic_direction': 0.0
+            'melodic_direction': 0.0,
+            'tactile': self.tactile_state,
+            'beat_events': self.tactile_state['beat_events'] if self.tactile_state else [],
+            'latency': self.get_latency_stats()
         }
 
 class UniqueMusicalSpiral:
@@ -1450,6 +1524,17 @@ class UniqueMusicalSpiral:
         # Espiral winding matemática
         self.spiral_points = []
         self.max_spiral_points = 120
+        self.curve_segments = 8
+        # Curvas entre trios consecutivos de pontos, tesseladas quando o ponto nasce
+        self.spiral_curves = CurveCache(self.curve_segments, fields=['flow_intensity', 'energy', 'hue'])
+        self.halos = True  # Gradiente em camadas dos pontos Fibonacci
+        self.rng = random_streams.stream('musical_spiral')
+        self.splat = False  # Partículas harmônicas e trilhas por splatting
+        self.trails = False  # Curvas desenhadas só quando nascem, num buffer persistente que esmaece
+        self.trail_mark = 0
+        self.trail_dt = 1.0 / FPS  # Duração do quadro (o rastro esmaece por quadro desenhado)
+        reach = 200  # Raio máximo da espiral (120 pontos) com a ondulação laminar
+        self.trail_rect = pygame.Rect(center_x - reach, center_y - reach, 2 * reach, 2 * reach)
         self.golden_ratio = (1 + math.sqrt(5)) / 2
         self.current_angle = 0.0
         
@@ -1464,7 +1549,9 @@ class UniqueMusicalSpiral:
         
         # Elementos matemáticos únicos
         self.fibonacci_points = []
-        self.harmonic_particles = []
+        self.harmonic_particles = ParticleEngine(32, fields=[
+            'orbit_angle', 'orbit_radius', 'rotation_speed', 'energy', 'center_freq', 'hue'
+        ])
         self.beat_resonance_rings = []
         self.sacred_geometry = []
         
@@ -1484,13 +1571,12 @@ class UniqueMusicalSpiral:
             
     def update(self, spectrum, gentle_energy, serenity_level, dt, instruments=None, musical_dna=None, visual_dna=None):
         """Atualização com extração de identidade musical única e detecção de instrumentos"""
-        
         # Processa DNA musical para identidade visual única
         if musical_dna and visual_dna:
             self.process_musical_dna(musical_dna, visual_dna)
         
         # Extrai identidade musical única
-        self.extract_musical_identity(spectrum, gentle_energy)
+        self.extract_musical_identity(spectrum, gentle_energy, dt)
         
         # Adiciona ponto à espiral winding
         self.add_spiral_point(spectrum, gentle_energy, dt)
@@ -1517,7 +1603,7 @@ class UniqueMusicalSpiral:
         if musical_dna and visual_dna:
             self.process_musical_dna(musical_dna, visual_dna)
     
-    def extract_musical_identity(self, spectrum, energy):
+    def extract_musical_identity(self, spectrum, energy, dt):
         """Extrai características únicas que definem a música"""
         # Assinatura espectral (frequências dominantes)
         if len(spectrum) >= 12:
@@ -1526,7 +1612,7 @@ class UniqueMusicalSpiral:
                 target = spectrum[band_idx] if band_idx < len(spectrum) else 0
                 # Suavização extrema para identidade estável
                 self.musical_dna['spectral_signature'][i] = (
-                    self.musical_dna['spectral_signature'][i] * 0.995 + target * 0.005
+                    ema(self.musical_dna['spectral_signature'][i], target, dt, 3.33)
                 )
         
         # Padrão rítmico
@@ -1536,7 +1622,7 @@ class UniqueMusicalSpiral:
         if len(spectrum) > 0:
             richness = np.std(spectrum) / (np.mean(spectrum) + 1e-10)
             self.musical_dna['harmonic_richness'] = (
-                self.musical_dna['harmonic_richness'] * 0.99 + richness * 0.01
+                ema(self.musical_dna['harmonic_richness'], richness, dt, 1.66)
             )
         
         # Tendência melódica
@@ -1544,13 +1630,14 @@ class UniqueMusicalSpiral:
             recent = list(self.musical_dna['rhythm_pattern'])[-3:]
             trend = (recent[-1] - recent[0]) / (len(recent) + 1e-10)
             self.musical_dna['melodic_tendency'] = (
-                self.musical_dna['melodic_tendency'] * 0.98 + trend * 0.02
+                ema(self.musical_dna['melodic_tendency'], trend, dt, 0.825)
             )
     
     def add_spiral_point(self, spectrum, energy, dt):
         """Adiciona ponto à espiral com base na música"""
-        if len(self.spiral_points) >= self.max_spiral_points:
+        while len(self.spiral_points) >= self.max_spiral_points:
             self.spiral_points.pop(0)  # Remove o mais antigo
+            self.spiral_curves.popleft()
         
         # Incremento do ângulo baseado na proporção áurea + energia musical
         angle_base = 2 * math.pi / self.golden_ratio
@@ -1606,11 +1693,39 @@ class UniqueMusicalSpiral:
         
         self.spiral_points.append(point)
         
+        # Tessela a nova curva (p1, p2, p3) uma única vez; só idade e fluxo mudam depois
+        if len(self.spiral_points) >= 3:
+            self.tessellate_curve(*self.spiral_points[-3:])
+        
         # Envelhece pontos existentes
         for point in self.spiral_points:
             point['age'] += dt
             point['life'] = max(0, 1 - point['age'] / 10.0)  # 10 segundos de vida
     
+    def tessellate_curve(self, p1, p2, p3):
+        """Guarda a curva de Bézier entre três pontos consecutivos da espiral"""
+        self.spiral_curves.append(
+            (p1['x'], p1['y']), (p2['x'], p2['y']), (p3['x'], p3['y']),
+            flow_intensity=(p1['frequency_influence'] + p2['frequency_influence']) * 0.5,
+            energy=(p1['energy'] + p2['energy']) * 0.5,
+            hue=(p1['hue'] + p2['hue']) * 0.5
+        )
+    
+    def set_max_spiral_points(self, max_points):
+        """Novo comprimento da espiral; descarta os pontos mais antigos que sobrarem"""
+        self.max_spiral_points = max(3, max_points)
+        while len(self.spiral_points) > self.max_spiral_points:
+            self.spiral_points.pop(0)
+            self.spiral_curves.popleft()
+    
+    def set_curve_segments(self, segments):
+        """Nova resolução das curvas; tessela de novo as curvas existentes"""
+        self.curve_segments = max(2, segments)
+        self.spiral_curves = CurveCache(self.curve_segments, fields=['flow_intensity', 'energy', 'hue'])
+        for i in range(len(self.spiral_points) - 2):
+            self.tessellate_curve(*self.spiral_points[i:i + 3])
+        self.trail_mark = self.spiral_curves.tessellations  # Curvas já no rastro não são redesenhadas
+    
     def update_fibonacci_constellation(self, dt):
         """Atualiza constelação baseada em Fibonacci"""
         fibonacci_positions = [1, 2, 3, 5, 8, 13, 21, 34, 55, 89]
@@ -1641,36 +1756,44 @@ class UniqueMusicalSpiral:
     
     def update_harmonic_particles(self, spectrum, dt, band_center_freqs=None):
         """Partículas que orbitam representando harmonias"""
+        particles = self.harmonic_particles
+        
         # Limita número de partículas
-        self.harmonic_particles = [p for p in self.harmonic_particles if p['life'] > 0]
+        particles.kill(particles['life'] <= 0)
         
         # Cria novas partículas baseadas no espectro
-        if len(spectrum) > 0 and len(self.harmonic_particles) < 24:
-            for i in range(0, min(len(spectrum), 12), 2):
-                energy = spectrum[i]
-                if energy > 0.08:
-                    # Calcula frequência central segura
-                    center_freq = i / 12.0 if band_center_freqs is None or i >= len(band_center_freqs) else band_center_freqs[i]
-                    
-                    particle = {
-                        'orbit_angle': i * (2 * math.pi / 12),
-                        'orbit_radius': 50 + energy * 60,
-                        'rotation_speed': 0.3 + energy * 0.7,
-                        'energy': energy,
-                        'life': 2.0,
-                        'center_freq': center_freq,
-                        'hue': i / 12.0
-                    }
-                    self.harmonic_particles.append(particle)
+        if len(spectrum) > 0 and len(particles) < 24:
+            bands = np.arange(0, min(len(spectrum), 12), 2)
+            energies = np.asarray(spectrum, dtype=float)[bands]
+            bands = bands[energies > 0.08]
+            energies = energies[energies > 0.08]
+            
+            if len(bands) > 0:
+                # Calcula frequência central segura
+                if band_center_freqs is None:
+                    center_freqs = bands / 12.0
+                else:
+                    center_freqs = np.array([band_center_freqs[i] if i < len(band_center_freqs) else i / 12.0
+                                             for i in bands])
+                
+                particles.spawn(
+                    len(bands),
+                    orbit_angle=bands * (2 * math.pi / 12),
+                    orbit_radius=50 + energies * 60,
+                    rotation_speed=0.3 + energies * 0.7,
+                    energy=energies,
+                    life=2.0,
+                    center_freq=center_freqs,
+                    hue=bands / 12.0
+                )
         
         # Atualiza partículas existentes
-        for particle in self.harmonic_particles:
-            particle['orbit_angle'] += particle['rotation_speed'] * dt
-            particle['life'] -= dt / 2
-            
-            # Posição orbital
-            particle['x'] = self.center_x + particle['orbit_radius'] * math.cos(particle['orbit_angle'])
-            particle['y'] = self.center_y + particle['orbit_radius'] * math.sin(particle['orbit_angle'])
+        particles['orbit_angle'] += particles['rotation_speed'] * dt
+        particles['life'] -= dt / 2
+        
+        # Posição orbital
+        particles['x'] = self.center_x + particles['orbit_radius'] * np.cos(particles['orbit_angle'])
+        particles['y'] = self.center_y + particles['orbit_radius'] * np.sin(particles['orbit_angle'])
     
     def create_energy_resonance(self, energy, serenity):
         """Cria ressonância visual da energia"""
@@ -1726,45 +1849,45 @@ class UniqueMusicalSpiral:
         # Cria explosões para eventos de bateria
         if drums.get('kick', 0) > 0.3:
             # Explosão de kick no centro-baixo
-            explosion_x = self.center_x + np.random.randint(-50, 51)
-            explosion_y = self.center_y + 40 + np.random.randint(-20, 21)
+            explosion_x = self.center_x + self.rng.integers(-50, 51)
+            explosion_y = self.center_y + 40 + self.rng.integers(-20, 21)
             self.drum_explosions.create_explosion(explosion_x, explosion_y, drums['kick'], 'kick')
             
         if drums.get('snare', 0) > 0.25:
             # Explosão de snare no centro-alto
-            explosion_x = self.center_x + np.random.randint(-60, 61)
-            explosion_y = self.center_y - 30 + np.random.randint(-25, 26)
+            explosion_x = self.center_x + self.rng.integers(-60, 61)
+            explosion_y = self.center_y - 30 + self.rng.integers(-25, 26)
             self.drum_explosions.create_explosion(explosion_x, explosion_y, drums['snare'], 'snare')
             
         if drums.get('crash', 0) > 0.4:
             # Explosão de crash nas bordas
-            explosion_x = self.center_x + np.random.randint(-100, 101)
-            explosion_y = self.center_y + np.random.randint(-80, 81)
+            explosion_x = self.center_x + self.rng.integers(-100, 101)
+            explosion_y = self.center_y + self.rng.integers(-80, 81)
             self.drum_explosions.create_explosion(explosion_x, explosion_y, drums['crash'], 'crash')
             
         if drums.get('hihat', 0) > 0.2:
             # Mini explosões de hi-hat
-            explosion_x = self.center_x + np.random.randint(-40, 41)
-            explosion_y = self.center_y + np.random.randint(-40, 41)
+            explosion_x = self.center_x + self.rng.integers(-40, 41)
+            explosion_y = self.center_y + self.rng.integers(-40, 41)
             self.drum_explosions.create_explosion(explosion_x, explosion_y, drums['hihat'] * 0.7, 'hihat')
         
         # Cria corpos celestes para instrumentos melódicos
         if melodic.get('piano', 0) > 0.2:
             # Corpo celeste de piano
-            body_x = self.center_x + np.random.randint(-80, 81)
-            body_y = self.center_y + np.random.randint(-60, 61)
+            body_x = self.center_x + self.rng.integers(-80, 81)
+            body_y = self.center_y + self.rng.integers(-60, 61)
             self.celestial_bodies.create_celestial_body(body_x, body_y, melodic['piano'], 'piano')
             
         if melodic.get('strings', 0) > 0.25:
             # Corpo celeste de strings
-            body_x = self.center_x + np.random.randint(-70, 71)
-            body_y = self.center_y + np.random.randint(-50, 51)
+            body_x = self.center_x + self.rng.integers(-70, 71)
+            body_y = self.center_y + self.rng.integers(-50, 51)
             self.celestial_bodies.create_celestial_body(body_x, body_y, melodic['strings'], 'strings')
             
         if melodic.get('harmony', 0) > 0.3:
             # Corpo celeste harmônico
-            body_x = self.center_x + np.random.randint(-90, 91)
-            body_y = self.center_y + np.random.randint(-70, 71)
+            body_x = self.center_x + self.rng.integers(-90, 91)
+            body_y = self.center_y + self.rng.integers(-70, 71)
             self.celestial_bodies.create_celestial_body(body_x, body_y, melodic['harmony'], 'harmony')
         
         # Atualiza sistemas
@@ -1869,7 +1992,7 @@ class UniqueMusicalSpiral:
         color_variation = self.dna_visual_elements.get('color_variation_speed', 0.25)
         
         # Calcula cor única baseada no DNA
-        time_factor = pygame.time.get_ticks() * 0.001 * color_variation
+        time_factor = animation_clock.elapsed() * color_variation
         
         # Cor base única por música
         r = int(127 + 100 * math.sin(time_factor) * brightness)
@@ -1881,7 +2004,7 @@ class UniqueMusicalSpiral:
         g = int(g * intensity)  
         b = int(b * intensity)
         
-        current_time = time.time()
+        current_time = animation_clock.now()
         
         # Desenha espiral com características únicas
         for i in range(len(self.spiral_points) - 2):
@@ -1910,7 +2033,7 @@ class UniqueMusicalSpiral:
                 point2 = self.quadratic_bezier(p1, p2, p3, t2)
                 
                 # Desenha linha com características únicas
-                pygame.draw.line(screen, (segment_r, segment_g, segment_b), 
+                draw.line(screen, (segment_r, segment_g, segment_b), 
                                point1, point2, thickness)
         
         # Desenha pontos de destaque únicos
@@ -1927,19 +2050,19 @@ class UniqueMusicalSpiral:
             
             # Tamanho único baseado no DNA
             size = max(2, int(4 * intensity))
-            pygame.draw.circle(screen, (highlight_r, highlight_g, highlight_b), 
+            draw.circle(screen, (highlight_r, highlight_g, highlight_b), 
                              (int(pos[0]), int(pos[1])), size)
         
         # Adiciona efeito de brilho único nas extremidades
         if len(self.spiral_points) > 2:
             # Início da espiral
             start_glow = int(20 * intensity)
-            pygame.draw.circle(screen, (r, g, b), 
+            draw.circle(screen, (r, g, b), 
                              (int(self.spiral_points[0][0]), int(self.spiral_points[0][1])), start_glow, 2)
             
             # Final da espiral
             end_glow = int(15 * intensity)
-            pygame.draw.circle(screen, (min(255, r + 30), min(255, g + 20), min(255, b + 25)), 
+            draw.circle(screen, (min(255, r + 30), min(255, g + 20), min(255, b + 25)), 
                              (int(self.spiral_points[-1][0]), int(self.spiral_points[-1][1])), end_glow, 2)
     
     def draw_musical_spiral(self, screen):
@@ -1947,77 +2070,67 @@ class UniqueMusicalSpiral:
         if len(self.spiral_points) < 3:
             return
         
-        current_time = time.time()
-        
-        # Desenha segmentos com curvas fluidas e cores harmoniosas
-        for i in range(len(self.spiral_points) - 2):
-            p1 = self.spiral_points[i]
-            p2 = self.spiral_points[i + 1]
-            p3 = self.spiral_points[i + 2]
-            
-            if p1['life'] <= 0 or p2['life'] <= 0 or p3['life'] <= 0:
-                continue
-            
-            # Múltiplos segmentos para curva suave (interpolação)
-            curve_segments = 8
-            for seg in range(curve_segments):
-                t = seg / curve_segments
-                t_next = (seg + 1) / curve_segments
-                
-                # Interpolação quadrática suave (Bézier simples)
-                def bezier_point(t):
-                    # Curva quadrática entre p1, p2, p3
-                    inv_t = 1 - t
-                    x = inv_t * inv_t * p1['x'] + 2 * inv_t * t * p2['x'] + t * t * p3['x']
-                    y = inv_t * inv_t * p1['y'] + 2 * inv_t * t * p2['y'] + t * t * p3['y']
-                    return x, y
-                
-                x1, y1 = bezier_point(t)
-                x2, y2 = bezier_point(t_next)
-                
-                # Ondulação laminar adicional
-                flow_phase = current_time * 0.5 + i * 0.1 + seg * 0.05
-                flow_intensity = (p1['frequency_influence'] + p2['frequency_influence']) * 0.5
-                
-                laminar_offset = math.sin(flow_phase) * flow_intensity * 2
-                y1 += laminar_offset
-                y2 += laminar_offset * 0.8
-                
-                # Cores que fluem harmoniosamente
-                segment_energy = (p1['energy'] + p2['energy']) * 0.5
-                base_hue = (p1['hue'] + p2['hue']) * 0.5
-                
-                # Cor fluida harmoniosa
-                flowing_color = DelicateColors.flowing_harmonic_color(
-                    base_hue, 
-                    current_time + i * 0.2, 
-                    flow_intensity,
-                    segment_energy
-                )
-                
-                # Alpha que respira com a vida dos pontos
-                alpha = (p1['life'] + p2['life']) * 0.4
-                final_color = DelicateColors.safe_color(flowing_color, alpha)
-                
-                # Espessura que varia com energia e fluxo
-                base_thickness = 1 + segment_energy * 2
-                flow_thickness = 1 + math.sin(flow_phase * 2) * 0.3
-                thickness = max(1, int(base_thickness * flow_thickness))
-                
-                # Valida posições
-                x1 = max(0, min(SCREEN_WIDTH, int(x1)))
-                y1 = max(0, min(SCREEN_HEIGHT, int(y1)))
-                x2 = max(0, min(SCREEN_WIDTH, int(x2)))
-                y2 = max(0, min(SCREEN_HEIGHT, int(y2)))
-                
-                # Desenha segmento fluido
-                try:
-                    pygame.draw.line(screen, final_color, (x1, y1), (x2, y2), thickness)
-                except:
-                    continue
+        current_time = animation_clock.now()
+        if not self.trails:
+            self.draw_spiral_curves(screen, current_time, 0)
         
         # Desenha pontos de conexão com gradientes laminares
         self.draw_laminar_connection_points(screen, current_time)
+    
+    def draw_trail(self, surface):
+        """Buffer persistente: só as curvas tesseladas desde o último quadro"""
+        curves = self.spiral_curves
+        new = min(len(curves), curves.tessellations - self.trail_mark)
+        self.trail_mark = curves.tessellations
+        if new > 0:
+            self.draw_spiral_curves(surface, animation_clock.now(), len(curves) - new)
+    
+    def trail_retention(self):
+        return retention(self.trail_dt, SPIRAL_TRAIL_TAU)
+    
+    def draw_spiral_curves(self, screen, current_time, first):
+        """Curvas da espiral a partir da curva `first` (ondulação e cor do instante atual)"""
+        curves = self.spiral_curves
+        x1, y1, x2, y2 = curves.segments_view()
+        flow_intensity, segment_energy, base_hue = curves['flow_intensity'], curves['energy'], curves['hue']
+        
+        # Só curvas cujos três pontos ainda vivem
+        lives = np.array([point['life'] for point in self.spiral_points])
+        alive = (lives[:-2] > 0) & (lives[1:-1] > 0) & (lives[2:] > 0)
+        alive[:first] = False
+        
+        # Ondulação laminar adicional (fase por curva e por segmento)
+        index = np.arange(len(curves))
+        flow_phase = current_time * 0.5 + index[:, None] * 0.1 + np.arange(curves.segments) * 0.05
+        laminar_offset = np.sin(flow_phase) * flow_intensity[:, None] * 2
+        y1 = y1 + laminar_offset
+        y2 = y2 + laminar_offset * 0.8
+        
+        # Espessura que varia com energia e fluxo
+        base_thickness = 1 + segment_energy[:, None] * 2
+        flow_thickness = 1 + np.sin(flow_phase * 2) * 0.3
+        thickness = np.maximum(1, (base_thickness * flow_thickness).astype(int))
+        
+        # Valida posições
+        x1 = np.clip(x1.astype(int), 0, SCREEN_WIDTH)
+        y1 = np.clip(y1.astype(int), 0, SCREEN_HEIGHT)
+        x2 = np.clip(x2.astype(int), 0, SCREEN_WIDTH)
+        y2 = np.clip(y2.astype(int), 0, SCREEN_HEIGHT)
+        
+        # Alpha que respira com a vida dos pontos
+        alpha = np.clip((lives[:-2] + lives[1:-1]) * 0.4, 0.0, 1.0)
+        
+        # Cor fluida harmoniosa (uma por curva)
+        final_colors = flowing_array(base_hue, current_time + index * 0.2, flow_intensity,
+                                     segment_energy, alpha).tolist()
+        
+        for i in np.nonzero(alive)[0].tolist():
+            final_color = final_colors[i]
+            
+            # Desenha segmentos fluidos
+            for sx, sy, ex, ey, width in zip(x1[i].tolist(), y1[i].tolist(), x2[i].tolist(),
+                                             y2[i].tolist(), thickness[i].tolist()):
+                draw.line(screen, final_color, (sx, sy), (ex, ey), width)
         
     def draw_laminar_connection_points(self, screen, current_time):
         """Desenha pontos de conexão com efeito laminar"""
@@ -2037,7 +2150,7 @@ class UniqueMusicalSpiral:
                 y = max(0, min(SCREEN_HEIGHT, int(point['y'])))
                 
                 # Gradiente laminar em camadas
-                for layer in range(3, 0, -1):
+                for layer in range(3 if self.halos else 0, 0, -1):
                     layer_size = size + layer * 2
                     layer_alpha = point['life'] * (0.3 - layer * 0.08)
                     
@@ -2053,7 +2166,7 @@ class UniqueMusicalSpiral:
                     final_color = DelicateColors.safe_color(layer_color, layer_alpha)
                     
                     try:
-                        pygame.draw.circle(screen, final_color, (x, y), layer_size)
+                        draw.circle(screen, final_color, (x, y), layer_size)
                     except:
                         continue
                 
@@ -2069,7 +2182,7 @@ class UniqueMusicalSpiral:
                 final_core = DelicateColors.safe_color(core_color, point['life'])
                 
                 try:
-                    pygame.draw.circle(screen, final_core, (x, y), core_size)
+                    draw.circle(screen, final_core, (x, y), core_size)
                 except:
                     continue
     
@@ -2095,76 +2208,107 @@ class UniqueMusicalSpiral:
             x = max(0, min(SCREEN_WIDTH, int(particle['x'])))
             y = max(0, min(SCREEN_HEIGHT, int(particle['y'])))
             
-            pygame.draw.circle(screen, alpha_color, (x, y), size)
+            draw.circle(screen, alpha_color, (x, y), size)
     
     def draw_harmonic_particles(self, screen):
         """Partículas harmônicas com escoamento laminar"""
-        current_time = time.time()
+        current_time = animation_clock.now()
+        
+        particles = self.harmonic_particles
+        xs = particles['x'].tolist()
+        ys = particles['y'].tolist()
+        energies = particles['energy'].tolist()
+        lives = particles['life'].tolist()
+        
+        # Cores de todas as partículas de uma vez
+        index = np.arange(len(particles))
+        flowing_colors = flowing_array(particles['hue'], current_time * 0.6 + index * 0.3,
+                                       particles['energy'], particles['energy'])
+        
+        # Cor baseada na FREQUÊNCIA REAL com mapeamento logarítmico
+        center_freqs = np.maximum(particles['center_freq'], 1e-12)
+        hues = np.where(particles['center_freq'] > 0,
+                        np.mod(69 + 12 * np.log2(center_freqs / 440.0), 12) / 12.0, 0.0)
+        alpha_colors = pastel_array(hues, particles['energy'], particles['life'] * 0.8)
+        
+        # Trilha: 5 segmentos cada vez mais tênues
+        trail_segments = 5
+        trail_alphas = particles['life'][:, None] * (0.1 - np.arange(trail_segments) * 0.015)
+        trail_colors = scale_array(flowing_colors[:, None, :], trail_alphas)
+        
+        if self.splat:
+            self.splat_harmonic_particles(screen, current_time, alpha_colors, trail_colors)
+            return
+        alpha_colors, trail_colors = alpha_colors.tolist(), trail_colors.tolist()
         
-        for i, particle in enumerate(self.harmonic_particles):
-            if particle['life'] <= 0:
+        for i in range(len(particles)):
+            if lives[i] <= 0:
                 continue
             
             # Ondulação laminar na posição
             laminar_phase = current_time * 0.8 + i * 0.4
-            flow_offset_x = math.sin(laminar_phase) * particle['energy'] * 3
-            flow_offset_y = math.cos(laminar_phase * 1.2) * particle['energy'] * 2
+            flow_offset_x = math.sin(laminar_phase) * energies[i] * 3
+            flow_offset_y = math.cos(laminar_phase * 1.2) * energies[i] * 2
             
-            x = particle['x'] + flow_offset_x
-            y = particle['y'] + flow_offset_y
+            x = xs[i] + flow_offset_x
+            y = ys[i] + flow_offset_y
                 
             # Tamanho que pulsa com fluxo laminar
             flow_pulse = math.sin(laminar_phase * 1.5) * 0.3 + 1
-            base_size = 2 + particle['energy'] * 4
+            base_size = 2 + energies[i] * 4
             size = max(1, int(base_size * flow_pulse))
             
-            # Cor harmoniosa fluente
-            flowing_color = DelicateColors.flowing_harmonic_color(
-                particle['hue'],
-                current_time * 0.6 + i * 0.3,
-                particle['energy'],
-                particle['energy']
-            )
-            
-            
             # Valida posição
             x = max(0, min(SCREEN_WIDTH, int(x)))
             y = max(0, min(SCREEN_HEIGHT, int(y)))
-
-            # Cor baseada na FREQUÊNCIA REAL com mapeamento logarítmico
-            # Usamos a nova função que adicionamos na classe DelicateColors
-            hue = DelicateColors.frequency_to_hue_logarithmic(particle['center_freq'])
-            
-            color = DelicateColors.soft_pastel(hue, particle['energy'])
-            alpha_color = DelicateColors.safe_color(color, particle['life'] * 0.8)
                 
             try:
-                pygame.draw.circle(screen, alpha_color, (x, y), size)
+                draw.circle(screen, alpha_colors[i], (x, y), size)
             except:
                 continue
             
             # Trilha laminar conectando ao centro
-            trail_segments = 5
             for seg in range(trail_segments):
                 t = seg / trail_segments
                 trail_x = x + (self.center_x - x) * t
                 trail_y = y + (self.center_y - y) * t
                 
                 # Ondulação na trilha
-                trail_flow = math.sin(laminar_phase + seg * 0.5) * particle['energy']
+                trail_flow = math.sin(laminar_phase + seg * 0.5) * energies[i]
                 trail_y += trail_flow
                 
-                trail_alpha = particle['life'] * (0.1 - seg * 0.015)
-                trail_color = DelicateColors.safe_color(flowing_color, trail_alpha)
-                
                 trail_x = max(0, min(SCREEN_WIDTH, int(trail_x)))
                 trail_y = max(0, min(SCREEN_HEIGHT, int(trail_y)))
                 
                 try:
-                    pygame.draw.circle(screen, trail_color, (trail_x, trail_y), 1)
+                    draw.circle(screen, trail_colors[i][seg], (trail_x, trail_y), 1)
                 except:
                     continue
     
+    def splat_harmonic_particles(self, screen, current_time, colors, trail_colors):
+        """Mesmas posições de draw_harmonic_particles, somadas direto nos pixels"""
+        particles = self.harmonic_particles
+        alive = particles['life'] > 0
+        energies = particles['energy'][alive]
+        phases = current_time * 0.8 + np.nonzero(alive)[0] * 0.4
+        
+        # Ondulação laminar e pulso
+        x = np.clip(particles['x'][alive] + np.sin(phases) * energies * 3, 0, SCREEN_WIDTH).astype(int)
+        y = np.clip(particles['y'][alive] + np.cos(phases * 1.2) * energies * 2, 0, SCREEN_HEIGHT).astype(int)
+        sizes = np.maximum(1, ((2 + energies * 4) * (np.sin(phases * 1.5) * 0.3 + 1)).astype(int))
+        
+        # Trilha até o centro: um pixel por segmento
+        segments = trail_colors.shape[1]
+        t = np.arange(segments) / segments
+        trail_x = x[:, None] + (self.center_x - x)[:, None] * t
+        trail_y = (y[:, None] + (self.center_y - y)[:, None] * t
+                   + np.sin(phases[:, None] + np.arange(segments) * 0.5) * energies[:, None])
+        trail_x = np.clip(trail_x.astype(int), 0, SCREEN_WIDTH)
+        trail_y = np.clip(trail_y.astype(int), 0, SCREEN_HEIGHT)
+        
+        splat(screen, x, y, colors[alive], sizes)
+        splat(screen, trail_x.ravel(), trail_y.ravel(), trail_colors[alive].reshape(-1, 3), 1)
+    
     def draw_energy_resonances(self, screen):
         """Desenha anéis de ressonância da energia"""
         for ring in self.beat_resonance_rings:
@@ -2190,31 +2334,31 @@ class UniqueMusicalSpiral:
             
             radius = max(1, int(ring['radius']))
             if radius > 0:
-                pygame.draw.circle(screen, alpha_color,
+                draw.circle(screen, alpha_color,
                                  (self.center_x, self.center_y), radius, 2)
     
     def draw_sacred_geometry(self, screen):
         """Desenha geometria sagrada matemática"""
-        for geom in self.sacred_geometry:
-            if geom['life'] <= 0:
-                continue
-                
-            # Vértices do polígono
-            vertices = []
-            for i in range(geom['sides']):
-                angle = geom['rotation'] + i * (2 * math.pi / geom['sides'])
-                x = self.center_x + geom['radius'] * math.cos(angle)
-                y = self.center_y + geom['radius'] * math.sin(angle)
-                vertices.append((int(x), int(y)))
-            
+        alive = [geom for geom in self.sacred_geometry if geom['life'] > 0]
+        if not alive:
+            return
+        
+        # Vértices: uma linha da tabela de polígonos unitários (3-8 lados) por forma, posicionadas em lote
+        sides = [geom['sides'] for geom in alive]
+        radii = np.array([geom['radius'] for geom in alive])
+        rotations = np.array([geom['rotation'] for geom in alive])
+        placed = place(polygon_table(8)[sides], radii[:, None], rotations[:, None], (self.center_x, self.center_y))
+        vertices = [polygon[:n] for polygon, n in zip(to_points(placed), sides)]
+        
+        for geom, polygon in zip(alive, vertices):
             # Cor baseada na harmonia
             color = DelicateColors.soft_pastel(geom['hue'], 0.7)
             alpha_color = DelicateColors.safe_color(color, geom['life'] * 0.4)
             
             # Desenha polígono
-            if len(vertices) > 2:
+            if len(polygon) > 2:
                 try:
-                    pygame.draw.polygon(screen, alpha_color, vertices, 2)
+                    draw.polygon(screen, alpha_color, polygon, 2)
                 except:
                     pass  # Ignora se vertices inválidos
     
@@ -2224,28 +2368,23 @@ class UniqueMusicalSpiral:
             return
             
         num_petals = min(len(spectrum), 12)
-        
-        for i in range(num_petals):
-            energy = spectrum[i] if i < len(spectrum) else 0
-            
-            if energy < 0.05:
-                continue
-            
-            # Posição baseada na proporção áurea
-            angle = i * (2 * math.pi / self.golden_ratio)
-            distance = 70 + energy * 50
-            
-            x = self.center_x + distance * math.cos(angle)
-            y = self.center_y + distance * math.sin(angle)
-            
-            # Cor mapeada à frequência
-            hue = (i / num_petals + 0.2) % 1.0
-            color = DelicateColors.soft_pastel(hue, energy)
-            
-            size = max(1, int(1 + energy * 6))
-            x_pos = max(0, min(SCREEN_WIDTH, int(x)))
-            y_pos = max(0, min(SCREEN_HEIGHT, int(y)))
-            pygame.draw.circle(screen, color, (x_pos, y_pos), size)
+        energies = np.asarray(spectrum[:num_petals], dtype=float)
+        visible = np.nonzero(energies >= 0.05)[0]
+        if len(visible) == 0:
+            return
+        energies = energies[visible]
+        
+        # Posição baseada na proporção áurea (tabela de direções), distância pela energia
+        positions = place(golden_directions(num_petals)[visible], 70 + energies * 50, 0.0,
+                          (self.center_x, self.center_y))
+        xs = np.clip(positions.real.astype(int), 0, SCREEN_WIDTH).tolist()
+        ys = np.clip(positions.imag.astype(int), 0, SCREEN_HEIGHT).tolist()
+        
+        # Cor mapeada à frequência
+        colors = pastel_array((visible / num_petals + 0.2) % 1.0, energies).tolist()
+        sizes = np.maximum(1, (1 + energies * 6).astype(int)).tolist()
+        for i in range(len(visible)):
+            draw.circle(screen, colors[i], (xs[i], ys[i]), sizes[i])
     
     def draw_musical_signature(self, screen):
         """Desenha assinatura visual da música"""
@@ -2266,7 +2405,7 @@ class UniqueMusicalSpiral:
                 rect_h = bar_height
                 
                 if rect_x + rect_w < SCREEN_WIDTH and rect_y + rect_h < SCREEN_HEIGHT:
-                    pygame.draw.rect(screen, color, (rect_x, rect_y, rect_w, rect_h))
+                    draw.rect(screen, color, (rect_x, rect_y, rect_w, rect_h))
         
         # Padrão rítmico como pontos
         rhythm_y = signature_y + 25
@@ -2279,90 +2418,101 @@ class UniqueMusicalSpiral:
                 x_pos = max(0, min(SCREEN_WIDTH, signature_x + i * 6))
                 y_pos = max(0, min(SCREEN_HEIGHT, rhythm_y))
                 
-                pygame.draw.circle(screen, color, (x_pos, y_pos), size)
+                draw.circle(screen, color, (x_pos, y_pos), size)
 
 class FlowingPetals:
     """Pétalas flutuantes orgânicas"""
     
-    def __init__(self):
-        self.petals = []
+    def __init__(self, max_petals=30):
+        # Ao exceder o limite, as pétalas mais antigas dão lugar às novas
+        self.petals = ParticleEngine(max_petals, fields=[
+            'hue', 'rotation', 'spin', 'sway_phase', 'sway_speed'
+        ], evict_oldest=True)
         self.spawn_timer = 0
+        self.rng = random_streams.stream('flowing_petals')
+        self.splat = False
         
     def update(self, spectrum, gentle_energy, dt):
         """Atualiza pétalas com movimento orgânico"""
         self.spawn_timer += dt
         
         # Cria novas pétalas suavemente
-        if self.spawn_timer > 2.0 + np.random.random() * 3.0:
+        if self.spawn_timer > 2.0 + self.rng.random() * 3.0:
             self.spawn_timer = 0
             
             # Cria pétala no topo da tela
-            petal = {
-                'x': np.random.random() * SCREEN_WIDTH,
-                'y': -10,
-                'vx': (np.random.random() - 0.5) * 20,
-                'vy': 10 + np.random.random() * 20,
-                'size': 3 + np.random.random() * 6,
-                'hue': np.random.random(),
-                'life': 1.0,
-                'rotation': np.random.random() * 2 * math.pi,
-                'spin': (np.random.random() - 0.5) * 0.5,
-                'sway_phase': np.random.random() * 2 * math.pi,
-                'sway_speed': 0.5 + np.random.random() * 1.0
-            }
-            self.petals.append(petal)
+            self.petals.spawn(
+                x=self.rng.random() * SCREEN_WIDTH,
+                y=-10,
+                vx=(self.rng.random() - 0.5) * 20,
+                vy=10 + self.rng.random() * 20,
+                size=3 + self.rng.random() * 6,
+                hue=self.rng.random(),
+                life=1.0,
+                rotation=self.rng.random() * 2 * math.pi,
+                spin=(self.rng.random() - 0.5) * 0.5,
+                sway_phase=self.rng.random() * 2 * math.pi,
+                sway_speed=0.5 + self.rng.random() * 1.0
+            )
             
         # Atualiza pétalas existentes
-        for petal in self.petals[:]:
-            # Movimento suave com balanceio
-            petal['sway_phase'] += petal['sway_speed'] * dt
-            sway = math.sin(petal['sway_phase']) * 15
-            
-            petal['x'] += (petal['vx'] + sway) * dt
-            petal['y'] += petal['vy'] * dt
-            petal['rotation'] += petal['spin'] * dt
-            
-            # Responde suavemente ao espectro
-            if len(spectrum) > 0:
-                spectrum_influence = np.mean(spectrum) * 10
-                petal['vx'] += (np.random.random() - 0.5) * spectrum_influence * dt
-                
-            # Envelhecimento suave
-            petal['life'] -= dt * 0.1
+        petals = self.petals
+        if len(petals) == 0:
+            return
+        
+        # Movimento suave com balanceio
+        petals['sway_phase'] += petals['sway_speed'] * dt
+        sway = np.sin(petals['sway_phase']) * 15
+        
+        petals['x'] += (petals['vx'] + sway) * dt
+        petals['y'] += petals['vy'] * dt
+        petals['rotation'] += petals['spin'] * dt
+        
+        # Responde suavemente ao espectro
+        if len(spectrum) > 0:
+            spectrum_influence = np.mean(spectrum) * 10
+            petals['vx'] += (self.rng.random(len(petals)) - 0.5) * spectrum_influence * dt
             
-            # Remove pétalas que saíram ou morreram
-            if petal['y'] > SCREEN_HEIGHT + 50 or petal['life'] <= 0:
-                self.petals.remove(petal)
-                
-        # Limita número de pétalas
-        if len(self.petals) > 30:
-            self.petals = self.petals[-30:]
+        # Envelhecimento suave
+        petals['life'] -= dt * 0.1
+        
+        # Remove pétalas que saíram ou morreram
+        petals.kill((petals['y'] > SCREEN_HEIGHT + 50) | (petals['life'] <= 0))
             
     def draw(self, screen):
         """Desenha pétalas delicadas"""
-        for petal in self.petals:
-            if petal['life'] <= 0:
-                continue
-                
-            # Cor suave com transparência
-            alpha = petal['life']
-            color = DelicateColors.soft_pastel(petal['hue'], alpha * 0.7)
-            
-            # Tamanho que muda suavemente
-            size = max(1, int(petal['size'] * alpha))
-            
-            # Valida posição
-            x_pos = max(0, min(SCREEN_WIDTH, int(petal['x'])))
-            y_pos = max(0, min(SCREEN_HEIGHT, int(petal['y'])))
-            
-            if size > 0:
-                # Desenha pétala como elipse rotacionada (simples)
-                pygame.draw.circle(screen, color, (x_pos, y_pos), size)
-                
-                # Brilho no centro
-                highlight = DelicateColors.soft_pastel(petal['hue'], alpha)
-                highlight_size = max(1, size // 2)
-                pygame.draw.circle(screen, highlight, (x_pos, y_pos), highlight_size)
+        petals = self.petals
+        
+        # Tamanho que muda suavemente e posição validada
+        sizes = np.maximum(1, (petals['size'] * petals['life']).astype(int)).tolist()
+        xs = np.clip(petals['x'].astype(int), 0, SCREEN_WIDTH).tolist()
+        ys = np.clip(petals['y'].astype(int), 0, SCREEN_HEIGHT).tolist()
+        
+        if self.splat:
+            # Corpo e brilho central somados (o centro fica mais claro pela soma)
+            alive = petals['life'] > 0
+            lives, hues = petals['life'][alive], petals['hue'][alive]
+            body = np.asarray(sizes)[alive]
+            splat(screen, petals['x'][alive], petals['y'][alive], pastel_array(hues, lives * 0.7), body)
+            splat(screen, petals['x'][alive], petals['y'][alive], pastel_array(hues, lives) // 3,
+                  np.maximum(1, body // 2))
+            return
+        
+        # Pétala como elipse rotacionada: sprite por (tamanho, matiz, vida, rotação pré-calculada)
+        alive = np.flatnonzero(petals['life'] > 0)
+        keys = zip(np.asarray(sizes)[alive].tolist(), quantize(petals['hue'][alive], HUE_LEVELS),
+                   quantize(petals['life'][alive], INTENSITY_LEVELS), angle_levels(petals['rotation'][alive]))
+        sprite_cache.draw(screen, list(keys), self.render_petal,
+                          np.asarray(xs)[alive], np.asarray(ys)[alive])
+    
+    @staticmethod
+    def render_petal(key, factor):
+        """Sprite da pétala com brilho no centro"""
+        size, hue_level, life_level, angle_level = key
+        hue, alpha = level_value(hue_level, HUE_LEVELS), level_value(life_level, INTENSITY_LEVELS)
+        color = DelicateColors.soft_pastel(hue, alpha * 0.7)
+        highlight = DelicateColors.soft_pastel(hue, alpha)
+        return render_petal(color, highlight, size, angle_level * math.pi / ANGLE_LEVELS, factor)
 
 class GentleWaves:
     """Ondas extremamente suaves e orgânicas"""
@@ -2371,6 +2521,7 @@ class GentleWaves:
         self.y_base = y_position
         self.phase = 0.0
         self.amplitude = 25
+        self.x_step = 8  # Resolução horizontal (governador de qualidade)
         
     def update(self, spectrum, flow_rhythm, dt):
         """Atualização orgânica das ondas"""
@@ -2380,51 +2531,43 @@ class GentleWaves:
         if len(spectrum) > 0:
             energy = np.mean(spectrum)
             target_amplitude = 15 + energy * 40
-            self.amplitude = self.amplitude * 0.98 + target_amplitude * 0.02
+            self.amplitude = ema(self.amplitude, target_amplitude, dt, 0.825)
             
     def draw(self, screen, spectrum):
         """Desenha ondas suaves como seda"""
-        points = []
-        
-        # Gera pontos da onda
-        for x in range(0, SCREEN_WIDTH + 10, 8):
-            # Múltiplas ondas harmônicas suaves
-            wave1 = math.sin(x * 0.005 + self.phase) * self.amplitude
-            wave2 = math.sin(x * 0.008 + self.phase * 0.7) * self.amplitude * 0.5
-            wave3 = math.sin(x * 0.003 + self.phase * 1.3) * self.amplitude * 0.3
-            
-            y = self.y_base + wave1 + wave2 + wave3
-            points.append((x, int(y)))
-            
-        # Desenha onda com gradiente suave
-        if len(points) > 1:
-            for i in range(len(points) - 1):
-                progress = i / len(points)
-                
-                # Cor que flui suavemente
-                hue = (self.phase * 0.1 + progress * 0.3) % 1.0
-                color = DelicateColors.soft_pastel(hue, 0.6)
-                
-                # Valida pontos
-                p1 = points[i]
-                p2 = points[i + 1]
-                x1 = max(0, min(SCREEN_WIDTH, int(p1[0])))
-                y1 = max(0, min(SCREEN_HEIGHT, int(p1[1])))
-                x2 = max(0, min(SCREEN_WIDTH, int(p2[0])))
-                y2 = max(0, min(SCREEN_HEIGHT, int(p2[1])))
-                
-                pygame.draw.line(screen, color, (x1, y1), (x2, y2), 2)
+        # Gera pontos da onda (múltiplas ondas harmônicas suaves)
+        xs = np.arange(0, SCREEN_WIDTH + 10, self.x_step)
+        wave1 = np.sin(xs * 0.005 + self.phase) * self.amplitude
+        wave2 = np.sin(xs * 0.008 + self.phase * 0.7) * self.amplitude * 0.5
+        wave3 = np.sin(xs * 0.003 + self.phase * 1.3) * self.amplitude * 0.3
+        ys = (self.y_base + wave1 + wave2 + wave3).astype(int)
+        
+        # Valida pontos
+        points = np.column_stack((np.clip(xs, 0, SCREEN_WIDTH), np.clip(ys, 0, SCREEN_HEIGHT)))
+        
+        # Cor que flui suavemente ao longo da onda (um trecho por cor quantizada)
+        progress = np.arange(len(points) - 1) / len(points)
+        hues = (self.phase * 0.1 + progress * 0.3) % 1.0
+        draw_polyline(screen, points, pastel_array(hues, 0.6), 2)
 
 class DelicateVisualizer:
     """Visualizador delicado e orgânico"""
     
-    def __init__(self, audio_file):
+    def __init__(self, audio_file, playback=True, render_scale=None, display_size=None, splat_components=None,
+                 trail_components=None, sinks=None, analysis=None, feature_bus=None):
         try:
+            # Visão inscrita numa sessão: análise, áudio e relógio vêm do processo que publica
+            self.feature_bus = feature_bus_name(feature_bus)
+            if self.feature_bus:
+                playback = False
+            
             print("🎮 Inicializando pygame...")
             pygame.init()
             
             print("📺 Criando tela...")
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            # Janela pode ser maior que o layout (TVs); a escala define a resolução interna
+            display_size, render_scale = render_settings((SCREEN_WIDTH, SCREEN_HEIGHT), render_scale, display_size)
+            self.screen = pygame.display.set_mode(display_size)
             pygame.display.set_caption("🌸 Visualizador Delicado - Espiral Winding")
             
             self.clock = pygame.time.Clock()
@@ -2432,7 +2575,7 @@ class DelicateVisualizer:
             
             print("🎵 Inicializando analisador de áudio...")
             # Analisador gentil
-            self.analyzer = GentleAudioAnalyzer(audio_file)
+            self.analyzer = GentleAudioAnalyzer(audio_file, playback)
             
             print("🌀 Criando elementos visuais...")
             # Elementos visuais delicados
@@ -2449,22 +2592,131 @@ class DelicateVisualizer:
             
             # Estado visual suave
             self.background_breathing = 0.0
+            self.frame_features = None
+            
+            # Rastro da espiral em buffer persistente (opcional)
+            spiral = self.musical_spiral
+            spiral.trails = trail_enabled(trail_settings(trail_components), 'musical_spiral')
+            
+            # Camadas: fundo em cache (modulado pela cor que respira) e elementos por quadro
+            self.compositor = Compositor((SCREEN_WIDTH, SCREEN_HEIGHT), render_scale=render_scale,
+                                         display_size=display_size)
+            self.compositor.add(Layer('background', self.draw_background, SLOW,
+                                      key=self.background_level, blend=pygame.BLEND_MULT,
+                                      tint=self.background_tint))
+            self.compositor.add(Layer('waves', self.draw_waves))
+            self.compositor.add(Layer('petals', self.flowing_petals.draw))
+            if spiral.trails:
+                self.compositor.add(Layer('spiral_trail', spiral.draw_trail, TRAIL, rect=spiral.trail_rect,
+                                          fade=spiral.trail_retention, blend=pygame.BLEND_MAX))
+            self.compositor.add(Layer('spiral', self.draw_spiral))
+            
+            # Qualidade adaptativa: knobs entre o valor máximo e o mínimo aceitável
+            self.frame_index = 0
+            self.analysis_interval = 1
+            
+            # Simulação em passos fixos de 1/60 s, qualquer que seja a taxa de quadros
+            self.timestep = FixedTimestep()
+            
+            # Saídas (motores via serial, rede) alimentadas pelo runtime
+            self.playback = playback
+            self.sinks = sink_settings(sinks)
+            self.runtime = None
+            
+            # Análise no próprio processo ou num processo separado (iniciado em run())
+            self.audio_file = audio_file
+            self.analysis_mode = analysis_mode(analysis)
+            self.worker = None
+            self.bus = None
+            self.features = None
+            self.quality = QualityGovernor()
+            self.setup_quality_knobs()
+            
+            # Rasterizador de splatting nos componentes escolhidos
+            splatting = splat_settings(splat_components)
+            for name, component in self.point_cloud_components().items():
+                component.splat = splat_enabled(splatting, name)
             
             print("✅ Visualizador delicado carregado com sucesso!")
             print("💫 SPACE=pause, ESC=sair")
             print("🌊 Relaxe e deixe-se levar pela suavidade...")
             
-            # Auto-start
-            threading.Timer(1.5, self.analyzer.start_playbook_safe).start()
-            
         except Exception as e:
             print(f"❌ Erro na inicialização: {e}")
             raise
         
-    def update(self, dt):
-        """Atualização orgânica e suave"""
-        features = self.analyzer.analyze_gently()
+    def point_cloud_components(self):
+        """Componentes com nuvens de pontos que aceitam splatting (nome -> componente)"""
+        spiral = self.musical_spiral
+        return {
+            'musical_spiral': spiral,
+            'drum_explosions': spiral.drum_explosions,
+            'celestial_bodies': spiral.celestial_bodies,
+            'flowing_petals': self.flowing_petals,
+        }
+        
+    def setup_quality_knobs(self):
+        """Declara o que o governador pode reduzir para manter o FPS"""
+        spiral = self.musical_spiral
+        drums, celestial = spiral.drum_explosions, spiral.celestial_bodies
+        
+        def set_particle_scale(scale):
+            drums.particles.set_limit(drums.particles.capacity * scale)
+            celestial.orbitals.set_limit(celestial.orbitals.capacity * scale)
+            self.flowing_petals.petals.set_limit(self.flowing_petals.petals.capacity * scale)
+        
+        def set_halos(enabled):
+            drums.halos = celestial.halos = spiral.halos = enabled
+        
+        def set_wave_step(step):
+            for wave in self.gentle_waves:
+                wave.x_step = step
+        
+        def set_analysis_interval(frames):
+            self.analysis_interval = frames
+        
+        quality = self.quality
+        quality.add_knob('max_spiral_points', 120, 40, spiral.set_max_spiral_points)
+        quality.add_knob('curve_segments', 8, 3, spiral.set_curve_segments)
+        quality.add_knob('wave_x_step', 8, 24, set_wave_step)
+        quality.add_knob('particle_scale', 1.0, 0.25, set_particle_scale, integer=False)
+        quality.add_knob('halos', True, False, set_halos)
+        quality.add_knob('analysis_interval', 1, 3, set_analysis_interval)
+        
+    def moving_engines(self):
+        """Motores cujas partículas se movem entre passos (desenhadas na posição interpolada)"""
+        return [self.musical_spiral.drum_explosions.particles, self.flowing_petals.petals]
+    
+    def update(self, dt, features=None):
+        """Atualização orgânica e suave: análise uma vez por quadro, elementos em passos fixos"""
+        # Análise visual na cadência do nível de qualidade (reutiliza a última entre uma e outra);
+        # o caminho tátil roda em todo quadro
+        if features is not None:
+            self.features = features
+        elif self.features is None or self.frame_index % self.analysis_interval == 0:
+            try:
+                self.features = self.analyzer.analyze_gently()
+            except Exception as e:
+                print(f"⚠️ Erro na análise: {e}")
+                self.features = self.analyzer.get_serene_state()
+        else:
+            self.features['tactile'] = self.analyzer.analyze_tactile()
+        self.frame_index += 1
+        features = self.features
         
+        # O rastro da espiral esmaece por quadro desenhado
+        self.musical_spiral.trail_dt = dt
+        
+        for _ in range(self.timestep.advance(dt)):
+            for engine in self.moving_engines():
+                engine.begin_step()
+            self.step(features, self.timestep.step)
+            
+        # Respiração do fundo
+        self.background_breathing = features['breath_cycle']
+        
+    def step(self, features, dt):
+        """Um passo fixo de simulação dos elementos"""
         # Atualiza elementos com delicadeza e identidade musical única
         self.musical_spiral.update(
             features['spectrum'], 
@@ -2479,56 +2731,54 @@ class DelicateVisualizer:
         
         for wave in self.gentle_waves:
             wave.update(features['spectrum'], features['flow_rhythm'], dt)
-            
-        # Respiração do fundo
-        self.background_breathing = features['breath_cycle']
         
     def draw(self):
-        """Desenha experiência delicada"""
-        try:
-            features = self.analyzer.analyze_gently()
-        except Exception as e:
-            print(f"⚠️ Erro na análise: {e}")
-            features = self.analyzer.get_serene_state()
+        """Desenha experiência delicada com as características analisadas em update()"""
+        self.frame_features = self.features
+        with interpolated(self.moving_engines(), self.timestep.alpha):
+            self.compositor.compose(self.screen)
+        
+        pygame.display.flip()
         
-        # Fundo que respira suavemente
+    def background_level(self):
+        """Respiração do fundo quantizada (chave da camada em cache)"""
         breath_intensity = 0.5 + 0.3 * math.sin(self.background_breathing)
-        base_color = DelicateColors.breathing_gradient(features['flow_rhythm'])
+        return int(round(breath_intensity * BREATH_LEVELS))
+    
+    def background_tint(self):
+        """Cor que respira, aplicada sobre o gradiente em cache com BLEND_MULT"""
+        return DelicateColors.breathing_gradient(self.frame_features['flow_rhythm'])
+        
+    def draw_background(self, surface):
+        """Gradiente suave de fundo (fatores por linha; a cor entra na modulação)"""
+        breath_intensity = self.background_level() / BREATH_LEVELS
+        progress = np.arange(SCREEN_HEIGHT) / SCREEN_HEIGHT
+        fade_factor = 0.7 + 0.3 * progress * breath_intensity
+        
+        # Uma coluna com o gradiente, esticada para a tela inteira
+        column = (255 * fade_factor[:, None] * np.array([0.3, 0.4, 0.5])).astype(np.uint8)
+        column_surface = pygame.surfarray.make_surface(column[None, :, :])
+        gradient = pygame.transform.scale(column_surface, surface.get_size())  # Já em pixels da superfície
+        if type(surface) is ScaledSurface:
+            surface.blit_native(gradient, (0, 0))
+        else:
+            surface.blit(gradient, (0, 0))
         
-        # Gradiente suave de fundo
-        for y in range(SCREEN_HEIGHT):
-            progress = y / SCREEN_HEIGHT
-            
-            # Mistura cores suavemente
-            r, g, b = base_color
-            fade_factor = 0.7 + 0.3 * progress * breath_intensity
-            
-            final_color = (
-                int(r * fade_factor * 0.3),
-                int(g * fade_factor * 0.4),
-                int(b * fade_factor * 0.5)
-            )
-            
-            pygame.draw.line(self.screen, final_color, (0, y), (SCREEN_WIDTH, y))
-            
-        # Ondas suaves
+    def draw_waves(self, surface):
+        """Ondas suaves"""
         for wave in self.gentle_waves:
-            wave.draw(self.screen, features['spectrum'])
+            wave.draw(surface, self.frame_features['spectrum'])
             
-        # Pétalas flutuantes
-        self.flowing_petals.draw(self.screen)
-        
-        # Identidade musical única - espiral winding + elementos matemáticos
+    def draw_spiral(self, surface):
+        """Identidade musical única - espiral winding + elementos matemáticos"""
         try:
-            self.musical_spiral.draw(self.screen, features['spectrum'])
+            self.musical_spiral.draw(surface, self.frame_features['spectrum'])
         except Exception as e:
             print(f"⚠️ Erro no desenho da espiral: {e}")
             # Desenha algo simples como fallback
-            pygame.draw.circle(self.screen, (100, 150, 200), 
+            draw.circle(surface, (100, 150, 200), 
                              (SCREEN_WIDTH//2, SCREEN_HEIGHT//2), 50, 2)
         
-        pygame.display.flip()
-        
     def handle_events(self):
         """Eventos suaves"""
         for event in pygame.event.get():
@@ -2537,25 +2787,146 @@ class DelicateVisualizer:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_SPACE and self.feature_bus:
+                    self.bus.clock.request(not self.bus.clock.requested)  # Quem toca o áudio pausa
                 elif event.key == pygame.K_SPACE:
                     if pygame.mixer.music.get_busy():
                         pygame.mixer.music.pause()
+                        if self.worker:
+                            self.worker.clock.pause()
                     else:
                         pygame.mixer.music.unpause()
+                        if self.worker:
+                            self.worker.clock.resume()
                         
+    def add_analysis_tasks(self, runtime, analyzed):
+        """Captura (posição de reprodução) e análise no próprio processo"""
+        captured = runtime.queue('capture', 1)
+        analysis = runtime.stage('analysis', VISUAL_LATENCY_BUDGET_MS)
+        
+        def capture():
+            captured.put_nowait(self.analyzer.get_current_time())
+        
+        async def analyze():
+            ticks = 0
+            while runtime.running:
+                media_time = await captured.get()
+                ticks += 1
+                # Só a análise visual segue o governador de qualidade (a cada analysis_interval
+                # capturas); os motores recebem o caminho tátil em toda captura
+                if ticks % self.analysis_interval:
+                    tactile = self.analyzer.analyze_tactile()
+                    runtime.publish(tactile_message({'tactile': tactile}, media_time))
+                    continue
+                analysis.start()
+                try:
+                    features = self.analyzer.analyze_gently()
+                except Exception as e:
+                    print(f"⚠️ Erro na análise: {e}")
+                    features = self.analyzer.get_serene_state()
+                analysis.stop()
+                analyzed.put_nowait(features)
+                runtime.publish(tactile_message(features, media_time))
+        
+        runtime.periodic('capture', SIMULATION_STEP, capture)
+        runtime.add_task('analysis', analyze)
+        
+    def add_bus_reader(self, runtime, analyzed, bus):
+        """Análise em outro processo: quadro mais recente do barramento, lido sem cópia nem pickle"""
+        received = [0]
+        
+        def receive():
+            sequence, features = bus.read(unpack_artistic, received[0])
+            if features is not None:
+                received[0] = sequence
+                analyzed.put_nowait(features)
+                runtime.publish(tactile_message(features, features['current_time']))
+        
+        runtime.periodic('bus', SIMULATION_STEP / 2, receive)
+        
+    def build_runtime(self):
+        """Tarefas: captura e análise (ou leitura do barramento), renderização, eventos e saídas"""
+        runtime = Runtime()
+        analyzed = runtime.queue('features', 1)
+        if self.bus:
+            self.add_bus_reader(runtime, analyzed, self.bus)
+        else:
+            self.add_analysis_tasks(runtime, analyzed)
+        
+        last_frame = [self.frame_time()]
+        
+        def render():
+            now = self.frame_time()
+            dt, last_frame[0] = max(0.0, now - last_frame[0]), now
+            if self.features is None and not len(analyzed):
+                return
+            started = time.perf_counter()
+            self.update(dt, analyzed.get_latest(self.features))
+            self.draw()
+            self.quality.record((time.perf_counter() - started) * 1000.0)
+        
+        def events():
+            self.handle_events()
+            if self.feature_bus and self.bus.closed:
+                self.running = False  # Sessão encerrada por quem publica
+            if not self.running:
+                runtime.stop()
+        
+        runtime.periodic('render', 1.0 / FPS, render)
+        runtime.periodic('events', 0.01, events)
+        for sink in self.sinks:
+            runtime.add_sink(sink)
+        
+        # Auto-start (só com áudio; offline o relógio vem das amostras)
+        if self.playback:
+            runtime.call_later(1.5, self.start_playback)
+        return runtime
+    
+    def frame_time(self):
+        """Relógio dos quadros: o da mídia numa visão inscrita (a pausa congela tudo), senão o de parede"""
+        if self.feature_bus:
+            media_time = self.bus.clock.now()
+            animation_clock.set(media_time)
+            return media_time
+        return time.perf_counter()
+        
+    def start_playback(self):
+        """Inicia o áudio e, com análise em outro processo, publica o relógio da mídia"""
+        self.analyzer.start_playbook_safe()
+        if self.worker and self.analyzer.audio_start_time is not None:
+            self.worker.clock.start(self.analyzer.get_current_time())
+        
     def run(self):
-        """Loop principal delicado"""
+        """Loop principal delicado (tarefas do runtime assíncrono)"""
         print("🌸 Iniciando experiência delicada...")
         
-        while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
-            
-            self.handle_events()
-            self.update(dt)
-            self.draw()
-            
-        pygame.mixer.music.stop()
+        if self.feature_bus:
+            print(f"📡 Inscrita na sessão {self.feature_bus}...")
+            self.bus = subscribe(self.feature_bus, 'artistic')
+        elif self.analysis_mode == 'process':
+            print("🧵 Análise em processo separado...")
+            self.worker = AnalysisWorker(self.audio_file, {'artistic': GentleAudioAnalyzer}).start()
+            self.bus = self.worker.bus
+        # Do barramento em diante, qualquer saída (inclusive Ctrl-C) fecha e remove a memória compartilhada
+        try:
+            self.runtime = self.build_runtime()
+            self.runtime.run()
+        finally:
+            if self.worker:
+                self.worker.stop()
+            elif self.bus:
+                self.bus.close()
+        
+        for line in self.runtime.summary():
+            print(f"⏱️ Runtime: {line}")
+        if self.playback:
+            pygame.mixer.music.stop()
         pygame.quit()
+        quality = self.quality.stats()
+        print(f"📊 Qualidade: nível {quality['tier']}/{quality['tiers'] - 1} "
+              f"({quality['downgrades']} reduções, {quality['upgrades']} aumentos)")
+        sprites = sprite_cache.stats()
+        print(f"✨ Sprites: {sprites['sprites']} em cache, acertos {sprites['hit_ratio']:.1%}")
         print("🙏 Experiência delicada concluída")
 
 def main():